@@ -0,0 +1,67 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# backends MODULE
+# --------------------------------------------------
+"""
+Execution backend benchmark.
+
+Runs examples/simple_arithmetic.bc scaled up to a tight
+loop on the reference engine and on the compiled backend.
+
+    python -m benchmarks.backends [iterations]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import sys
+
+from benchmarks.common import (
+    best_of,
+    example_path,
+    report,
+    scaled_loop,
+)
+from vm.core.vm import VirtualMachine
+
+
+def run(iterations: int = 100_000):
+    source, executed = scaled_loop(
+        example_path("simple_arithmetic.bc"), iterations
+    )
+
+    for backend in ("reference", "compiled"):
+        def go():
+            VirtualMachine().run_string(source, backend=backend)
+        report(backend, executed, best_of(go))
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:2]))
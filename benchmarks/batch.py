@@ -0,0 +1,96 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# batch MODULE
+# --------------------------------------------------
+"""
+Batch throughput benchmark.
+
+Writes a few thousand small programs (copies of the
+examples) to a temporary directory and runs them through
+BatchRunner with a growing number of worker processes,
+reporting programs per second.
+
+    python -m benchmarks.batch [programs] [max_workers]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from benchmarks.common import EXAMPLES_DIR, report
+from vm.core.batch import BatchRunner
+
+
+def preload(vm):
+    """
+    Host globals of the run_example.py setup.
+    """
+    vm.globals.set("add", lambda a, b: a + b)
+
+
+def run(programs: int = 4_000, max_workers: int = None):
+    max_workers = max_workers or os.cpu_count() or 1
+    examples = sorted(
+        name for name in os.listdir(EXAMPLES_DIR) if name.endswith(".bc")
+    )
+    workdir = tempfile.mkdtemp(prefix="pvm-batch-")
+
+    try:
+        paths = []
+
+        for index in range(programs):
+            path = os.path.join(workdir, f"p{index}.bc")
+            shutil.copy(os.path.join(EXAMPLES_DIR,
+                                     examples[index % len(examples)]),
+                        path)
+            paths.append(path)
+        
+        workers = 1
+
+        while workers <= max_workers:
+            runner = BatchRunner(workers=workers, setup=preload)
+            start = time.perf_counter()
+            results = runner.run(paths)
+            elapsed = time.perf_counter() - start
+            assert all(result.ok for result in results)
+            report(f"{workers} worker(s)", programs, elapsed,
+                   "programs/s")
+            workers *= 2
+    finally:
+        shutil.rmtree(workdir)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]))
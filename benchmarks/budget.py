@@ -0,0 +1,126 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+# --------------------------------------------------
+# budget MODULE
+# --------------------------------------------------
+"""
+Memory accounting overhead benchmark.
+
+Times two workloads with no memory budget and with a 1 MB
+budget: examples/function_call.bc, a host call plus a
+store, scaled up to a tight loop; and a function looping
+over calls of another function with a string argument,
+which runs unmetered apart from its name stores. Runs
+alternate, each timed with timeit;
+the report gives median times and the median of the paired
+ratios, which holds up on noisy machines. The target is an
+overhead below 20%.
+
+    python -m benchmarks.budget [iterations] [repeats]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import statistics
+import sys
+import timeit
+
+from benchmarks.common import example_path, report, scaled_loop
+from vm.core.vm import VirtualMachine
+
+
+# Holds the live values of both workloads
+BUDGET = 1 << 20
+
+CALLS_IN_FUNCTION = """
+.function tag s
+LOAD_VAR s
+RETURN_VAL
+.end
+.function drive n
+LOAD_VAR n
+JUMP_IF_FALSE 11
+LOAD_VAR tag
+LOAD_CONST "payload"
+CALL 1
+POP_TOP
+LOAD_VAR n
+LOAD_CONST 1
+SUB
+STORE_VAR n
+JUMP 0
+LOAD_CONST 0
+RETURN_VAL
+.end
+MAKE_FUNCTION tag
+STORE_VAR tag
+MAKE_FUNCTION drive
+LOAD_CONST {iterations}
+CALL 1
+STORE_VAR done
+HALT
+"""
+
+
+def timed(source: str, budget) -> float:
+    vm = VirtualMachine(memory_budget=budget)
+    vm.globals.set("add", lambda a, b: a + b)
+    return timeit.timeit(lambda: vm.run_string(source), number=1)
+
+
+def compare(label: str, source: str, count: int, unit: str,
+            repeats: int):
+    plain, metered = [], []
+
+    for _ in range(repeats):
+        plain.append(timed(source, None))
+        metered.append(timed(source, BUDGET))
+    
+    report(f"{label}, no budget", count, statistics.median(plain),
+           unit)
+    report(f"{label}, budget", count, statistics.median(metered),
+           unit)
+    overhead = statistics.median(
+        m / p for p, m in zip(plain, metered)
+    ) - 1
+    print(f"{label} accounting overhead: {overhead:.1%}")
+
+
+def run(iterations: int = 100_000, repeats: int = 11):
+    source, executed = scaled_loop(
+        example_path("function_call.bc"), iterations
+    )
+    compare("host calls", source, executed, "instr/s", repeats)
+    compare("calls in a function",
+            CALLS_IN_FUNCTION.format(iterations=iterations),
+            iterations, "calls/s", repeats)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]))
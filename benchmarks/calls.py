@@ -0,0 +1,115 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# calls MODULE
+# --------------------------------------------------
+"""
+Function call benchmark.
+
+Runs recursive examples/fib.bc and a loop calling a one-line
+function, comparing bytecode functions with and without the
+frame pool, and against a host lambda called with CALL.
+
+    python -m benchmarks.calls [fib_n] [iterations]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import sys
+
+from benchmarks.common import best_of, example_path, report
+from vm.core.vm import VirtualMachine
+
+
+CALL_LOOP = """
+.function inc x
+LOAD_VAR x
+LOAD_CONST 1
+ADD
+RETURN_VAL
+.end
+{setup}
+STORE_VAR inc
+LOAD_CONST {iterations}
+STORE_VAR n
+LOAD_CONST 0
+STORE_VAR total
+LOAD_VAR n
+JUMP_IF_FALSE 17
+LOAD_VAR inc
+LOAD_VAR total
+CALL 1
+STORE_VAR total
+LOAD_VAR n
+LOAD_CONST 1
+SUB
+STORE_VAR n
+JUMP 6
+HALT
+"""
+
+
+def fib_calls(n: int) -> int:
+    """
+    Number of calls made by the recursive fib(n).
+    """
+    a, b = 1, 1
+
+    for _ in range(n):
+        a, b = b, a + b
+    return 2 * a - 1
+
+
+def run(fib_n: int = 20, iterations: int = 100_000):
+    with open(example_path("fib.bc"), encoding="utf-8") as src:
+        fib = src.read().replace("LOAD_CONST 15",
+                                 f"LOAD_CONST {fib_n}")
+    
+    for label, pooled in (("fib, pooled frames", True),
+                          ("fib, fresh frames", False)):
+        vm = VirtualMachine()
+
+        if not pooled:
+            vm.runtime.frames.limit = 0
+        report(label, fib_calls(fib_n),
+               best_of(lambda: vm.run_string(fib)), "calls/s")
+    
+    for label, setup in (("loop, bytecode function",
+                          "MAKE_FUNCTION inc"),
+                         ("loop, host lambda", "LOAD_VAR host")):
+        vm = VirtualMachine()
+        vm.globals.set("host", lambda x: x + 1)
+        source = CALL_LOOP.format(setup=setup, iterations=iterations)
+        report(label, iterations,
+               best_of(lambda: vm.run_string(source)), "calls/s")
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]))
@@ -0,0 +1,111 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# common MODULE
+# --------------------------------------------------
+"""
+Shared helpers for the benchmark scripts.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import os
+import time
+from typing import Callable, List, Tuple
+
+from vm.bytecode import BytecodeLoader
+
+
+EXAMPLES_DIR = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+    "examples",
+)
+
+
+def example_path(name: str) -> str:
+    """
+    Absolute path of a program in ``examples/``.
+    """
+    return os.path.join(EXAMPLES_DIR, name)
+
+
+def scaled_loop(path: str, iterations: int) -> Tuple[str, int]:
+    """
+    Wrap the body of a bytecode program in a counting loop.
+
+    The trailing HALT of the program is dropped and the
+    remaining instructions are repeated ``iterations`` times
+    by a countdown on ``__n``. Returns the loop source and
+    the number of instructions it executes.
+    """
+    body = [
+        line for line in BytecodeLoader().load_from_file(path)
+        if line != "HALT"
+    ]
+    end = 2 + 2 + len(body) + 5
+    lines: List[str] = [
+        f"LOAD_CONST {iterations}",
+        "STORE_VAR __n",
+        "LOAD_VAR __n",
+        f"JUMP_IF_FALSE {end}",
+        *body,
+        "LOAD_VAR __n",
+        "LOAD_CONST 1",
+        "SUB",
+        "STORE_VAR __n",
+        "JUMP 2",
+        "HALT",
+    ]
+    per_iteration = 2 + len(body) + 5
+    executed = 2 + iterations * per_iteration + 2 + 1
+    return "\n".join(lines), executed
+
+
+def best_of(fn: Callable[[], None], repeat: int = 3) -> float:
+    """
+    Best wall-clock time of ``repeat`` calls to ``fn``.
+    """
+    best = float("inf")
+
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    
+    return best
+
+
+def report(label: str, count: int, seconds: float,
+           unit: str = "instr/s"):
+    """
+    Print a single throughput line.
+    """
+    print(f"{label:<28} {count / seconds:>14,.0f} {unit}"
+          f"  ({seconds:.3f}s)")
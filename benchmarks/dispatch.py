@@ -0,0 +1,106 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# dispatch MODULE
+# --------------------------------------------------
+"""
+Opcode dispatch benchmark.
+
+Compares the precomputed dispatch table against the old
+name-based lookup (f-string + hasattr + getattr per step)
+on examples/simple_arithmetic.bc scaled up to a tight loop.
+
+    python -m benchmarks.dispatch [iterations]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import sys
+
+from benchmarks.common import (
+    best_of,
+    example_path,
+    report,
+    scaled_loop,
+)
+from vm.core.vm import VirtualMachine
+from vm.core.engine import ExecutionEngine
+from vm.errors import InvalidOpcodeError, RuntimeExecutionError
+from vm.utils import trace_instruction
+
+
+class NameLookupEngine(ExecutionEngine):
+    """
+    Engine reproducing the previous per-step handler lookup.
+    """
+
+    def execute(self, frame, callstack):
+        while True:
+            instr = frame.next_instruction()
+
+            if instr is None:
+                return
+            
+            opcode, operands = instr
+            trace_instruction(frame.ip - 1, opcode, operands,
+                              frame.stack)
+            
+            try:
+                handler_name = f"op_{opcode.lower()}"
+
+                if not hasattr(self, handler_name):
+                    raise InvalidOpcodeError(opcode)
+                
+                getattr(self, handler_name)(operands, frame,
+                                            callstack)
+            except Exception as exc:
+                raise RuntimeExecutionError(str(exc)) from exc
+
+
+def run(iterations: int = 100_000):
+    source, executed = scaled_loop(
+        example_path("simple_arithmetic.bc"), iterations
+    )
+
+    def bench(engine_cls):
+        def go():
+            vm = VirtualMachine()
+            vm.runtime.engine = engine_cls()
+            vm.run_string(source)
+        return best_of(go)
+    
+    report("name lookup (before)", executed,
+           bench(NameLookupEngine))
+    report("dispatch table (after)", executed,
+           bench(ExecutionEngine))
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,122 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# hooks MODULE
+# --------------------------------------------------
+"""
+Instrumentation overhead benchmark.
+
+Compares, on examples/simple_arithmetic.bc scaled up to a
+tight loop:
+
+- the previous loop, calling trace_instruction() on every
+  step even with TRACE_EXECUTION off
+- the current loop with no hooks registered
+- the instrumented loop with a no-op instruction hook
+- the instrumented loop feeding an in-memory TraceBuffer
+
+    python -m benchmarks.hooks [iterations]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import sys
+
+from benchmarks.common import (
+    best_of,
+    example_path,
+    report,
+    scaled_loop,
+)
+from vm.core.engine import ExecutionEngine
+from vm.core.vm import VirtualMachine
+from vm.errors import RuntimeExecutionError
+from vm.utils import TraceBuffer, trace_instruction
+
+
+class TraceCallEngine(ExecutionEngine):
+    """
+    Engine reproducing the per-step trace_instruction() call.
+    """
+
+    def execute(self, frame, callstack):
+        if frame.code.verified:
+            handlers = self._verified_handlers
+        else:
+            handlers = self._handlers
+
+        while True:
+            instr = frame.next_instruction()
+
+            if instr is None:
+                return
+            
+            opcode, operands = instr
+            trace_instruction(frame.ip - 1, opcode, operands,
+                              frame.stack)
+            
+            try:
+                handlers[opcode](operands, frame, callstack)
+            except Exception as exc:
+                raise RuntimeExecutionError(str(exc)) from exc
+
+
+def run(iterations: int = 100_000):
+    source, executed = scaled_loop(
+        example_path("simple_arithmetic.bc"), iterations
+    )
+
+    def bench(setup):
+        def go():
+            vm = VirtualMachine()
+            setup(vm)
+            vm.run_string(source)
+        return best_of(go, repeat=5)
+    
+    def legacy(vm):
+        vm.runtime.engine = TraceCallEngine()
+    
+    def no_hooks(vm):
+        pass
+    
+    def noop_hook(vm):
+        vm.hooks.register("instruction", lambda *args: None)
+    
+    def trace_buffer(vm):
+        vm.hooks.attach(TraceBuffer())
+    
+    report("trace call (before)", executed, bench(legacy))
+    report("no hooks", executed, bench(no_hooks))
+    report("no-op hook", executed, bench(noop_hook))
+    report("TraceBuffer (in memory)", executed, bench(trace_buffer))
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:2]))
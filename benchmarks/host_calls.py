@@ -0,0 +1,89 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# host_calls MODULE
+# --------------------------------------------------
+"""
+Host function call benchmark.
+
+Runs examples/function_call.bc, a CALL_FUNC of the host
+``add`` from run_example.py, scaled up to a tight loop.
+The "before" run swaps in the previous CALL_FUNC handler,
+which popped the arguments one by one into a list and
+reversed it.
+
+    python -m benchmarks.host_calls [iterations]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import sys
+
+from benchmarks.common import best_of, example_path, report, scaled_loop
+from vm.core.vm import VirtualMachine
+from vm.errors import RuntimeExecutionError
+
+
+def popping_call_func(operands, frame, _):
+    """
+    CALL_FUNC as it was: N pops, a reverse and an unpack.
+    """
+    arg_count = int(operands[0])
+    args = []
+    for _ in range(arg_count):
+        args.append(frame.stack.pop())
+    args.reverse()
+    func = frame.stack.pop()
+
+    if not callable(func):
+        raise RuntimeExecutionError("Object is not callable")
+    
+    frame.stack.push(func(*args))
+
+
+def run(iterations: int = 1_000_000):
+    source, _ = scaled_loop(example_path("function_call.bc"),
+                            iterations)
+    
+    for label, legacy in (("pop and reverse (before)", True),
+                          ("stack slice (after)", False)):
+        vm = VirtualMachine()
+        vm.globals.set("add", lambda a, b: a + b)
+
+        if legacy:
+            vm.runtime.engine._verified_handlers["CALL_FUNC"] = \
+                popping_call_func
+        report(label, iterations,
+               best_of(lambda: vm.run_string(source, "reference")),
+               "calls/s")
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:2]))
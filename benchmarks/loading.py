@@ -0,0 +1,122 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# loading MODULE
+# --------------------------------------------------
+"""
+Program loading benchmark.
+
+Loads a generated program (1M instructions by default)
+through the text path (loader + parser + decoder) and the
+binary .pvmc path (mmap + memoryview), reporting wall time
+and peak traced memory for each.
+
+    python -m benchmarks.loading [instructions]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from vm.bytecode import BytecodeDecoder, BytecodeLoader, BytecodeParser
+from tools.assembler import Assembler
+
+
+def generate(count: int) -> str:
+    """
+    Build a straight-line program of roughly ``count`` lines.
+    """
+    block = [
+        "LOAD_VAR x",
+        "LOAD_CONST 3",
+        "ADD",
+        "LOAD_CONST -1.5",
+        "MUL",
+        "STORE_VAR x",
+        "JUMP_IF_FALSE 0",
+        'LOAD_CONST "label"',
+    ]
+    lines = ["LOAD_CONST 0", "STORE_VAR x"]
+
+    while len(lines) < count:
+        lines.extend(block)
+    
+    lines[count - 1:] = ["HALT"]
+    return "\n".join(lines) + "\n"
+
+
+def load_text(path: str):
+    raw = BytecodeLoader().load_from_file(path)
+    return BytecodeDecoder().decode(BytecodeParser().parse(raw))
+
+
+def load_binary(path: str):
+    return BytecodeLoader().load_binary(path)
+
+
+def measure(loader, path: str):
+    start = time.perf_counter()
+    loader(path)
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    loader(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def run(count: int = 1_000_000):
+    source = generate(count)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        text_path = os.path.join(tmp, "program.bc")
+        binary_path = os.path.join(tmp, "program.pvmc")
+
+        with open(text_path, "w", encoding="utf-8") as out:
+            out.write(source)
+        with open(binary_path, "wb") as out:
+            out.write(Assembler().assemble_binary(source))
+        
+        for label, loader, path in (
+                ("text (.bc)", load_text, text_path),
+                ("binary (.pvmc)", load_binary, binary_path)):
+            elapsed, peak = measure(loader, path)
+            size = os.path.getsize(path)
+            print(f"{label:<16} {count:,} instr  {elapsed:.3f}s  "
+                  f"peak {peak / 1e6:.1f} MB  file {size / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:2]))
@@ -0,0 +1,81 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+# --------------------------------------------------
+# locals MODULE
+# --------------------------------------------------
+"""
+Variable access benchmark.
+
+Runs examples/loop.bc with a large trip count, once as
+module code, whose variables stay name-based LOAD_VAR /
+STORE_VAR, and once as the body of a function, whose
+variables the resolver rewrites to slot-indexed LOAD_FAST /
+STORE_FAST.
+
+    python -m benchmarks.locals [iterations]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import sys
+
+from benchmarks.common import best_of, example_path, report
+from vm.core.vm import VirtualMachine
+from vm.memory import Namespace
+from vm.stack import Frame
+
+
+def run(iterations: int = 100_000):
+    vm = VirtualMachine()
+    raw = vm.loader.load_from_file(example_path("loop.bc"))
+    raw[0] = f"LOAD_CONST {iterations}"
+    # Setup, eleven instructions per trip, final test and HALT
+    executed = 4 + 11 * iterations + 3
+    total = iterations * (iterations + 1) // 2
+
+    # The same loop as a function: HALT becomes the return
+    as_function = [".function loop", *raw[:-1], "LOAD_VAR total",
+                   "RETURN_VAL", ".end", "MAKE_FUNCTION loop",
+                   "CALL 0", "STORE_VAR total", "HALT"]
+
+    for label, source in (("names (module)", raw),
+                          ("slots (function)", as_function)):
+        def go():
+            code = vm._decode(list(source))
+            vm.resolver.resolve(code)
+            vm.verifier.verify(code)
+            
+            globals_ns = Namespace()
+            vm.runtime.run(Frame(code, globals_ns, globals_ns),
+                           "reference")
+            assert globals_ns.get("total") == total
+        report(label, executed, best_of(go))
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:2]))
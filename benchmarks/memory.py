@@ -0,0 +1,156 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+# --------------------------------------------------
+# memory MODULE
+# --------------------------------------------------
+"""
+Frame memory benchmark.
+
+Measures with tracemalloc:
+
+- the footprint of a live frame (frame, operand stack and
+  locals namespace) with the previous ``__dict__`` layout
+  and with the current ``__slots__`` layout
+- a call-heavy run that activates a small code object many
+  times, allocating a fresh frame per activation or taking
+  it from the runtime's frame pool
+
+    python -m benchmarks.memory [frames]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import sys
+import time
+import tracemalloc
+
+from vm.core.vm import VirtualMachine
+from vm.memory import Namespace
+from vm.stack import Frame, UncheckedStack
+
+
+SOURCE = """
+    LOAD_CONST 1
+    STORE_VAR a
+    LOAD_VAR a
+    LOAD_CONST 2
+    ADD
+    STORE_VAR b
+    HALT
+"""
+
+
+class DictFrame(Frame):
+    """
+    Frame with a per-instance ``__dict__``, as before.
+    """
+
+
+class DictStack(UncheckedStack):
+    """
+    Operand stack with a per-instance ``__dict__``.
+    """
+
+
+class DictNamespace(Namespace):
+    """
+    Namespace with a per-instance ``__dict__``.
+    """
+
+
+def dict_frame(code, globals_ns):
+    frame = DictFrame(code, globals_ns)
+    frame.stack = DictStack()
+    frame.locals = DictNamespace(parent=globals_ns)
+    return frame
+
+
+def footprint(label, make, count):
+    """
+    Report bytes and allocated blocks per live frame.
+    """
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    frames = [make() for _ in range(count)]
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    size = sum(stat.size_diff for stat in stats) / count
+    blocks = sum(stat.count_diff for stat in stats) / count
+    print(f"{label:<28} {size:>8.0f} B/frame  "
+          f"{blocks:>5.1f} allocs/frame")
+    del frames
+
+
+def churn(label, activate, count):
+    """
+    Report time and peak traced memory of ``count``
+    activations.
+    """
+    tracemalloc.start()
+    start = time.perf_counter()
+
+    for _ in range(count):
+        activate()
+    
+    seconds = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<28} {count / seconds:>10,.0f} calls/s  "
+          f"peak {peak / 1024:,.1f} KiB")
+
+
+def run(count: int = 20_000):
+    vm = VirtualMachine()
+    code = vm._decode(vm.loader.load_from_string(SOURCE))
+    vm.resolver.resolve(code)
+    vm.verifier.verify(code)
+    runtime = vm.runtime
+    globals_ns = Namespace()
+
+    footprint("__dict__ layout (before)",
+              lambda: dict_frame(code, globals_ns), count)
+    footprint("__slots__ layout (after)",
+              lambda: Frame(code, globals_ns), count)
+
+    def fresh():
+        runtime.run(Frame(code, globals_ns), "reference")
+    
+    def pooled():
+        frame = runtime.new_frame(code, globals_ns)
+        runtime.run(frame, "reference")
+        runtime.release_frame(frame)
+    
+    churn("fresh frame per call", fresh, count)
+    churn("pooled frames", pooled, count)
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:2]))
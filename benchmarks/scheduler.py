@@ -0,0 +1,98 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# scheduler MODULE
+# --------------------------------------------------
+"""
+Scheduler latency benchmark.
+
+Spawns a few long loops followed by many short programs and
+reports completion latency percentiles of the short ones,
+run to completion in spawn order (one unbounded quantum)
+and interleaved by the round-robin and priority policies.
+
+    python -m benchmarks.scheduler [long_iterations] [short_programs]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import statistics
+import sys
+
+from benchmarks.common import example_path
+from vm.core.scheduler import PRIORITY, ROUND_ROBIN, Scheduler
+from vm.core.vm import VirtualMachine
+from vm.memory import Namespace
+
+
+LONG_PROGRAMS = 4
+
+
+def percentile(values, fraction: float) -> float:
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def run(long_iterations: int = 20_000, short_programs: int = 200):
+    with open(example_path("loop.bc"), encoding="utf-8") as src:
+        long_source = src.read().replace(
+            "LOAD_CONST 10", f"LOAD_CONST {long_iterations}", 1
+        )
+    with open(example_path("simple_arithmetic.bc"),
+              encoding="utf-8") as src:
+        short_source = src.read()
+    
+    for label, policy, quantum in (
+            ("run to completion", ROUND_ROBIN, sys.maxsize),
+            ("round robin", ROUND_ROBIN, 1000),
+            ("priority", PRIORITY, 1000)):
+        scheduler = Scheduler(VirtualMachine(), quantum, policy)
+
+        for _ in range(LONG_PROGRAMS):
+            scheduler.spawn(long_source, globals_ns=Namespace())
+        shorts = [
+            scheduler.spawn(short_source, priority=1,
+                            globals_ns=Namespace())
+            for _ in range(short_programs)
+        ]
+        scheduler.run()
+
+        latencies = [
+            (task.finished_at - task.started_at) * 1000
+            for task in shorts
+        ]
+        print(f"{label:<20} short program latency ms: "
+              f"p50 {statistics.median(latencies):8.2f}  "
+              f"p95 {percentile(latencies, 0.95):8.2f}  "
+              f"p99 {percentile(latencies, 0.99):8.2f}")
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]))
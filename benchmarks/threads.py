@@ -0,0 +1,76 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# threads MODULE
+# --------------------------------------------------
+"""
+Shared Program thread scaling benchmark.
+
+Loads examples/loop.bc once as a Program and runs it from a
+ThreadPoolExecutor with a growing number of threads,
+reporting program runs per second. Throughput only scales
+with threads on free-threaded CPython builds; with the GIL
+it shows the cost of sharing one Program.
+
+    python -m benchmarks.threads [runs] [max_threads]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.common import example_path, report
+from vm.core.vm import VirtualMachine
+
+
+def run(runs: int = 4_000, max_threads: int = 8):
+    vm = VirtualMachine()
+    program = vm.load_file(example_path("loop.bc"))
+    base = vm.freeze_globals()
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    print(f"GIL {'enabled' if gil else 'disabled'}")
+    threads = 1
+
+    while threads <= max_threads:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            start = time.perf_counter()
+            results = list(pool.map(lambda _: program.run(base),
+                                    range(runs)))
+            elapsed = time.perf_counter() - start
+        
+        assert all(result.get("total") == 55 for result in results)
+        report(f"{threads} thread(s)", runs, elapsed, "runs/s")
+        threads *= 2
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:3]))
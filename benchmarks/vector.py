@@ -0,0 +1,153 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# vector MODULE
+# --------------------------------------------------
+"""
+Vectorized column execution benchmark.
+
+Runs an arithmetic program over columns of random inputs,
+once row by row on the scalar engine and once over whole
+columns, reporting rows per second. The branching program
+divides only where ``x`` is non-zero, so its lanes split at
+the conditional jump. The divergent loop counts ``n`` down
+with a different trip count per row and a branch inside the
+loop, so its lanes split on every iteration and have to
+reconverge. Needs NumPy.
+
+    python -m benchmarks.vector [rows]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import sys
+import time
+
+from benchmarks.common import report
+from vm.core.vector import require_numpy
+from vm.core.vm import VirtualMachine
+
+
+# result = (x + y) * 4 / y
+ARITHMETIC = """
+LOAD_VAR x
+LOAD_VAR y
+ADD
+LOAD_CONST 4
+MUL
+LOAD_VAR y
+DIV
+STORE_VAR result
+HALT
+"""
+
+# result = y / x if x else 0
+BRANCHING = """
+LOAD_CONST 0
+STORE_VAR result
+LOAD_VAR x
+JUMP_IF_FALSE 8
+LOAD_VAR y
+LOAD_VAR x
+DIV
+STORE_VAR result
+HALT
+"""
+
+
+# Trip counts of the divergent loop go up to this
+MAX_TRIPS = 128
+
+# total = sum of n, n - 1, ..., 1, adding y instead where
+# the counter equals m
+DIVERGENT_LOOP = """
+LOAD_CONST 0
+STORE_VAR total
+LOAD_VAR n
+JUMP_IF_FALSE 21
+LOAD_VAR n
+LOAD_VAR m
+SUB
+JUMP_IF_FALSE 12
+LOAD_VAR total
+LOAD_VAR n
+ADD
+JUMP 15
+LOAD_VAR total
+LOAD_VAR y
+ADD
+STORE_VAR total
+LOAD_VAR n
+LOAD_CONST 1
+SUB
+STORE_VAR n
+JUMP 2
+HALT
+"""
+
+
+def run(rows: int = 50_000):
+    np = require_numpy()
+    rng = np.random.default_rng(0)
+    columns = {
+        "x": rng.integers(0, 4, rows).astype(float),
+        "y": rng.random(rows) + 1.0,
+    }
+    # Long loops: a tenth of the rows keeps the scalar run short
+    loop_rows = rows // 10
+    loop_columns = {
+        "y": columns["y"][:loop_rows],
+        "n": rng.integers(0, MAX_TRIPS, loop_rows).astype(float),
+        "m": rng.integers(0, MAX_TRIPS, loop_rows).astype(float),
+    }
+    vm = VirtualMachine()
+
+    for label, source, inputs, count in (
+            ("arithmetic", ARITHMETIC, columns, rows),
+            ("branching", BRANCHING, columns, rows),
+            ("divergent loop", DIVERGENT_LOOP, loop_columns, loop_rows)):
+        results = []
+
+        for vectorize in (False, True):
+            start = time.perf_counter()
+            results.append(vm.run_columns(source, inputs,
+                                          vectorize=vectorize))
+            elapsed = time.perf_counter() - start
+            mode = "vector" if vectorize else "scalar"
+            report(f"{label} {mode}", count, elapsed, "rows/s")
+        
+        scalar, vector = results
+
+        for name, column in scalar.items():
+            assert np.allclose(column, vector[name])
+
+
+if __name__ == "__main__":
+    run(*(int(arg) for arg in sys.argv[1:2]))
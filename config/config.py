@@ -58,6 +58,19 @@ LOG_FILE = os.path.join(PROJECT_DIR, "logs", "vm.log")
 MAX_STACK_SIZE = 1024
 # Maximum depth of the call stack
 MAX_CALL_DEPTH = 256
+# Approximate memory budget per run in bytes (None: unlimited)
+MEMORY_BUDGET = None
+# Result cache of pure host functions: entries, estimated
+# bytes and time-to-live in seconds (None: no expiry)
+MEMO_MAX_ENTRIES = 4096
+MEMO_MAX_BYTES = 8 * 1024 * 1024
+MEMO_TTL = None
+# Programs sent to a batch worker at a time
+BATCH_CHUNK_SIZE = 64
+# Seconds a batch program may run (None: no limit)
+BATCH_TIMEOUT = None
+# Instructions a scheduled task runs before it is preempted
+SCHEDULER_QUANTUM = 1000
 
 
 # --------------------------------------------------
@@ -67,3 +80,7 @@ MAX_CALL_DEPTH = 256
 HALT_ON_ERROR = True
 # Allow undefined variable access (for experimentation)
 ALLOW_UNDEFINED_VARS = False
+# Default execution backend: "reference" or "compiled"
+EXECUTION_BACKEND = "reference"
+# Run the bytecode optimizer on loaded programs
+OPTIMIZE_BYTECODE = False
@@ -54,6 +54,9 @@ setup(
             "black",
             "flake8",
         ],
+        "vector": [
+            "numpy",
+        ],
     },
     classifiers=[
         "Programming Language :: Python :: 3",
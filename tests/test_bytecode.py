@@ -36,8 +36,18 @@
 # --------------------------------------------------
 import pytest
 
-from vm.bytecode import BytecodeLoader, BytecodeParser
-from vm.errors import BytecodeError
+from vm.bytecode import (
+    BytecodeLoader,
+    BytecodeParser,
+    BytecodeDecoder,
+    BytecodeResolver,
+    BytecodeVerifier,
+)
+from vm.bytecode.binary import load_code
+from vm.core.vm import VirtualMachine
+from vm.memory import ConstantsPool
+from vm.errors import BytecodeError, VerificationError
+from tools.assembler import Assembler
 
 
 def test_bytecode_loader_from_string():
@@ -76,3 +86,196 @@ def test_bytecode_parser_invalid_opcode():
     
     with pytest.raises(ValueError):
         parser.parse(raw)
+
+
+def test_bytecode_parser_keeps_quoted_operand():
+    parser = BytecodeParser()
+    parsed = parser.parse(['LOAD_CONST "hello world"'])
+
+    assert parsed[0] == ("LOAD_CONST", ['"hello world"'])
+
+
+def test_bytecode_decoder_literals():
+    raw = [
+        "LOAD_CONST -5",
+        "LOAD_CONST 2.5",
+        'LOAD_CONST "a b"',
+        "LOAD_CONST 7",
+    ]
+    code = BytecodeDecoder().decode(BytecodeParser().parse(raw))
+    values = [code.constants.get(operands[0])
+              for _, operands in code.instructions]
+
+    assert values == [-5, 2.5, "a b", 7]
+    assert type(values[0]) is int
+
+
+def test_constants_pool_deduplicates_by_type_and_value():
+    raw = [
+        "LOAD_CONST 1", "LOAD_CONST 1", "LOAD_CONST 1.0",
+        "LOAD_CONST 0.0", "LOAD_CONST -0.0",
+        'LOAD_CONST "a"', 'LOAD_CONST "a"', "LOAD_CONST 1",
+    ]
+    code = BytecodeDecoder().decode(BytecodeParser().parse(raw))
+    indexes = [operands[0] for _, operands in code.instructions]
+
+    assert indexes == [0, 0, 1, 2, 3, 4, 4, 0]
+    assert len(code.constants) == 5
+    assert code.constants.add(True) == 5
+
+    pool = ConstantsPool([7, 7])
+
+    assert len(pool) == 2
+    assert pool.add(7) == 0
+
+
+def test_binary_roundtrip(tmp_path):
+    source = """
+        LOAD_CONST -7
+        LOAD_CONST "two words"
+        STORE_VAR s
+        LOAD_CONST 1.5
+        JUMP_IF_FALSE 6
+        STORE_VAR x
+        HALT
+    """
+    path = tmp_path / "prog.pvmc"
+    path.write_bytes(Assembler().assemble_binary(source))
+
+    loader = BytecodeLoader()
+    code = loader.load_binary(str(path))
+
+    assert loader.is_binary(str(path))
+    assert code.instructions == [
+        ("LOAD_CONST", [0]),
+        ("LOAD_CONST", [1]),
+        ("STORE_VAR", ["s"]),
+        ("LOAD_CONST", [2]),
+        ("JUMP_IF_FALSE", [6]),
+        ("STORE_VAR", ["x"]),
+        ("HALT", []),
+    ]
+    assert [code.constants.get(i) for i in range(3)] == [
+        -7, "two words", 1.5
+    ]
+
+
+def test_binary_rejects_truncated_and_corrupt_images():
+    image = Assembler().assemble_binary("""
+        LOAD_CONST 123456789012345678901234567890
+        LOAD_CONST "two words"
+        LOAD_CONST 1.5
+        STORE_VAR s
+        HALT
+    """)
+
+    for end in range(len(image)):
+        with pytest.raises(BytecodeError):
+            load_code(image[:end])
+    
+    # Invalid UTF-8 in the "two words" constant
+    start = image.index(b"two words")
+    corrupt = image[:start] + b"\xff" + image[start + 1:]
+
+    with pytest.raises(BytecodeError, match=f"offset {start - 4}"):
+        load_code(corrupt)
+    
+    # STORE_VAR naming a symbol past the end of the table
+    record = len(image) - 24
+    corrupt = image[:record + 4] + b"\x05" + image[record + 5:]
+
+    with pytest.raises(BytecodeError, match="Symbol 5 out of range"):
+        load_code(corrupt)
+
+
+def test_verifier_resolves_jump_operands():
+    raw = ["LOAD_CONST 0", "JUMP_IF_FALSE 3", "HALT", "HALT"]
+    code = BytecodeDecoder().decode(BytecodeParser().parse(raw))
+    BytecodeVerifier().verify(code)
+
+    assert code.verified
+    assert code.instructions[1] == ("JUMP_IF_FALSE", [3])
+
+
+def test_verifier_rejects_invalid_jump_target():
+    vm = VirtualMachine()
+
+    with pytest.raises(VerificationError, match="at instruction 1"):
+        vm.run_string("LOAD_CONST 1\nJUMP 9")
+
+
+def test_verifier_computes_max_stack():
+    raw = ["LOAD_CONST 1", "DUP_TOP", "DUP_TOP", "ADD", "ADD", "HALT"]
+    code = BytecodeDecoder().decode(BytecodeParser().parse(raw))
+    BytecodeVerifier().verify(code)
+
+    assert code.max_stack == 3
+
+
+@pytest.mark.parametrize("source, message", [
+    ("LOAD_CONST 1\nADD", "underflow at instruction 1"),
+    ("LOAD_CONST 1\nJUMP_IF_TRUE 3\nLOAD_CONST 2\nHALT",
+     "Inconsistent stack depth at instruction 3"),
+    ("LOAD_CONST 1\nJUMP 0", "Inconsistent stack depth at instruction 0"),
+])
+def test_verifier_rejects_unbalanced_stack(source, message):
+    with pytest.raises(VerificationError, match=message):
+        VirtualMachine().run_string(source)
+
+
+def test_resolver_assigns_slots_to_stored_names():
+    raw = [
+        ".function f x", "LOAD_VAR print", "LOAD_VAR x", "CALL_FUNC 1",
+        "STORE_VAR y", "INCR_VAR x 1", "LOAD_VAR_CONST_ADD y 2",
+        "RETURN_VAL", ".end",
+        "LOAD_VAR n", "STORE_VAR n", "LOAD_VAR print", "CALL_FUNC 0",
+        "POP_TOP", "HALT",
+    ]
+    main, functions = BytecodeParser().parse_program(raw)
+    code = BytecodeResolver().resolve(
+        BytecodeDecoder().decode_program(main, functions)
+    )
+    func = code.functions["f"]
+
+    assert func.varnames == ["x", "y"]
+    assert [op for op, _ in func.instructions] == [
+        "LOAD_GLOBAL", "LOAD_FAST", "CALL_FUNC", "STORE_FAST",
+        "INCR_FAST", "LOAD_FAST_CONST_ADD", "RETURN_VAL",
+    ]
+    assert func.instructions[3][1] == [1]
+    assert func.instructions[4][1][0] == 0
+    # Module variables are the globals and stay name-based
+    assert code.varnames == []
+    assert [op for op, _ in code.instructions] == [
+        "LOAD_VAR", "STORE_VAR", "LOAD_GLOBAL", "CALL_FUNC",
+        "POP_TOP", "HALT",
+    ]
+
+
+def test_parse_program_splits_functions():
+    raw = [
+        ".function inc x", "LOAD_VAR x", "LOAD_CONST 1", "ADD",
+        "RETURN_VAL", ".end", "MAKE_FUNCTION inc", "LOAD_VAR n",
+        "CALL 1", "STORE_VAR n", "HALT",
+    ]
+    main, functions = BytecodeParser().parse_program(raw)
+    code = BytecodeDecoder().decode_program(main, functions)
+    BytecodeVerifier().verify(BytecodeResolver().resolve(code))
+
+    inc = code.functions["inc"]
+    assert inc.params == ("x",) and inc.verified
+    assert inc.constants is code.constants
+    assert inc.instructions[0] == ("LOAD_FAST", [0])
+    # Module variables stay name-based
+    assert code.instructions[1] == ("LOAD_VAR", ["n"])
+
+
+@pytest.mark.parametrize("source, message", [
+    (".function f\nLOAD_CONST 1\n.end\nHALT", "can end without"),
+    (".function f\nHALT\n.end\nHALT", "HALT inside function"),
+    ("MAKE_FUNCTION g\nHALT", "Unknown function 'g'"),
+    ("LOAD_VAR f\nTAIL_CALL 0\nHALT", "TAIL_CALL outside a function"),
+])
+def test_verifier_rejects_bad_functions(source, message):
+    with pytest.raises(VerificationError, match=message):
+        VirtualMachine().run_string(source)
@@ -0,0 +1,132 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# test_compiler MODULE
+# --------------------------------------------------
+
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import pytest
+
+from vm.core.vm import VirtualMachine
+from vm.errors import RuntimeExecutionError
+
+
+PROGRAMS = {
+    "arithmetic": """
+        LOAD_CONST 2
+        LOAD_CONST 3
+        ADD
+        LOAD_CONST 4
+        MUL
+        STORE_VAR result
+        HALT
+    """,
+    "branches": """
+        LOAD_CONST 0
+        JUMP_IF_FALSE 4
+        LOAD_CONST 99
+        STORE_VAR x
+        LOAD_CONST 42
+        DUP_TOP
+        STORE_VAR x
+        STORE_VAR y
+        HALT
+    """,
+    "loop": """
+        LOAD_CONST 10
+        STORE_VAR n
+        LOAD_CONST 0
+        STORE_VAR total
+        LOAD_VAR n
+        JUMP_IF_FALSE 17
+        LOAD_VAR total
+        LOAD_VAR n
+        ADD
+        STORE_VAR total
+        LOAD_VAR n
+        LOAD_CONST 1
+        SUB
+        STORE_VAR n
+        JUMP 4
+        LOAD_CONST 99
+        STORE_VAR total
+        HALT
+        LOAD_CONST 1
+        STORE_VAR total
+    """,
+    "host_call": """
+        LOAD_VAR add
+        LOAD_CONST 2
+        LOAD_CONST 3
+        CALL_FUNC 2
+        LOAD_CONST 2
+        DIV
+        STORE_VAR result
+    """,
+}
+
+
+def run(source, backend):
+    vm = VirtualMachine()
+    vm.globals.set("add", lambda a, b: a + b)
+    vm.run_string(source, backend=backend)
+    values = dict(vm.globals._values)
+    del values["add"]
+    return values
+
+
+@pytest.mark.parametrize("name", sorted(PROGRAMS))
+def test_compiled_backend_matches_reference(name):
+    source = PROGRAMS[name]
+
+    assert run(source, "compiled") == run(source, "reference")
+
+
+@pytest.mark.parametrize("source", [
+    "LOAD_CONST 1\nLOAD_CONST 0\nDIV",
+    "LOAD_CONST 1\nCALL_FUNC 0",
+    "LOAD_VAR missing",
+    "LOAD_CONST 2\nSTORE_VAR x\nLOAD_VAR x\nJUMP_IF_FALSE 8\n"
+    "LOAD_CONST 1\nLOAD_VAR missing\nADD\nSTORE_VAR y\nHALT",
+    "LOAD_CONST 1\nLOAD_CONST \"a\"\nSTORE_VAR s\nLOAD_VAR s\nSUB\nHALT",
+])
+def test_compiled_backend_errors(source):
+    locations = []
+
+    for backend in ("reference", "compiled"):
+        with pytest.raises(RuntimeExecutionError) as info:
+            run(source, backend)
+        locations.append((info.value.ip, info.value.opcode))
+    
+    # Reported at the failing instruction, not its block
+    assert locations[0] == locations[1]
+    assert locations[1][0] is not None
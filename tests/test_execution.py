@@ -34,7 +34,26 @@
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
+import asyncio
+import os
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from vm.core.batch import BatchRunner
+from vm.core.engine import ExecutionEngine
+from vm.core.scheduler import Scheduler
+from vm.core import vector
 from vm.core.vm import VirtualMachine
+from vm.memory import InlineCache, Namespace, OverlayNamespace, ResultCache
+from vm.errors import (
+    InvalidOpcodeError,
+    MemoryBudgetExceededError,
+    RuntimeExecutionError,
+    VariableNotFoundError,
+)
 
 
 def test_simple_arithmetic_execution():
@@ -70,3 +89,803 @@ def test_variable_assignment():
 
     assert vm.globals.get("x") == 10
     assert vm.globals.get("y") == 50
+
+
+def test_unknown_opcode_rejected_at_load():
+    engine = ExecutionEngine()
+
+    with pytest.raises(InvalidOpcodeError):
+        engine.load([("LOAD_CONST", ["1"]), ("NOPE", [])])
+
+
+def test_negative_and_string_constants():
+    vm = VirtualMachine()
+
+    source = """
+        LOAD_CONST -3
+        LOAD_CONST 4
+        MUL
+        STORE_VAR n
+        LOAD_CONST "hello "
+        LOAD_CONST "world"
+        ADD
+        STORE_VAR s
+        HALT
+    """
+
+    vm.run_string(source)
+
+    assert vm.globals.get("n") == -12
+    assert vm.globals.get("s") == "hello world"
+
+
+@pytest.mark.parametrize("backend", ["reference", "compiled"])
+def test_runtime_error_reports_location(backend):
+    vm = VirtualMachine()
+
+    source = """
+        LOAD_CONST 1
+        LOAD_CONST 0
+        DIV
+        HALT
+    """
+
+    with pytest.raises(RuntimeExecutionError) as info:
+        vm.run_string(source, backend=backend)
+    
+    error = info.value
+    assert error.depth == 1
+    assert isinstance(error.__cause__, ZeroDivisionError)
+    assert error.ip == 2
+    assert error.opcode == "DIV"
+    assert "ip=2, opcode=DIV" in str(error)
+
+
+@pytest.mark.parametrize("backend", ["reference", "compiled"])
+def test_slot_locals_published_to_globals(backend):
+    vm = VirtualMachine()
+    vm.globals.set("x", 5)
+
+    source = """
+        LOAD_VAR x
+        LOAD_CONST 1
+        ADD
+        STORE_VAR x
+        LOAD_VAR z
+        STORE_VAR z
+        HALT
+    """
+
+    with pytest.raises(VariableNotFoundError, match="z"):
+        vm.run_string(source, backend=backend)
+    
+    assert vm.globals.get("x") == 6
+    assert not vm.globals.exists("z")
+
+
+@pytest.mark.parametrize("backend", ["reference", "compiled"])
+def test_host_functions_see_module_variables(backend):
+    vm = VirtualMachine()
+    vm.globals.set("peek", lambda: vm.globals.get("x"))
+    vm.globals.set("poke", lambda: vm.globals.set("x", 7))
+
+    vm.run_string("""
+        LOAD_CONST 5
+        STORE_VAR x
+        LOAD_VAR peek
+        CALL_FUNC 0
+        STORE_VAR y
+        LOAD_VAR poke
+        CALL_FUNC 0
+        POP_TOP
+        LOAD_VAR x
+        STORE_VAR z
+        HALT
+    """, backend=backend)
+
+    assert vm.globals.get("y") == 5
+    assert vm.globals.get("x") == 7
+    assert vm.globals.get("z") == 7
+
+    with pytest.raises(VariableNotFoundError, match="missing"):
+        vm.run_string("LOAD_VAR missing\nPOP_TOP\nHALT", backend=backend)
+
+
+def test_inline_cache_survives_rebinding_but_not_shadowing():
+    globals_ns = Namespace()
+    globals_ns.set("x", 1)
+    locals_ns = Namespace(parent=globals_ns)
+    locals_ns.set("y", 0)
+    cache = InlineCache()
+
+    assert cache.lookup(locals_ns, "x") == 1
+
+    # Rebinding x, or another name, keeps the entry
+    globals_ns.set("x", 2)
+    locals_ns.set("y", 1)
+
+    assert cache.lookup(locals_ns, "x") == 2
+    assert (cache.hits, cache.misses) == (1, 1)
+
+    # A new binding that shadows x invalidates it
+    locals_ns.set("x", 3)
+
+    assert cache.lookup(locals_ns, "x") == 3
+    assert cache.lookup(locals_ns, "x") == 3
+    assert (cache.hits, cache.misses) == (2, 2)
+
+
+@pytest.mark.parametrize("optimize", [False, True])
+@pytest.mark.parametrize("backend", ["reference", "compiled"])
+def test_inline_cache_hits_in_module_level_loops(backend, optimize):
+    vm = VirtualMachine(optimize=optimize)
+    vm.globals.set("add", lambda a, b: a + b)
+    # run_example's add, scaled up to a loop in module code
+    source = """
+        LOAD_CONST 1000
+        STORE_VAR n
+        LOAD_VAR n
+        JUMP_IF_FALSE 11
+        LOAD_VAR add
+        LOAD_CONST 2
+        LOAD_CONST 3
+        CALL_FUNC 2
+        STORE_VAR result
+        DECR_VAR n 1
+        JUMP 2
+        HALT
+    """
+
+    vm.run_string(source, backend=backend)
+    stats = vm.cache_stats
+
+    assert vm.globals.get("result") == 5
+    # Only the first store of result adds a name
+    assert stats["misses"] <= 4
+    assert stats["hits"] >= 1900
+
+
+@pytest.mark.parametrize("backend", ["reference", "compiled"])
+def test_cache_stats_count_host_function_lookups(backend):
+    vm = VirtualMachine()
+    vm.globals.set("add", lambda a, b: a + b)
+
+    # The loop runs in a function: its slot stores leave the
+    # globals, and so the cached lookup of add, valid
+    source = """
+        .function loop n
+        LOAD_VAR n
+        JUMP_IF_FALSE 9
+        LOAD_VAR add
+        LOAD_VAR n
+        LOAD_CONST 1
+        CALL_FUNC 2
+        POP_TOP
+        DECR_VAR n 1
+        JUMP 0
+        LOAD_CONST 0
+        RETURN_VAL
+        .end
+        MAKE_FUNCTION loop
+        LOAD_CONST 3
+        CALL 1
+        POP_TOP
+        HALT
+    """
+
+    vm.run_string(source, backend=backend)
+
+    assert vm.cache_stats == {"hits": 2, "misses": 1}
+
+
+def test_overlay_runs_share_frozen_globals():
+    vm = VirtualMachine()
+    vm.globals.set("add", lambda a, b: a + b)
+    vm.globals.set("base", 10)
+
+    source = """
+        LOAD_VAR add
+        LOAD_VAR base
+        LOAD_CONST 5
+        CALL_FUNC 2
+        STORE_VAR result
+        LOAD_CONST 0
+        STORE_VAR base
+        HALT
+    """
+
+    overlay = vm.run_overlay(source)
+
+    assert overlay.changes() == {"result": 15, "base": 0}
+    assert vm.frozen_globals.get("base") == 10
+
+    again = vm.run_overlay(source, overlay)
+
+    assert again is overlay
+    assert overlay.get("result") == 15
+    assert not vm.globals.exists("result")
+
+    overlay.reset()
+
+    assert overlay.changes() == {}
+    assert overlay.get("base") == 10
+
+    with pytest.raises(TypeError):
+        vm.frozen_globals.set("base", 1)
+
+
+@pytest.mark.parametrize("backend", ["reference", "compiled"])
+def test_memory_budget_stops_growing_string(backend):
+    source = """
+        LOAD_CONST "ab"
+        STORE_VAR s
+        LOAD_VAR s
+        LOAD_VAR s
+        ADD
+        STORE_VAR s
+        JUMP 2
+    """
+    vm = VirtualMachine(memory_budget=100_000)
+
+    with pytest.raises(MemoryBudgetExceededError) as info:
+        vm.run_string(source, backend=backend)
+    
+    assert info.value.opcode == "ADD"
+    assert len(vm.globals.get("s")) < 100_000
+
+    vm = VirtualMachine(memory_budget=100_000)
+    vm.run_file(os.path.join(os.path.dirname(__file__), "..",
+                             "examples", "loop.bc"), backend=backend)
+
+    assert vm.globals.get("total") == 55
+
+
+def test_memory_budget_refuses_oversized_results_before_building():
+    vm = VirtualMachine(memory_budget=1 << 20)
+    tracemalloc.start()
+
+    try:
+        with pytest.raises(MemoryBudgetExceededError) as info:
+            vm.run_string('LOAD_CONST "ab"\nLOAD_CONST 50000000\n'
+                          'MUL\nHALT')
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    assert info.value.opcode == "MUL"
+    assert peak < 1 << 20
+
+
+def test_memory_budget_counts_values_on_the_stack():
+    # Two 600 KB strings, never stored, outgrow a 1 MB budget
+    half = 'LOAD_CONST "ab"\nLOAD_CONST 300000\nMUL\n'
+    vm = VirtualMachine(memory_budget=1 << 20)
+
+    with pytest.raises(MemoryBudgetExceededError):
+        vm.run_string(half + half + "HALT")
+    
+    VirtualMachine(memory_budget=1 << 20).run_string(half + "HALT")
+
+
+def test_memory_budget_holds_no_released_function_frames():
+    # One string is live at a time, however many calls store it
+    source = """
+        .function f n
+        LOAD_CONST "0123456789a"
+        STORE_VAR s
+        LOAD_VAR s
+        RETURN_VAL
+        .end
+        MAKE_FUNCTION f
+        STORE_VAR f
+        LOAD_CONST 5000
+        STORE_VAR n
+        LOAD_VAR n
+        JUMP_IF_FALSE 12
+        LOAD_VAR f
+        LOAD_VAR n
+        CALL 1
+        STORE_VAR last
+        DECR_VAR n 1
+        JUMP 4
+        HALT
+    """
+    vm = VirtualMachine(memory_budget=200_000)
+    vm.run_string(source)
+
+    assert vm.globals.get("last") == "0123456789a"
+    assert vm.globals.get("n") == 0
+
+
+def test_memory_budget_holds_no_replaced_tail_call_slots():
+    source = """
+        .function count n
+        LOAD_CONST "0123456789a"
+        STORE_VAR s
+        LOAD_VAR n
+        JUMP_IF_FALSE 9
+        LOAD_VAR count
+        LOAD_VAR n
+        LOAD_CONST 1
+        SUB
+        TAIL_CALL 1
+        LOAD_VAR s
+        RETURN_VAL
+        .end
+        MAKE_FUNCTION count
+        STORE_VAR count
+        LOAD_VAR count
+        LOAD_CONST 5000
+        CALL 1
+        STORE_VAR result
+        HALT
+    """
+    vm = VirtualMachine(memory_budget=200_000)
+    vm.run_string(source)
+
+    assert vm.globals.get("result") == "0123456789a"
+
+
+def test_memory_budget_counts_values_held_by_calling_frames():
+    # Every level of the recursion keeps a 100 KB string alive
+    source = """
+        .function nest n
+        LOAD_CONST "ab"
+        LOAD_CONST 50000
+        MUL
+        STORE_VAR s
+        LOAD_VAR n
+        JUMP_IF_FALSE 12
+        LOAD_VAR nest
+        LOAD_VAR n
+        LOAD_CONST 1
+        SUB
+        CALL 1
+        STORE_VAR inner
+        LOAD_VAR s
+        RETURN_VAL
+        .end
+        MAKE_FUNCTION nest
+        STORE_VAR nest
+        LOAD_VAR nest
+        LOAD_CONST {depth}
+        CALL 1
+        HALT
+    """
+    with pytest.raises(MemoryBudgetExceededError) as info:
+        VirtualMachine(memory_budget=1 << 20).run_string(
+            source.format(depth=20)
+        )
+    
+    assert info.value.opcode == "MUL"
+
+    VirtualMachine(memory_budget=1 << 20).run_string(source.format(depth=5))
+
+
+@pytest.mark.parametrize("optimize", [False, True])
+@pytest.mark.parametrize("backend", ["reference", "compiled"])
+def test_recursive_bytecode_function(backend, optimize):
+    vm = VirtualMachine(optimize=optimize)
+    vm.run_file(os.path.join(os.path.dirname(__file__), "..",
+                             "examples", "fib.bc"), backend=backend)
+
+    assert vm.globals.get("result") == 610
+    # One frame per level of recursion, all back in the pool
+    assert len(vm.runtime.frames) == 16
+    assert len(vm.runtime.callstack) == 0
+
+
+def test_function_call_errors_report_callee():
+    vm = VirtualMachine()
+
+    source = """
+        .function div a b
+        LOAD_VAR a
+        LOAD_VAR b
+        DIV
+        RETURN_VAL
+        .end
+        MAKE_FUNCTION div
+        LOAD_CONST 1
+        LOAD_CONST 0
+        CALL 2
+        HALT
+    """
+
+    with pytest.raises(RuntimeExecutionError) as info:
+        vm.run_string(source)
+    
+    assert info.value.ip == 2
+    assert info.value.depth == 2
+
+    with pytest.raises(RuntimeExecutionError, match="takes 2"):
+        vm.run_string(source.replace("CALL 2", "POP_TOP\nCALL 1"))
+
+
+def test_tail_recursion_runs_in_constant_frames():
+    vm = VirtualMachine(optimize=True)
+
+    source = """
+        .function count n
+        LOAD_VAR n
+        JUMP_IF_FALSE 8
+        LOAD_VAR count
+        LOAD_VAR n
+        LOAD_CONST 1
+        SUB
+        CALL 1
+        RETURN_VAL
+        LOAD_CONST "done"
+        RETURN_VAL
+        .end
+        MAKE_FUNCTION count
+        STORE_VAR count
+        LOAD_VAR count
+        LOAD_CONST 1000000
+        CALL 1
+        STORE_VAR result
+        HALT
+    """
+
+    vm.run_string(source)
+
+    assert vm.last_optimization.rewrites["TAIL_CALL"] == 1
+    assert vm.globals.get("result") == "done"
+    # A single function frame served the whole recursion
+    assert len(vm.runtime.frames) == 2
+
+    with pytest.raises(RuntimeExecutionError, match="call stack depth"):
+        vm.run_string(source, optimize=False)
+
+
+@pytest.mark.parametrize("argc", [0, 1, 2, 3, 4])
+def test_call_func_passes_arguments_in_order(argc):
+    vm = VirtualMachine()
+    vm.globals.set("pack", lambda *args: args)
+
+    source = "\n".join(
+        ["LOAD_CONST 7", "LOAD_VAR pack"]
+        + [f"LOAD_CONST {i}" for i in range(argc)]
+        + [f"CALL_FUNC {argc}", "STORE_VAR result",
+           "STORE_VAR below", "HALT"]
+    )
+
+    vm.run_string(source)
+
+    assert vm.globals.get("result") == tuple(range(argc))
+    assert vm.globals.get("below") == 7
+
+    with pytest.raises(RuntimeExecutionError, match="not callable"):
+        vm.run_string(source.replace("LOAD_VAR pack", "LOAD_CONST 1"))
+
+
+def test_pure_host_functions_share_result_cache():
+    calls = []
+
+    def square(x):
+        calls.append(x)
+        return x * x
+    
+    cache = ResultCache(max_entries=2)
+    first = VirtualMachine(result_cache=cache)
+    second = VirtualMachine(result_cache=cache)
+
+    source = """
+        LOAD_VAR square
+        LOAD_VAR x
+        CALL_FUNC 1
+        STORE_VAR result
+        HALT
+    """
+
+    for vm, x in ((first, 3), (second, 3), (first, 3.0), (first, 4)):
+        vm.register_pure("square", square)
+        vm.globals.set("x", x)
+        vm.run_string(source)
+        assert vm.globals.get("result") == x * x
+    
+    second.globals.set("x", [2])
+    second.register_pure("square", len)
+    second.run_string(source)
+
+    assert calls == [3, 3.0, 4]
+    assert first.memo_stats == second.memo_stats
+    stats = first.memo_stats
+    assert (stats["hits"], stats["misses"]) == (1, 3)
+    assert (stats["bypasses"], stats["evictions"]) == (1, 1)
+
+
+def test_result_cache_types_nested_arguments():
+    cache = ResultCache()
+    describe = lambda value: repr(value)
+
+    assert cache.call(describe, ((1,),)) == "(1,)"
+    assert cache.call(describe, ((1.0,),)) == "(1.0,)"
+    assert cache.call(describe, ((1, (True,)),)) == "(1, (True,))"
+    assert cache.call(describe, ((1, (1,)),)) == "(1, (1,))"
+    # frozenset({1}) == frozenset({1.0}): not cached at all
+    assert cache.call(describe, (frozenset({1.0}),)) == "frozenset({1.0})"
+
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"]) == (0, 4)
+    assert stats["bypasses"] == 1
+
+
+def test_register_pure_refuses_coroutine_functions():
+    async def fetch(key):
+        return key
+    
+    with pytest.raises(TypeError, match="fetch"):
+        VirtualMachine().register_pure("fetch", fetch)
+
+
+def test_result_cache_is_thread_safe():
+    # Tiny and instantly expiring: threads keep evicting and
+    # expiring the keys other threads are looking up
+    cache = ResultCache(max_entries=4, ttl=0.0)
+    square = lambda x: x * x
+
+    def hammer(seed):
+        return [cache.call(square, ((seed + i) % 16,))
+                for i in range(2000)]
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(hammer, range(8)))
+    
+    for seed, values in enumerate(results):
+        assert values == [((seed + i) % 16) ** 2 for i in range(2000)]
+    
+    stats = cache.stats()
+    assert stats["hits"] + stats["misses"] == 16_000
+    assert stats["entries"] <= 4
+    assert stats["bytes"] == sum(size for _, size, _
+                                 in cache._entries.values())
+
+
+def preload_add(vm):
+    vm.globals.set("add", lambda a, b: a + b)
+    vm.globals.set("crash", lambda: os._exit(1))
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_batch_runner_isolates_programs(tmp_path, workers):
+    sources = {
+        "sum.bc": "LOAD_VAR add\nLOAD_CONST 2\nLOAD_CONST 3\n"
+                  "CALL_FUNC 2\nSTORE_VAR result\nHALT",
+        "bad.bc": "LOAD_CONST 1\nLOAD_CONST 0\nDIV\nHALT",
+        "peek.bc": "LOAD_VAR result\nHALT",
+    }
+    paths = []
+
+    for name, source in sources.items():
+        path = tmp_path / name
+        path.write_text(source)
+        paths.append(str(path))
+    
+    runner = BatchRunner(workers=workers, chunk_size=2,
+                         setup=preload_add)
+    results = runner.run(paths * 2)
+
+    assert [r.ok for r in results] == [True, False, False] * 2
+    assert results[0].globals == {"result": 5}
+    assert "division by zero" in results[1].error
+    # Writes of one program are invisible to the next
+    assert "Variable not found: result" in results[2].error
+
+
+def test_batch_runner_survives_dead_and_hung_workers(tmp_path):
+    sources = {
+        "sum.bc": "LOAD_VAR add\nLOAD_CONST 2\nLOAD_CONST 3\n"
+                  "CALL_FUNC 2\nSTORE_VAR result\nHALT",
+        "crash.bc": "LOAD_VAR crash\nCALL_FUNC 0\nHALT",
+        "hang.bc": "JUMP 0",
+    }
+    paths = []
+
+    for name, source in sources.items():
+        path = tmp_path / name
+        path.write_text(source)
+        paths.append(str(path))
+    
+    runner = BatchRunner(workers=2, chunk_size=2, setup=preload_add,
+                         timeout=0.5)
+    results = runner.run(paths + paths[:1])
+
+    assert [r.ok for r in results] == [True, False, False, True]
+    assert results[3].globals == {"result": 5}
+    assert results[1].error.startswith("BrokenProcessPool")
+    assert results[2].error.startswith("TimeoutError")
+
+
+def test_batch_runner_isolates_only_the_failing_chunks(tmp_path,
+                                                       monkeypatch):
+    sources = {
+        "sum.bc": "LOAD_VAR add\nLOAD_CONST 2\nLOAD_CONST 3\n"
+                  "CALL_FUNC 2\nSTORE_VAR result\nHALT",
+        "crash.bc": "LOAD_VAR crash\nCALL_FUNC 0\nHALT",
+        "hang.bc": "JUMP 0",
+    }
+    paths = {}
+
+    for name, source in sources.items():
+        path = tmp_path / name
+        path.write_text(source)
+        paths[name] = str(path)
+    
+    isolated = []
+    run_isolated = BatchRunner._run_isolated
+
+    def spy(runner, chunk):
+        isolated.append(chunk)
+        return run_isolated(runner, chunk)
+    
+    monkeypatch.setattr(BatchRunner, "_run_isolated", spy)
+    good = [paths["sum.bc"]] * 2
+    chunks = [good, [paths["crash.bc"], paths["sum.bc"]], good,
+              [paths["sum.bc"], paths["hang.bc"]], good, good]
+    runner = BatchRunner(workers=2, chunk_size=2, setup=preload_add,
+                         timeout=0.5)
+    results = runner.run([path for chunk in chunks for path in chunk])
+
+    assert sorted(isolated) == sorted([chunks[1], chunks[3]])
+    assert [r.ok for r in results] == [True] * 2 + [False, True] + \
+        [True] * 3 + [False] + [True] * 4
+
+
+def test_runtime_step_resumes_inside_function_calls():
+    vm = VirtualMachine()
+    path = os.path.join(os.path.dirname(__file__), "..",
+                        "examples", "fib.bc")
+    code = vm._prepare(vm._decode(vm.loader.load_from_file(path)))
+    frame = vm.runtime.new_frame(code, vm.globals, vm.globals)
+    task = vm.runtime.start(frame)
+    depths = set()
+
+    while not vm.runtime.step(task, 7):
+        depths.add(len(task.callstack))
+    
+    assert vm.globals.get("result") == 610
+    assert max(depths) > 2
+
+
+@pytest.mark.parametrize("policy", ["round_robin", "priority"])
+def test_scheduler_interleaves_programs(policy):
+    vm = VirtualMachine()
+    scheduler = Scheduler(vm, quantum=20, policy=policy)
+    loop = os.path.join(os.path.dirname(__file__), "..",
+                        "examples", "loop.bc")
+    
+    with open(loop, encoding="utf-8") as src:
+        long_source = src.read().replace("LOAD_CONST 10",
+                                         "LOAD_CONST 100", 1)
+    
+    spaces = [Namespace(), Namespace(), Namespace()]
+    long_task = scheduler.spawn(long_source, globals_ns=spaces[0])
+    failing = scheduler.spawn("LOAD_VAR missing\nHALT",
+                              globals_ns=spaces[1])
+    short = scheduler.spawn("LOAD_CONST 4\nSTORE_VAR x\nHALT",
+                            priority=1, globals_ns=spaces[2])
+    finished = scheduler.run()
+
+    assert finished.index(short) < finished.index(long_task)
+    assert (finished[0] is short) == (policy == "priority")
+    assert "Variable not found" in str(failing.error)
+    assert spaces[0].get("total") == 5050
+    assert spaces[2].get("x") == 4
+    assert long_task.slices > 1
+
+
+class SlowService:
+    """
+    Local stand-in for an async service with fixed latency.
+    """
+
+    def __init__(self, latency):
+        self.latency = latency
+        self.in_flight = 0
+        self.peak = 0
+    
+    async def double(self, value):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.latency)
+        self.in_flight -= 1
+
+        if value < 0:
+            raise ValueError("negative key")
+        return value * 2
+
+
+@pytest.mark.parametrize("optimize", [False, True])
+def test_run_async_overlaps_awaitable_host_calls(optimize):
+    service = SlowService(latency=0.05)
+    vm = VirtualMachine(optimize=optimize)
+    vm.globals.set("double", service.double)
+
+    source = """
+        .function fetch key
+        LOAD_VAR double
+        LOAD_VAR key
+        CALL 1
+        RETURN_VAL
+        .end
+        MAKE_FUNCTION fetch
+        LOAD_VAR key
+        CALL 1
+        LOAD_VAR double
+        LOAD_CONST 1
+        CALL_FUNC 1
+        ADD
+        STORE_VAR result
+        HALT
+    """
+    spaces = [Namespace(parent=vm.globals) for _ in range(50)]
+
+    for key, space in enumerate(spaces):
+        space.set("key", key)
+    
+    async def run_all():
+        await asyncio.gather(*(vm.run_async(source, globals_ns=space)
+                               for space in spaces))
+    
+    start = time.perf_counter()
+    asyncio.run(run_all())
+
+    # Two sequential waits per program, overlapped across programs
+    assert time.perf_counter() - start < 50 * 0.05
+    assert service.peak == 50
+    assert [space.get("result") for space in spaces] == [
+        2 * key + 2 for key in range(50)
+    ]
+
+    spaces[0].set("key", -1)
+
+    with pytest.raises(RuntimeExecutionError, match="negative key"):
+        asyncio.run(vm.run_async(source, globals_ns=spaces[0]))
+
+
+@pytest.mark.parametrize("backend", ["reference", "compiled"])
+def test_program_runs_concurrently_from_threads(backend):
+    vm = VirtualMachine()
+    vm.globals.set("add", lambda a, b: a + b)
+    base = vm.freeze_globals()
+    program = vm.load("""
+        LOAD_VAR seed
+        STORE_VAR n
+        LOAD_CONST 0
+        STORE_VAR total
+        LOAD_VAR n
+        JUMP_IF_FALSE 13
+        LOAD_VAR add
+        LOAD_VAR total
+        LOAD_VAR n
+        CALL_FUNC 2
+        STORE_VAR total
+        DECR_VAR n 1
+        JUMP 4
+        HALT
+    """)
+
+    def run(seed):
+        overlay = OverlayNamespace(base)
+        overlay.set("seed", seed)
+        return program.run(overlay.freeze(), backend=backend)
+    
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        results = list(pool.map(run, range(200)))
+    
+    assert [r.get("total") for r in results] == [
+        seed * (seed + 1) // 2 for seed in range(200)
+    ]
+    assert not base.exists("total")
+
+    with pytest.raises(AttributeError):
+        program.name = "other"
+
+
+@pytest.mark.skipif(vector.np is not None, reason="numpy is installed")
+def test_run_columns_requires_numpy():
+    vm = VirtualMachine()
+
+    with pytest.raises(ImportError, match="NumPy"):
+        vm.run_columns("HALT", {"x": [1, 2, 3]})
@@ -0,0 +1,111 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# test_hooks MODULE
+# --------------------------------------------------
+
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import gc
+import io
+
+import pytest
+
+from vm.core.vm import VirtualMachine
+from vm.utils import TraceBuffer, hooks
+
+
+SOURCE = """
+    LOAD_VAR add
+    LOAD_CONST 1
+    LOAD_CONST 2
+    CALL_FUNC 2
+    JUMP_IF_TRUE 6
+    HALT
+    HALT
+"""
+
+
+def make_vm():
+    vm = VirtualMachine()
+    vm.globals.set("add", lambda a, b: a + b)
+    return vm
+
+
+def test_hooks_receive_events():
+    vm = make_vm()
+    seen = []
+    vm.hooks.register("call", lambda frame, ip, *_: seen.append(
+        ("call", ip)))
+    vm.hooks.register("jump", lambda frame, ip, target: seen.append(
+        ("jump", ip, target)))
+    vm.run_string(SOURCE)
+
+    assert seen == [("call", 3), ("jump", 4, 6)]
+
+
+def test_trace_buffer_flushes_to_stream():
+    vm = make_vm()
+    stream = io.StringIO()
+    trace = TraceBuffer(stream, capacity=1000)
+    vm.hooks.attach(trace, events=("instruction",))
+    vm.run_string(SOURCE)
+
+    assert stream.getvalue() == ""
+    assert len(trace.events) == 6
+
+    trace.flush()
+    lines = stream.getvalue().splitlines()
+
+    assert lines[0] == ("[TRACE] IP=0 | instruction LOAD_GLOBAL "
+                        "['add'] | DEPTH=0")
+    assert trace.events == []
+
+
+def test_stdout_trace_writes_remaining_events_once(capsys):
+    vm = make_vm()
+    trace = hooks.stdout_trace()
+    vm.hooks.attach(trace, events=("call",))
+    vm.run_string(SOURCE)
+
+    assert capsys.readouterr().out == ""
+
+    # Written when the buffer goes away, not kept for exit
+    vm.hooks.clear()
+    del trace
+    gc.collect()
+
+    assert capsys.readouterr().out.startswith("[TRACE] IP=3 | call")
+
+
+def test_unknown_hook_event():
+    with pytest.raises(ValueError):
+        make_vm().hooks.register("bogus", print)
@@ -0,0 +1,191 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# test_optimizer MODULE
+# --------------------------------------------------
+
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import os
+import tracemalloc
+
+import pytest
+
+from vm.bytecode import BytecodeDecoder, BytecodeLoader, BytecodeParser
+from vm.core.vm import VirtualMachine
+from vm.errors import RuntimeExecutionError, VerificationError
+from vm.optimizer import PeepholeOptimizer, StaticOptimizer
+
+
+LOOP = """
+    LOAD_CONST 5
+    STORE_VAR n
+    LOAD_CONST 0
+    STORE_VAR total
+    LOAD_VAR n
+    DUP_TOP
+    JUMP_IF_FALSE 17
+    POP_TOP
+    LOAD_VAR total
+    LOAD_CONST 2
+    ADD
+    STORE_VAR total
+    LOAD_VAR n
+    LOAD_CONST 1
+    SUB
+    STORE_VAR n
+    JUMP 4
+    HALT
+"""
+
+
+def decode(source):
+    raw = BytecodeLoader().load_from_string(source)
+    return BytecodeDecoder().decode(BytecodeParser().parse(raw))
+
+
+def test_peephole_fuses_and_remaps_jumps():
+    optimizer = PeepholeOptimizer()
+    code = optimizer.optimize(decode(LOOP))
+    opcodes = [opcode for opcode, _ in code.instructions]
+
+    assert opcodes == [
+        "LOAD_CONST", "STORE_VAR", "LOAD_CONST", "STORE_VAR",
+        "LOAD_VAR", "PEEK_JUMP_IF_FALSE", "POP_TOP",
+        "INCR_VAR", "DECR_VAR", "JUMP", "HALT",
+    ]
+    assert code.instructions[5][1] == [10]
+    assert code.instructions[9][1] == [4]
+    assert optimizer.last_report.removed == 7
+
+
+def test_peephole_keeps_jump_target_boundaries():
+    code = decode("""
+        LOAD_VAR x
+        LOAD_CONST 1
+        ADD
+        STORE_VAR x
+        JUMP 3
+    """)
+    optimized = PeepholeOptimizer().optimize(code)
+    opcodes = [opcode for opcode, _ in optimized.instructions]
+
+    assert opcodes == ["LOAD_VAR_CONST_ADD", "STORE_VAR", "JUMP"]
+    assert optimized.instructions[2][1] == [1]
+
+
+@pytest.mark.parametrize("backend", ["reference", "compiled"])
+def test_optimized_program_results(backend):
+    vm = VirtualMachine(optimize=True)
+    vm.run_string(LOOP, backend=backend)
+
+    assert vm.globals.get("total") == 10
+    assert vm.globals.get("n") == 0
+
+
+def test_static_folds_constants_and_removes_dead_code():
+    code = decode("""
+        LOAD_CONST 2
+        LOAD_CONST 3
+        MUL
+        LOAD_CONST 4
+        ADD
+        STORE_VAR x
+        JUMP 9
+        LOAD_CONST 99
+        STORE_VAR x
+        JUMP 10
+        HALT
+    """)
+    optimized = StaticOptimizer().optimize(code)
+    instructions = optimized.instructions
+
+    assert [opcode for opcode, _ in instructions] == [
+        "LOAD_CONST", "STORE_VAR", "HALT",
+    ]
+    assert optimized.constants.get(instructions[0][1][0]) == 10
+
+
+def test_static_keeps_division_by_zero():
+    source = """
+        LOAD_CONST 1
+        LOAD_CONST 0
+        DIV
+        STORE_VAR x
+    """
+    optimized = StaticOptimizer().optimize(decode(source))
+
+    assert len(optimized.instructions) == 4
+
+    with pytest.raises(RuntimeExecutionError):
+        VirtualMachine().run_string(source, optimize=True)
+
+
+def test_static_skips_oversized_folds_without_building_them():
+    code = decode("""
+        LOAD_CONST "ab"
+        LOAD_CONST 200000000
+        MUL
+        LOAD_CONST 2
+        LOAD_CONST 3
+        MUL
+        HALT
+    """)
+    tracemalloc.start()
+
+    try:
+        optimized = StaticOptimizer().optimize(code)
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    
+    assert peak < 1_000_000
+    opcodes = [opcode for opcode, _ in optimized.instructions]
+
+    # The string is left to runtime, the small product folded
+    assert opcodes == ["LOAD_CONST", "LOAD_CONST", "MUL",
+                       "LOAD_CONST", "HALT"]
+
+
+@pytest.mark.parametrize("jump", ["JUMP end", "JUMP_IF_TRUE"])
+def test_optimizer_rejects_malformed_jumps(jump):
+    with pytest.raises(VerificationError):
+        VirtualMachine().run_string(f"LOAD_CONST 1\n{jump}\nHALT",
+                                    optimize=True)
+
+
+def test_static_folds_constant_branch():
+    vm = VirtualMachine(optimize=True)
+    vm.run_file(os.path.join(os.path.dirname(__file__), "..",
+                             "examples", "conditionals.bc"))
+
+    assert vm.globals.get("x") == 42
+    assert vm.last_optimization.after == 3
@@ -36,7 +36,10 @@
 # --------------------------------------------------
 import pytest
 
-from vm.stack import OperandStack
+from vm.bytecode import BytecodeDecoder, BytecodeParser, BytecodeVerifier
+from vm.core.runtime import Runtime
+from vm.memory import Namespace
+from vm.stack import Frame, OperandStack, UncheckedStack
 from vm.errors import StackUnderflowError
 
 
@@ -62,3 +65,41 @@ def test_stack_underflow():
 
     with pytest.raises(StackUnderflowError):
         stack.pop()
+
+
+def test_verified_frame_uses_unchecked_stack():
+    code = BytecodeDecoder().decode(
+        BytecodeParser().parse(["LOAD_CONST 1", "HALT"])
+    )
+
+    assert isinstance(Frame(code, Namespace()).stack, OperandStack)
+    BytecodeVerifier().verify(code)
+
+    stack = Frame(code, Namespace()).stack
+    stack.push(7)
+
+    assert isinstance(stack, UncheckedStack)
+    assert stack.peek() == 7
+    assert stack.pop() == 7
+    assert len(stack) == 0
+
+
+def test_runtime_reuses_released_frames():
+    code = BytecodeDecoder().decode(
+        BytecodeParser().parse(["LOAD_CONST 1", "STORE_VAR x", "HALT"])
+    )
+    BytecodeVerifier().verify(code)
+    runtime = Runtime()
+    globals_ns = Namespace()
+
+    frame = runtime.new_frame(code, globals_ns)
+    stack = frame.stack
+    frame.stack.push(1)
+    runtime.release_frame(frame)
+
+    reused = runtime.new_frame(code, globals_ns)
+
+    assert reused is frame
+    assert reused.stack is stack and len(stack) == 0
+    assert reused.ip == 0
+    assert not hasattr(reused, "__dict__")
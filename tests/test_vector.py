@@ -0,0 +1,209 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# test_vector MODULE
+# --------------------------------------------------
+
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import pytest
+
+from vm.core import vector
+from vm.core.vm import VirtualMachine
+from vm.errors import RuntimeExecutionError
+
+np = pytest.importorskip("numpy")
+
+
+ARITHMETIC = """
+    LOAD_VAR x
+    LOAD_VAR y
+    ADD
+    LOAD_CONST 4
+    MUL
+    LOAD_VAR y
+    DIV
+    STORE_VAR result
+    HALT
+"""
+
+# total = n + (n - 1) + ... + 1, a different trip count per row
+COUNTDOWN = """
+    LOAD_CONST 0
+    STORE_VAR total
+    LOAD_VAR n
+    JUMP_IF_FALSE 13
+    LOAD_VAR total
+    LOAD_VAR n
+    ADD
+    STORE_VAR total
+    LOAD_VAR n
+    LOAD_CONST 1
+    SUB
+    STORE_VAR n
+    JUMP 2
+    HALT
+"""
+
+# COUNTDOWN, adding y instead of n on the iteration where n
+# equals m: lanes split inside the loop as well as leaving it
+BRANCHY_COUNTDOWN = """
+    LOAD_CONST 0
+    STORE_VAR total
+    LOAD_VAR n
+    JUMP_IF_FALSE 21
+    LOAD_VAR n
+    LOAD_VAR m
+    SUB
+    JUMP_IF_FALSE 12
+    LOAD_VAR total
+    LOAD_VAR n
+    ADD
+    JUMP 15
+    LOAD_VAR total
+    LOAD_VAR y
+    ADD
+    STORE_VAR total
+    LOAD_VAR n
+    LOAD_CONST 1
+    SUB
+    STORE_VAR n
+    JUMP 2
+    HALT
+"""
+
+
+@pytest.mark.parametrize("vectorize", [True, False])
+def test_run_columns_arithmetic(vectorize):
+    vm = VirtualMachine()
+    x = np.arange(6.0)
+    y = np.arange(1.0, 7.0)
+
+    result = vm.run_columns(ARITHMETIC, {"x": x, "y": y},
+                            vectorize=vectorize)
+
+    assert list(result) == ["result"]
+    np.testing.assert_allclose(result["result"], (x + y) * 4 / y)
+    assert not vm.globals.exists("result")
+
+
+@pytest.mark.parametrize("optimize", [False, True])
+def test_run_columns_splits_divergent_lanes(optimize):
+    vm = VirtualMachine()
+    n = np.array([0, 3, 5, 1, 4, 3])
+
+    vector = vm.run_columns(COUNTDOWN, {"n": n}, optimize=optimize)
+    scalar = vm.run_columns(COUNTDOWN, {"n": n}, optimize=optimize,
+                            vectorize=False)
+
+    assert vector["total"].tolist() == [0, 6, 15, 1, 10, 6]
+    assert vector["n"].tolist() == [0] * 6
+    assert scalar["total"].tolist() == vector["total"].tolist()
+
+
+def test_run_columns_reconverges_divergent_lanes(monkeypatch):
+    parts = []
+    assemble = vector.assemble
+
+    def spy(column_parts, rows):
+        parts.append(len(column_parts))
+        return assemble(column_parts, rows)
+    
+    monkeypatch.setattr(vector, "assemble", spy)
+    vm = VirtualMachine()
+    rng = np.random.default_rng(0)
+    columns = {
+        "n": rng.integers(0, 20, 200),
+        "m": rng.integers(0, 20, 200),
+        "y": rng.integers(0, 100, 200),
+    }
+
+    vector_result = vm.run_columns(BRANCHY_COUNTDOWN, columns)
+    # Every lane ends in one group at HALT
+    assert parts == [1, 1]
+
+    scalar = vm.run_columns(BRANCHY_COUNTDOWN, columns, vectorize=False)
+
+    assert vector_result["total"].tolist() == scalar["total"].tolist()
+    assert vector_result["n"].tolist() == [0] * 200
+
+
+def test_run_columns_integer_overflow_matches_scalar_engine():
+    vm = VirtualMachine()
+    x = np.array([3_000_000, 2, -5])
+    source = """
+        LOAD_VAR x
+        LOAD_VAR x
+        MUL
+        LOAD_VAR x
+        MUL
+        STORE_VAR cube
+        HALT
+    """
+
+    vector = vm.run_columns(source, {"x": x})
+    scalar = vm.run_columns(source, {"x": x}, vectorize=False)
+
+    assert vector["cube"].tolist() == [27_000_000_000_000_000_000, 8, -125]
+    assert vector["cube"].tolist() == scalar["cube"].tolist()
+
+
+def test_run_columns_falls_back_per_row_for_host_calls():
+    vm = VirtualMachine()
+    vm.globals.set("scale", lambda value: value * 10)
+
+    result = vm.run_columns("""
+        LOAD_VAR scale
+        LOAD_VAR x
+        CALL_FUNC 1
+        STORE_VAR scaled
+        HALT
+    """, {"x": np.array([1, 2, 3])})
+
+    assert result["scaled"].tolist() == [10, 20, 30]
+
+
+def test_run_columns_reports_lane_errors():
+    vm = VirtualMachine()
+
+    with pytest.raises(RuntimeExecutionError) as info:
+        vm.run_columns("""
+            LOAD_VAR x
+            LOAD_CONST 0
+            DIV
+            STORE_VAR r
+            HALT
+        """, {"x": np.ones(3)})
+    
+    assert info.value.opcode == "DIV"
+
+    with pytest.raises(ValueError):
+        vm.run_columns(ARITHMETIC, {"x": np.ones(3), "y": np.ones(4)})
@@ -36,15 +36,18 @@ Tooling package for the Python Virtual Machine.
 Includes utilities such as:
 - Assembler (text -> bytecode)
 - Disassembler (bytecode -> readable form)
+- Optimizer (bytecode -> optimized bytecode + report)
 """
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
 from .assembler import Assembler
 from .disassembler import Disassembler
+from .optimizer import Optimizer
 
 
 __all__ = [
     "Assembler",
     "Disassembler",
+    "Optimizer",
 ]
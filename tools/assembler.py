@@ -36,7 +36,10 @@
 # --------------------------------------------------
 from typing import List
 
+from vm.bytecode import BytecodeDecoder, BytecodeParser
+from vm.bytecode.binary import SUFFIX, dump_code
 from vm.bytecode.instructions import OPCODES
+from vm.bytecode.parser import DIRECTIVES, tokenize
 from vm.errors import BytecodeError
 
 
@@ -62,11 +65,11 @@ class Assembler:
             if not line or line.startswith("#"):
                 continue
 
-            parts = line.split()
+            parts = tokenize(line)
             opcode = parts[0]
             operands = parts[1:]
 
-            if opcode not in OPCODES:
+            if opcode not in OPCODES and opcode not in DIRECTIVES:
                 raise BytecodeError(
                     f"Unknown opcode '{opcode}' at line {lineno}"
                 )
@@ -76,13 +79,30 @@ class Assembler:
         
         return bytecode
 
+    def assemble_binary(self, source: str) -> bytes:
+        """
+        Convert assembly source into a binary (.pvmc) image.
+        """
+        main, functions = BytecodeParser().parse_program(
+            self.assemble(source)
+        )
+        return dump_code(BytecodeDecoder().decode_program(main,
+                                                          functions))
+
     def assemble_file(self, input_path: str, output_path: str):
         """
         Assemble source file into a bytecode file.
+
+        Output paths ending in ``.pvmc`` get the binary format.
         """
         with open(input_path, "r", encoding="utf-8") as src:
             source = src.read()
         
+        if output_path.endswith(SUFFIX):
+            with open(output_path, "wb") as out:
+                out.write(self.assemble_binary(source))
+            return
+        
         bytecode = self.assemble(source)
 
         with open(output_path, "w", encoding="utf-8") as out:
@@ -0,0 +1,113 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# batch MODULE
+# --------------------------------------------------
+"""
+Batch runner tool.
+
+Runs many bytecode programs across worker processes and
+prints one line per program plus a throughput summary:
+
+    python -m tools.batch -j 4 programs/*.bc
+    python -m tools.batch --setup mypkg.hosts:preload jobs/*.bc
+    python -m tools.batch --timeout 5 untrusted/*.bc
+
+``--setup module:function`` names a function called with
+each worker's VirtualMachine to preload host globals.
+Exits with status 1 when any program failed.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import argparse
+import importlib
+import sys
+import time
+
+from config.config import BATCH_CHUNK_SIZE
+from vm.core.batch import BatchRunner
+
+
+def load_setup(spec: str):
+    """
+    Resolve a ``module:function`` reference.
+    """
+    module, _, name = spec.partition(":")
+
+    if not name:
+        raise ValueError(f"Expected module:function, got '{spec}'")
+    return getattr(importlib.import_module(module), name)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Run bytecode programs in parallel."
+    )
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument("-j", "--workers", type=int, default=None,
+                        help="worker processes (default: one per CPU)")
+    parser.add_argument("--chunk-size", type=int,
+                        default=BATCH_CHUNK_SIZE)
+    parser.add_argument("--setup", help="module:function preloading "
+                        "host globals")
+    parser.add_argument("--backend", choices=["reference", "compiled"])
+    parser.add_argument("-O", "--optimize", action="store_true")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="seconds a program may run")
+    args = parser.parse_args(argv)
+
+    runner = BatchRunner(
+        workers=args.workers,
+        chunk_size=args.chunk_size,
+        setup=load_setup(args.setup) if args.setup else None,
+        backend=args.backend,
+        optimize=args.optimize,
+        timeout=args.timeout,
+    )
+    start = time.perf_counter()
+    results = runner.run(args.paths)
+    elapsed = time.perf_counter() - start
+    failed = 0
+
+    for result in results:
+        if result.ok:
+            print(f"{result.path}: {result.globals}")
+        else:
+            failed += 1
+            print(f"{result.path}: FAILED {result.error}")
+    
+    print(f"{len(results)} programs, {failed} failed, "
+          f"{len(results) / elapsed:,.0f} programs/s")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# optimizer MODULE
+# --------------------------------------------------
+"""
+Bytecode Optimizer tool.
+
+Runs the VM's optimization passes (constant folding, jump
+threading, dead-code removal, superinstructions) over
+bytecode programs, writes the optimized program and
+reports how many instructions each one lost:
+
+    python -m tools.optimizer examples/*.bc
+    python -m tools.optimizer -o out.bc program.bc
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import argparse
+from typing import List
+
+from vm.bytecode import BytecodeDecoder, BytecodeLoader, BytecodeParser
+from vm.bytecode.binary import SUFFIX, dump_code
+from vm.bytecode.instructions import CONST, INSTRUCTION_SET
+from vm.bytecode.parser import END_DIRECTIVE, FUNCTION_DIRECTIVE
+from vm.optimizer import BytecodeOptimizer
+
+
+# --------------------------------------------------
+# optimizer
+# --------------------------------------------------
+class Optimizer:
+    """
+    Optimizes bytecode programs outside the VM.
+    """
+
+    def __init__(self):
+        self.loader = BytecodeLoader()
+        self.parser = BytecodeParser()
+        self.decoder = BytecodeDecoder()
+        self.optimizer = BytecodeOptimizer()
+    
+    def optimize(self, path: str):
+        """
+        Load, decode and optimize a bytecode file.
+
+        Returns the optimized code object and its report.
+        """
+        if self.loader.is_binary(path):
+            code = self.loader.load_binary(path)
+        else:
+            raw = self.loader.load_from_file(path)
+            main, functions = self.parser.parse_program(raw)
+            code = self.decoder.decode_program(main, functions,
+                                               name=path)
+        
+        optimized = self.optimizer.optimize(code)
+        return optimized, self.optimizer.last_report
+    
+    def optimize_file(self, input_path: str, output_path: str):
+        """
+        Optimize a bytecode file into a new file.
+
+        Output paths ending in ``.pvmc`` get the binary format.
+        """
+        code, report = self.optimize(input_path)
+
+        if output_path.endswith(SUFFIX):
+            with open(output_path, "wb") as out:
+                out.write(dump_code(code))
+        else:
+            with open(output_path, "w", encoding="utf-8") as out:
+                for line in self.to_source(code):
+                    out.write(line + "\n")
+        
+        return report
+    
+    def to_source(self, code) -> List[str]:
+        """
+        Render a decoded code object, and its function blocks,
+        as bytecode lines.
+        """
+        lines = []
+
+        for name, func in code.functions.items():
+            lines.append(" ".join([FUNCTION_DIRECTIVE, name,
+                                   *func.params]))
+            lines.extend(self._render(func))
+            lines.append(END_DIRECTIVE)
+        
+        lines.extend(self._render(code))
+        return lines
+    
+    def _render(self, code) -> List[str]:
+        lines = []
+
+        for opcode, operands in code.instructions:
+            kinds = INSTRUCTION_SET[opcode].operand_kinds
+            parts = [opcode]
+
+            for kind, operand in zip(kinds, operands):
+                if kind == CONST:
+                    operand = self.decoder.encode_literal(
+                        code.constants.get(operand)
+                    )
+                parts.append(str(operand))
+            
+            lines.append(" ".join(parts))
+        
+        return lines
+    
+    def report(self, paths: List[str]) -> str:
+        """
+        One report line per program.
+        """
+        lines = []
+
+        for path in paths:
+            _, report = self.optimize(path)
+            lines.append(str(report))
+        
+        return "\n".join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description="Optimize bytecode programs."
+    )
+    parser.add_argument("paths", nargs="+")
+    parser.add_argument(
+        "-o", "--output",
+        help="write the optimized program (single input only)",
+    )
+    args = parser.parse_args(argv)
+    optimizer = Optimizer()
+
+    if args.output:
+        if len(args.paths) != 1:
+            parser.error("--output takes exactly one input")
+        print(optimizer.optimize_file(args.paths[0], args.output))
+    else:
+        print(optimizer.report(args.paths))
+
+
+if __name__ == "__main__":
+    main()
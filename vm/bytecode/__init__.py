@@ -41,9 +41,17 @@ bytecode instructions executed by the VM.
 # --------------------------------------------------
 from .loader import BytecodeLoader
 from .parser import BytecodeParser
+from .decoder import BytecodeDecoder
+from .resolver import BytecodeResolver
+from .verifier import BytecodeVerifier
+from .code import CodeObject
 
 
 __all__ = [
     "BytecodeLoader",
     "BytecodeParser",
+    "BytecodeDecoder",
+    "BytecodeResolver",
+    "BytecodeVerifier",
+    "CodeObject",
 ]
@@ -0,0 +1,312 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# binary MODULE
+# --------------------------------------------------
+"""
+Binary bytecode container (.pvmc).
+
+Layout (little-endian):
+
+    header      magic "PVMC", u16 version, u16 flags,
+                u32 instruction count, u32 constant count,
+                u32 symbol count
+    constants   per entry: u8 type tag + payload
+    symbols     per entry: u32 length + UTF-8 bytes
+    code        fixed 12-byte records:
+                u16 opcode, u8 operand count,
+                u8 symbol mask, i32 operand a, i32 operand b
+
+Integer operands (constant indexes, jump targets, argument
+counts) are stored inline; name operands are indexes into
+the symbol table, flagged in the symbol mask.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import struct
+from typing import Dict, List
+
+from vm.errors import BytecodeError, InvalidOpcodeError
+from vm.memory import ConstantsPool
+from .code import CodeObject
+from .instructions import INSTRUCTION_SET, OPCODE_NAMES
+
+
+MAGIC = b"PVMC"
+VERSION = 1
+SUFFIX = ".pvmc"
+
+_HEADER = struct.Struct("<4sHHIII")
+_RECORD = struct.Struct("<HBBii")
+_U32 = struct.Struct("<I")
+_I64 = struct.Struct("<q")
+_F64 = struct.Struct("<d")
+
+# Constant type tags
+_TAG_INT = 0
+_TAG_FLOAT = 1
+_TAG_STR = 2
+_TAG_BIGINT = 3
+
+_I32_MIN = -(1 << 31)
+_I32_MAX = (1 << 31) - 1
+_I64_MIN = -(1 << 63)
+_I64_MAX = (1 << 63) - 1
+
+
+# --------------------------------------------------
+# writing
+# --------------------------------------------------
+def dump_code(code: CodeObject) -> bytes:
+    """
+    Serialize a decoded CodeObject into the binary format.
+
+    The format holds a single code object, so programs with
+    functions cannot be written.
+    """
+    if code.functions:
+        raise BytecodeError(
+            "Binary format does not support functions"
+        )
+    
+    symbols: List[str] = []
+    symbol_index: Dict[str, int] = {}
+    records = bytearray()
+
+    for index, (opcode, operands) in enumerate(code.instructions):
+        if len(operands) > 2:
+            raise BytecodeError(
+                f"Too many operands for binary format at "
+                f"instruction {index}"
+            )
+        
+        values = [0, 0]
+        mask = 0
+
+        for slot, operand in enumerate(operands):
+            if not isinstance(operand, int):
+                try:
+                    operand = int(operand)
+                except ValueError:
+                    if operand not in symbol_index:
+                        symbol_index[operand] = len(symbols)
+                        symbols.append(operand)
+                    mask |= 1 << slot
+                    operand = symbol_index[operand]
+            
+            if not _I32_MIN <= operand <= _I32_MAX:
+                raise BytecodeError(
+                    f"Operand out of range at instruction {index}"
+                )
+            values[slot] = operand
+        
+        records += _RECORD.pack(INSTRUCTION_SET[opcode].number,
+                                len(operands), mask, *values)
+    
+    out = bytearray(_HEADER.pack(MAGIC, VERSION, 0,
+                                 len(code.instructions),
+                                 len(code.constants),
+                                 len(symbols)))
+    
+    for index in range(len(code.constants)):
+        _write_constant(out, code.constants.get(index))
+    
+    for symbol in symbols:
+        _write_str(out, symbol)
+    
+    out += records
+    return bytes(out)
+
+
+def _write_str(out: bytearray, text: str):
+    data = text.encode("utf-8")
+    out += _U32.pack(len(data))
+    out += data
+
+
+def _write_constant(out: bytearray, value):
+    if type(value) is int:
+        if _I64_MIN <= value <= _I64_MAX:
+            out.append(_TAG_INT)
+            out += _I64.pack(value)
+        else:
+            data = value.to_bytes((value.bit_length() + 8) // 8,
+                                  "little", signed=True)
+            out.append(_TAG_BIGINT)
+            out += _U32.pack(len(data))
+            out += data
+    elif type(value) is float:
+        out.append(_TAG_FLOAT)
+        out += _F64.pack(value)
+    elif type(value) is str:
+        out.append(_TAG_STR)
+        _write_str(out, value)
+    else:
+        raise BytecodeError(
+            f"Unsupported constant type: {type(value).__name__}"
+        )
+
+
+# --------------------------------------------------
+# reading
+# --------------------------------------------------
+def load_code(buffer, name: str = "<module>") -> CodeObject:
+    """
+    Build a CodeObject from a buffer holding a .pvmc image.
+
+    The buffer is read through a memoryview, so an mmap can
+    be passed without copying it.
+    """
+    with memoryview(buffer) as view:
+        if len(view) < _HEADER.size:
+            raise BytecodeError("Truncated bytecode header")
+        
+        (magic, version, _, instr_count, const_count,
+         symbol_count) = _HEADER.unpack_from(view, 0)
+        
+        if magic != MAGIC:
+            raise BytecodeError("Not a PVMC bytecode image")
+        if version != VERSION:
+            raise BytecodeError(
+                f"Unsupported bytecode version: {version}"
+            )
+        
+        offset = _HEADER.size
+        values = []
+
+        for _ in range(const_count):
+            value, offset = _read_constant(view, offset)
+            values.append(value)
+        
+        # Stored indexes are kept even if an image holds
+        # duplicate constants
+        constants = ConstantsPool(values)
+        
+        symbols = []
+
+        for _ in range(symbol_count):
+            symbol, offset = _read_str(view, offset)
+            symbols.append(symbol)
+        
+        end = offset + instr_count * _RECORD.size
+
+        if end > len(view):
+            raise BytecodeError(
+                f"Truncated code section at offset {offset}"
+            )
+        
+        with view[offset:end] as code_view:
+            instructions = _read_records(code_view, symbols)
+    
+    return CodeObject(instructions, constants, name=name)
+
+
+def _read_records(view, symbols):
+    names = OPCODE_NAMES
+    instructions = []
+    append = instructions.append
+
+    for index, (number, count, mask, a, b) in enumerate(
+            _RECORD.iter_unpack(view)):
+        opcode = names.get(number)
+
+        if opcode is None:
+            raise InvalidOpcodeError(f"{number} at instruction {index}")
+        
+        if count == 0:
+            operands = []
+        elif count == 1:
+            operands = [_symbol(symbols, a, index) if mask & 1 else a]
+        else:
+            operands = [_symbol(symbols, a, index) if mask & 1 else a,
+                        _symbol(symbols, b, index) if mask & 2 else b]
+        
+        append((opcode, operands))
+    
+    return instructions
+
+
+def _symbol(symbols, number, index):
+    if not 0 <= number < len(symbols):
+        raise BytecodeError(
+            f"Symbol {number} out of range at instruction {index}"
+        )
+    return symbols[number]
+
+
+def _need(view, offset, size):
+    """
+    Fail unless ``size`` bytes follow ``offset``.
+    """
+    if offset + size > len(view):
+        raise BytecodeError(f"Truncated bytecode at offset {offset}")
+
+
+def _read_str(view, offset):
+    _need(view, offset, _U32.size)
+    (length,) = _U32.unpack_from(view, offset)
+    start = offset + _U32.size
+    _need(view, start, length)
+
+    try:
+        text = str(view[start:start + length], "utf-8")
+    except UnicodeDecodeError:
+        raise BytecodeError(
+            f"Invalid UTF-8 string at offset {offset}"
+        ) from None
+    return text, start + length
+
+
+def _read_constant(view, offset):
+    _need(view, offset, 1)
+    tag = view[offset]
+    start = offset + 1
+
+    if tag == _TAG_INT:
+        _need(view, start, _I64.size)
+        (value,) = _I64.unpack_from(view, start)
+        return value, start + _I64.size
+    if tag == _TAG_FLOAT:
+        _need(view, start, _F64.size)
+        (value,) = _F64.unpack_from(view, start)
+        return value, start + _F64.size
+    if tag == _TAG_STR:
+        return _read_str(view, start)
+    if tag == _TAG_BIGINT:
+        _need(view, start, _U32.size)
+        (length,) = _U32.unpack_from(view, start)
+        start += _U32.size
+        _need(view, start, length)
+        value = int.from_bytes(view[start:start + length],
+                               "little", signed=True)
+        return value, start + length
+    
+    raise BytecodeError(f"Unknown constant tag {tag} at offset {offset}")
@@ -0,0 +1,109 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# code MODULE
+# --------------------------------------------------
+"""
+Code objects.
+
+A code object is the executable form of a program: the
+decoded instruction list together with the constants pool
+its LOAD_CONST operands index into.
+
+Programs with ``.function`` blocks decode to one code object
+per function; all of them share the program's constants
+pool and ``functions`` table.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+from typing import List, Optional, Sequence, Tuple
+
+from vm.memory import ConstantsPool
+
+
+# --------------------------------------------------
+# code object
+# --------------------------------------------------
+class CodeObject:
+    """
+    Decoded instructions plus the constants they reference.
+    """
+
+    def __init__(
+            self,
+            instructions: List[Tuple[str, list]],
+            constants: ConstantsPool,
+            name: str = "<module>",
+            params: Optional[Sequence[str]] = None,
+            functions: Optional[dict] = None,
+        ):
+        self.name = name
+        self.instructions = instructions
+        self.constants = constants
+        # Parameter names for function code, None for a module
+        self.params = tuple(params) if params is not None else None
+        # Function code objects by name, shared program-wide
+        self.functions = functions if functions is not None else {}
+        # Set by BytecodeVerifier once operands are resolved
+        self.verified = False
+        # Local variable names by slot, filled in by the resolver
+        self.varnames = list(self.params or ())
+        # Inline caches indexed by IP, allocated by the verifier
+        self.caches = []
+        # Maximum operand stack depth, computed by the verifier
+        self.max_stack = None
+        # Backend-specific compiled form, filled in lazily
+        self.compiled = None
+    
+    @property
+    def is_function(self) -> bool:
+        return self.params is not None
+    
+    def derive(self, instructions: List[Tuple[str, list]]
+               ) -> "CodeObject":
+        """
+        New unverified code object with other instructions.
+        """
+        return CodeObject(
+            instructions,
+            self.constants,
+            name=self.name,
+            params=self.params,
+            functions=self.functions,
+        )
+    
+    def __len__(self) -> int:
+        return len(self.instructions)
+
+    def __repr__(self) -> str:
+        return (f"CodeObject(name={self.name}, "
+                f"instructions={len(self.instructions)}, "
+                f"constants={len(self.constants)})")
@@ -0,0 +1,167 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# decoder MODULE
+# --------------------------------------------------
+"""
+Bytecode Decoder.
+
+Sits between the parser and execution: literal operands
+(LOAD_CONST and other ``const`` operands) are decoded into
+typed Python values once, stored in a ConstantsPool, and
+rewritten to carry the pool index instead of the literal
+text.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import ast
+import json
+from typing import Dict, List, Optional, Tuple
+
+from vm.errors import BytecodeError
+from vm.memory import ConstantsPool
+from .code import CodeObject
+from .instructions import CONST, INSTRUCTION_SET
+
+
+# --------------------------------------------------
+# bytecode decoder
+# --------------------------------------------------
+class BytecodeDecoder:
+    """
+    Turns parsed instructions into a CodeObject.
+    """
+
+    def decode(
+            self,
+            parsed: List[Tuple[str, List[str]]],
+            constants: Optional[ConstantsPool] = None,
+            name: str = "<module>",
+        ) -> CodeObject:
+        """
+        Decode parsed (opcode, operands) pairs.
+
+        Example:
+            ("LOAD_CONST", ["-2.5"])
+            -> ("LOAD_CONST", [0])  with constants[0] == -2.5
+        """
+        if constants is None:
+            constants = ConstantsPool()
+        
+        instructions = []
+
+        for index, (opcode, operands) in enumerate(parsed):
+            kinds = INSTRUCTION_SET[opcode].operand_kinds
+
+            if CONST in kinds:
+                if len(operands) != len(kinds):
+                    raise BytecodeError(
+                        f"{opcode} expects {len(kinds)} operand(s) "
+                        f"at instruction {index}"
+                    )
+                operands = [
+                    constants.add(self.decode_literal(operand))
+                    if kind == CONST else operand
+                    for kind, operand in zip(kinds, operands)
+                ]
+            
+            instructions.append((opcode, operands))
+        
+        return CodeObject(instructions, constants, name=name)
+    
+    def decode_program(
+            self,
+            main: List[Tuple[str, List[str]]],
+            functions: Dict[str, Tuple[List[str], list]],
+            constants: Optional[ConstantsPool] = None,
+            name: str = "<module>",
+        ) -> CodeObject:
+        """
+        Decode BytecodeParser.parse_program output.
+
+        Every function body becomes a CodeObject sharing the
+        module's constants pool and functions table.
+        """
+        if constants is None:
+            constants = ConstantsPool()
+        
+        code = self.decode(main, constants, name=name)
+
+        for func_name, (params, body) in functions.items():
+            if len(set(params)) != len(params):
+                raise BytecodeError(
+                    f"Duplicate parameter in function '{func_name}'"
+                )
+            func = self.decode(body, constants, name=func_name)
+            func.params = tuple(params)
+            func.varnames = list(params)
+            func.functions = code.functions
+            code.functions[func_name] = func
+        
+        return code
+    
+    @staticmethod
+    def decode_literal(text: str):
+        """
+        Convert literal text to a Python value.
+
+        Integers (including negative ones) and floats are
+        recognised; double-quoted text is a string literal
+        and may contain spaces and escapes. Anything else is
+        kept as a bare string.
+        """
+        if len(text) >= 2 and text[0] == '"' and text[-1] == '"':
+            try:
+                return ast.literal_eval(text)
+            except (ValueError, SyntaxError):
+                return text[1:-1]
+        try:
+            return int(text)
+        except ValueError:
+            pass
+        try:
+            return float(text)
+        except ValueError:
+            return text
+    
+    @staticmethod
+    def encode_literal(value) -> str:
+        """
+        Inverse of decode_literal: literal text for a value.
+        """
+        if type(value) in (int, float):
+            return repr(value)
+        if type(value) is str:
+            return json.dumps(value, ensure_ascii=False)
+        
+        raise BytecodeError(
+            f"Constant has no literal form: {value!r}"
+        )
@@ -39,7 +39,15 @@ metadata used by the parser and execution engine.
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
-from typing import Dict, Callable, List, Optional
+from typing import Dict, Callable, List, Optional, Tuple
+
+
+# Operand kinds
+CONST = "const"     # literal, decoded into the constants pool
+NAME = "name"       # variable name
+TARGET = "target"   # instruction index (jump target)
+COUNT = "count"     # integer count (e.g. arguments)
+SLOT = "slot"       # local variable slot (assigned by the resolver)
 
 
 # --------------------------------------------------
@@ -50,15 +58,55 @@ class Instruction:
     Represents a single VM instruction.
     """
 
+    __slots__ = (
+        "name",
+        "operand_count",
+        "description",
+        "number",
+        "operand_kinds",
+        "pops",
+        "pushes",
+    )
+
     def __init__(
             self,
             name: str,
             operand_count: int = 0,
             description: Optional[str] = None,
+            number: int = -1,
+            operand_kinds: Tuple[str, ...] = (),
+            pops: int = 0,
+            pushes: int = 0,
         ):
         self.name = name
         self.operand_count = operand_count
         self.description = description or ""
+        # Stable integer opcode used by the binary format
+        self.number = number
+        self.operand_kinds = operand_kinds
+        # Fixed stack effect; COUNT operands pop that many more
+        self.pops = pops
+        self.pushes = pushes
+    
+    @property
+    def is_jump(self) -> bool:
+        """
+        True if the first operand is a jump target.
+        """
+        return self.operand_kinds[:1] == (TARGET,)
+    
+    def stack_effect(self, operands) -> Tuple[int, int]:
+        """
+        Return (pops, pushes) for this instruction with the
+        given operands.
+        """
+        pops = self.pops
+
+        for kind, operand in zip(self.operand_kinds, operands):
+            if kind == COUNT:
+                pops += int(operand)
+        
+        return pops, self.pushes
     
     def __repr__(self) -> str:
         return (f"Instruction(name={self.name}, "
@@ -72,86 +120,257 @@ INSTRUCTION_SET: Dict[str, Instruction] = {
     # Data operations
     "LOAD_CONST": Instruction(
         name="LOAD_CONST",
+        number=0,
         operand_count=1,
+        operand_kinds=(CONST,),
+        pushes=1,
         description="Push constant onto the operand stack",
     ),
     "LOAD_VAR": Instruction(
         name="LOAD_VAR",
+        number=1,
         operand_count=1,
+        operand_kinds=(NAME,),
+        pushes=1,
         description="Load operand value onto the stack",
     ),
     "STORE_VAR": Instruction(
         name="STORE_VAR",
+        number=2,
         operand_count=1,
+        operand_kinds=(NAME,),
+        pops=1,
         description="Store top of stack into variable",
     ),
 
     # Arithmetic operations
     "ADD": Instruction(
         name="ADD",
+        number=3,
+        pops=2,
+        pushes=1,
         description="Add top two values on the stack",
     ),
     "SUB": Instruction(
         name="SUB",
+        number=4,
+        pops=2,
+        pushes=1,
         description="Subtract top two values on the stack",
     ),
     "MUL": Instruction(
         name="MUL",
+        number=5,
+        pops=2,
+        pushes=1,
         description="Multiply top two values on the stack",
     ),
     "DIV": Instruction(
         name="DIV",
+        number=6,
+        pops=2,
+        pushes=1,
         description="Divide top two values on the stack",
     ),
 
     # Stack manipulation
     "POP_TOP": Instruction(
         name="POP_TOP",
+        number=7,
+        pops=1,
         description="Remove top of stack",
     ),
     "DUP_TOP": Instruction(
         name="DUP_TOP",
+        number=8,
+        pops=1,
+        pushes=2,
         description="Duplicate top of stack",
     ),
 
     # Control flow
     "JUMP": Instruction(
         name="JUMP",
+        number=9,
         operand_count=1,
+        operand_kinds=(TARGET,),
         description="Unconditional jump",
     ),
     "JUMP_IF_TRUE": Instruction(
         name="JUMP_IF_TRUE",
+        number=10,
         operand_count=1,
+        operand_kinds=(TARGET,),
+        pops=1,
         description="Jump if condition is true",
     ),
     "JUMP_IF_FALSE": Instruction(
         name="JUMP_IF_FALSE",
+        number=11,
         operand_count=1,
+        operand_kinds=(TARGET,),
+        pops=1,
         description="Jump if condition is false",
     ),
 
     # Function calls
     "CALL_FUNC": Instruction(
         name="CALL_FUNC",
+        number=12,
         operand_count=1,
+        operand_kinds=(COUNT,),
+        pops=1,
+        pushes=1,
         description="Call function with N argumnets",
     ),
     "RETURN_VAL": Instruction(
         name="RETURN_VAL",
+        number=13,
+        pops=1,
         description="Return value from function",
     ),
 
     # Program control
     "HALT": Instruction(
         name="HALT",
+        number=14,
         description="Stop VM execution",
     ),
+
+    # Superinstructions (emitted by the peephole optimizer)
+    "INCR_VAR": Instruction(
+        name="INCR_VAR",
+        number=15,
+        operand_count=2,
+        operand_kinds=(NAME, CONST),
+        description="Add constant to variable in place",
+    ),
+    "DECR_VAR": Instruction(
+        name="DECR_VAR",
+        number=16,
+        operand_count=2,
+        operand_kinds=(NAME, CONST),
+        description="Subtract constant from variable in place",
+    ),
+    "LOAD_VAR_CONST_ADD": Instruction(
+        name="LOAD_VAR_CONST_ADD",
+        number=17,
+        operand_count=2,
+        operand_kinds=(NAME, CONST),
+        pushes=1,
+        description="Push variable plus constant",
+    ),
+    "PEEK_JUMP_IF_FALSE": Instruction(
+        name="PEEK_JUMP_IF_FALSE",
+        number=18,
+        operand_count=1,
+        operand_kinds=(TARGET,),
+        pops=1,
+        pushes=1,
+        description="Jump if top of stack is false, keeping it",
+    ),
+    "PEEK_JUMP_IF_TRUE": Instruction(
+        name="PEEK_JUMP_IF_TRUE",
+        number=19,
+        operand_count=1,
+        operand_kinds=(TARGET,),
+        pops=1,
+        pushes=1,
+        description="Jump if top of stack is true, keeping it",
+    ),
+
+    # Slot-indexed variables (emitted by the resolver)
+    "LOAD_FAST": Instruction(
+        name="LOAD_FAST",
+        number=20,
+        operand_count=1,
+        operand_kinds=(SLOT,),
+        pushes=1,
+        description="Push local variable slot",
+    ),
+    "STORE_FAST": Instruction(
+        name="STORE_FAST",
+        number=21,
+        operand_count=1,
+        operand_kinds=(SLOT,),
+        pops=1,
+        description="Store top of stack into local variable slot",
+    ),
+    "LOAD_GLOBAL": Instruction(
+        name="LOAD_GLOBAL",
+        number=22,
+        operand_count=1,
+        operand_kinds=(NAME,),
+        pushes=1,
+        description="Push global variable",
+    ),
+    "INCR_FAST": Instruction(
+        name="INCR_FAST",
+        number=23,
+        operand_count=2,
+        operand_kinds=(SLOT, CONST),
+        description="Add constant to local variable slot in place",
+    ),
+    "DECR_FAST": Instruction(
+        name="DECR_FAST",
+        number=24,
+        operand_count=2,
+        operand_kinds=(SLOT, CONST),
+        description="Subtract constant from local variable slot in place",
+    ),
+    "LOAD_FAST_CONST_ADD": Instruction(
+        name="LOAD_FAST_CONST_ADD",
+        number=25,
+        operand_count=2,
+        operand_kinds=(SLOT, CONST),
+        pushes=1,
+        description="Push local variable slot plus constant",
+    ),
+
+    # Bytecode functions
+    "MAKE_FUNCTION": Instruction(
+        name="MAKE_FUNCTION",
+        number=26,
+        operand_count=1,
+        operand_kinds=(NAME,),
+        pushes=1,
+        description="Push function defined by a .function block",
+    ),
+    "CALL": Instruction(
+        name="CALL",
+        number=27,
+        operand_count=1,
+        operand_kinds=(COUNT,),
+        pops=1,
+        pushes=1,
+        description="Call bytecode function or callable with N arguments",
+    ),
+    "TAIL_CALL": Instruction(
+        name="TAIL_CALL",
+        number=28,
+        operand_count=1,
+        operand_kinds=(COUNT,),
+        pops=1,
+        description="CALL then RETURN_VAL, reusing the current frame",
+    ),
 }
 
 # Public opcode loopup (used by parser)
 OPCODES = set(INSTRUCTION_SET.keys())
 
+# Opcodes whose first operand is a jump target
+JUMP_OPCODES = {
+    name for name, instr in INSTRUCTION_SET.items() if instr.is_jump
+}
+
+# Opcodes given an inline lookup cache once verified
+CACHED_OPCODES = {"LOAD_VAR", "LOAD_GLOBAL"}
+
+# Integer opcode -> name (used by the binary loader)
+OPCODE_NAMES: Dict[int, str] = {
+    instr.number: name for name, instr in INSTRUCTION_SET.items()
+}
+
 def get_instruction(name: str) -> Instruction:
     """
     Retrieve instruction metadata by opcode name.
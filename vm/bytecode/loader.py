@@ -40,9 +40,14 @@ reads and normalizes input for the parser.
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
+import mmap
 import os
 from typing import List
 
+from vm.errors import BytecodeError
+from .binary import MAGIC, load_code
+from .code import CodeObject
+
 
 # --------------------------------------------------
 # bytecode loader
@@ -91,3 +96,32 @@ class BytecodeLoader:
             instructions.append(line)
 
         return instructions
+    
+    def is_binary(self, path: str) -> bool:
+        """
+        Check whether a file holds a binary (.pvmc) image.
+        """
+        if "\n" in path or not os.path.isfile(path):
+            return False
+        
+        with open(path, "rb") as file:
+            return file.read(len(MAGIC)) == MAGIC
+    
+    def load_binary(self, path: str) -> CodeObject:
+        """
+        Load a binary (.pvmc) image as a decoded CodeObject.
+
+        The file is memory-mapped and decoded in place; no
+        per-instruction strings are created.
+        """
+        with open(path, "rb") as file:
+            try:
+                mapped = mmap.mmap(file.fileno(), 0,
+                                   access=mmap.ACCESS_READ)
+            except ValueError:
+                raise BytecodeError(f"Empty bytecode file: {path}")
+        
+        try:
+            return load_code(mapped, name=path)
+        finally:
+            mapped.close()
@@ -35,15 +35,42 @@ Bytecode Parser.
 
 Transforms raw bytecode lines into structured
 instructions representations usable by the VM.
+
+A program may define functions between directives:
+
+    .function name param1 param2
+        ...
+    .end
+
+Jump targets inside a function body count from the body's
+first instruction.
 """
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
-from typing import List, Tuple
+import re
+from typing import Dict, List, Tuple
 
 from .instructions import OPCODES
 
 
+# Function definition directives
+FUNCTION_DIRECTIVE = ".function"
+END_DIRECTIVE = ".end"
+DIRECTIVES = {FUNCTION_DIRECTIVE, END_DIRECTIVE}
+
+
+# Quoted string literals are kept whole (quotes included)
+_TOKEN = re.compile(r'"(?:[^"\\]|\\.)*"|\S+')
+
+
+def tokenize(line: str) -> List[str]:
+    """
+    Split an instruction line into opcode and operands.
+    """
+    return _TOKEN.findall(line)
+
+
 # --------------------------------------------------
 # bytecode parser
 # --------------------------------------------------
@@ -64,7 +91,7 @@ class BytecodeParser:
         parsed_instructions = []
 
         for index, line in enumerate(raw_instructions):
-            parts = line.split()
+            parts = tokenize(line)
             opcode = parts[0]
             operands = parts[1:]
 
@@ -77,3 +104,54 @@ class BytecodeParser:
             parsed_instructions.append((opcode, operands))
         
         return parsed_instructions
+    
+    def parse_program(self, raw_instructions: List[str]):
+        """
+        Parse a program that may contain function blocks.
+
+        Returns (main, functions): the parsed top-level
+        instructions and a dict mapping each function name
+        to (params, parsed body).
+        """
+        main = []
+        functions: Dict[str, Tuple[List[str], list]] = {}
+        body = main
+
+        for index, line in enumerate(raw_instructions):
+            parts = tokenize(line)
+            opcode = parts[0]
+
+            if opcode == FUNCTION_DIRECTIVE:
+                if body is not main or len(parts) < 2:
+                    raise ValueError(
+                        f"Invalid {FUNCTION_DIRECTIVE} at line {index}"
+                    )
+                if parts[1] in functions:
+                    raise ValueError(
+                        f"Duplicate function '{parts[1]}' at line "
+                        f"{index}"
+                    )
+                body = []
+                functions[parts[1]] = (parts[2:], body)
+                continue
+            
+            if opcode == END_DIRECTIVE:
+                if body is main:
+                    raise ValueError(
+                        f"{END_DIRECTIVE} without {FUNCTION_DIRECTIVE} "
+                        f"at line {index}"
+                    )
+                body = main
+                continue
+            
+            if opcode not in OPCODES:
+                raise ValueError(
+                    f"Invalid opcode '{opcode}' at line {index}"
+                )
+            
+            body.append((opcode, parts[1:]))
+        
+        if body is not main:
+            raise ValueError(f"Missing {END_DIRECTIVE}")
+        
+        return main, functions
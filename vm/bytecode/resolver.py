@@ -0,0 +1,126 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+# --------------------------------------------------
+# resolver MODULE
+# --------------------------------------------------
+"""
+Bytecode Resolver.
+
+Assigns every variable a function stores (its parameters
+included) to an integer slot and rewrites its name-based
+instructions into the slot-indexed ``*_FAST`` forms, so
+function frames keep those variables in a list. Names a
+function only reads are left to the globals and loaded with
+LOAD_GLOBAL.
+
+Module code stays name-based: its variables are the globals,
+which host functions, other tasks and other coroutines may
+read and write while it runs. Only names it never stores
+are rewritten to LOAD_GLOBAL.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+from .code import CodeObject
+
+
+# Name-based opcodes and their slot-indexed forms
+FAST_FORMS = {
+    "LOAD_VAR": "LOAD_FAST",
+    "STORE_VAR": "STORE_FAST",
+    "INCR_VAR": "INCR_FAST",
+    "DECR_VAR": "DECR_FAST",
+    "LOAD_VAR_CONST_ADD": "LOAD_FAST_CONST_ADD",
+}
+
+# Opcodes that assign their variable operand
+_STORES = {"STORE_VAR", "INCR_VAR", "DECR_VAR"}
+
+
+# --------------------------------------------------
+# bytecode resolver
+# --------------------------------------------------
+class BytecodeResolver:
+    """
+    Rewrites variable access into slot-indexed form.
+    """
+
+    def resolve(self, code: CodeObject) -> CodeObject:
+        """
+        Resolve ``code`` and its functions in place and
+        return it.
+
+        Must run before verification; verified code is left
+        untouched.
+        """
+        if code.verified:
+            return code
+        
+        for func in code.functions.values():
+            if func is not code and not func.verified:
+                self._resolve(func)
+        
+        self._resolve(code)
+        return code
+    
+    def _resolve(self, code: CodeObject):
+        """
+        Resolve one code object.
+        """
+        instructions = code.instructions
+        stored = {operands[0] for opcode, operands in instructions
+                  if opcode in _STORES}
+
+        if not code.is_function:
+            for index, (opcode, operands) in enumerate(instructions):
+                if opcode == "LOAD_VAR" and operands[0] not in stored:
+                    instructions[index] = ("LOAD_GLOBAL", list(operands))
+            return
+        
+        slots = {name: slot for slot, name in enumerate(code.varnames)}
+
+        for opcode, operands in instructions:
+            if opcode in _STORES and operands[0] not in slots:
+                slots[operands[0]] = len(slots)
+        
+        for index, (opcode, operands) in enumerate(instructions):
+            fast = FAST_FORMS.get(opcode)
+
+            if fast is None:
+                continue
+            
+            name = operands[0]
+
+            if name in slots:
+                instructions[index] = (fast, [slots[name]]
+                                       + list(operands[1:]))
+            elif opcode == "LOAD_VAR":
+                instructions[index] = ("LOAD_GLOBAL", list(operands))
+        
+        code.varnames = list(slots)
@@ -0,0 +1,234 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# verifier MODULE
+# --------------------------------------------------
+"""
+Bytecode Verifier.
+
+Runs once per code object before execution. Every jump
+target, count, slot and constant operand is resolved to an
+integer, checked against its bounds where it has one, and
+operand counts are checked against the instruction set.
+A stack-effect analysis then proves that no path can
+underflow or overflow the operand stack, and name-loading
+instructions get inline lookup caches. Verified code lets
+the engine take unchecked fast paths.
+
+Function code objects are verified along with the module;
+a function may not HALT or run past its last instruction.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+from config.config import MAX_STACK_SIZE
+from vm.errors import VerificationError
+from vm.memory import InlineCache
+from .code import CodeObject
+from .instructions import (
+    CACHED_OPCODES,
+    CONST,
+    COUNT,
+    INSTRUCTION_SET,
+    JUMP_OPCODES,
+    SLOT,
+    TARGET,
+)
+
+
+# Instructions that never fall through to the next one
+_NO_FALLTHROUGH = {"JUMP", "HALT", "RETURN_VAL", "TAIL_CALL"}
+
+
+# --------------------------------------------------
+# bytecode verifier
+# --------------------------------------------------
+class BytecodeVerifier:
+    """
+    Validates a code object and marks it as verified.
+    """
+
+    def verify(self, code: CodeObject) -> CodeObject:
+        """
+        Verify ``code`` and its functions in place and return
+        it.
+
+        Raises VerificationError naming the offending
+        instruction index.
+        """
+        for func in code.functions.values():
+            if func is not code:
+                self._verify(func)
+        
+        return self._verify(code)
+    
+    def _verify(self, code: CodeObject) -> CodeObject:
+        """
+        Verify a single code object.
+        """
+        if code.verified:
+            return code
+        
+        instructions = code.instructions
+        count = len(instructions)
+        slots = len(code.varnames)
+        constants = len(code.constants)
+
+        for index, (opcode, operands) in enumerate(instructions):
+            instr = INSTRUCTION_SET.get(opcode)
+
+            if instr is None:
+                raise VerificationError(
+                    f"Invalid opcode '{opcode}' at instruction {index}"
+                )
+            if len(operands) != instr.operand_count:
+                raise VerificationError(
+                    f"{opcode} expects {instr.operand_count} "
+                    f"operand(s) at instruction {index}"
+                )
+            if opcode == "MAKE_FUNCTION" and (
+                    operands[0] not in code.functions):
+                raise VerificationError(
+                    f"Unknown function '{operands[0]}' at instruction "
+                    f"{index}"
+                )
+            if opcode == "HALT" and code.is_function:
+                raise VerificationError(
+                    f"HALT inside function '{code.name}' at "
+                    f"instruction {index}"
+                )
+            if opcode == "TAIL_CALL" and not code.is_function:
+                raise VerificationError(
+                    f"TAIL_CALL outside a function at instruction "
+                    f"{index}"
+                )
+            
+            resolved = list(operands)
+
+            for position, kind in enumerate(instr.operand_kinds):
+                if kind not in (TARGET, COUNT, SLOT, CONST):
+                    continue
+                
+                try:
+                    value = int(operands[position])
+                except (TypeError, ValueError):
+                    raise VerificationError(
+                        f"Non-integer operand '{operands[position]}' "
+                        f"at instruction {index}"
+                    ) from None
+                
+                if kind == TARGET and not 0 <= value < count:
+                    raise VerificationError(
+                        f"Invalid jump target {value} at instruction "
+                        f"{index}"
+                    )
+                if kind == SLOT and not 0 <= value < slots:
+                    raise VerificationError(
+                        f"Invalid variable slot {value} at instruction "
+                        f"{index}"
+                    )
+                if kind == CONST and not 0 <= value < constants:
+                    raise VerificationError(
+                        f"Invalid constant index {value} at instruction "
+                        f"{index}"
+                    )
+                if kind == COUNT and value < 0:
+                    raise VerificationError(
+                        f"Negative count {value} at instruction {index}"
+                    )
+                resolved[position] = value
+            
+            instructions[index] = (opcode, resolved)
+        
+        code.max_stack = self._max_stack(instructions, code)
+        code.caches = [
+            InlineCache() if opcode in CACHED_OPCODES else None
+            for opcode, _ in instructions
+        ]
+        code.verified = True
+        return code
+    
+    def _max_stack(self, instructions, code=None) -> int:
+        """
+        Compute the operand stack depth before every reachable
+        instruction and return the maximum.
+
+        Every path reaching an instruction must agree on its
+        depth, so the stack can never grow without bound.
+        Function code must end every path with RETURN_VAL or
+        TAIL_CALL.
+        """
+        function = code is not None and code.is_function
+        count = len(instructions)
+        depths = [None] * count
+        pending = [(0, 0)]
+        highest = 0
+
+        while pending:
+            index, depth = pending.pop()
+
+            if index >= count:
+                if function:
+                    raise VerificationError(
+                        f"Function '{code.name}' can end without "
+                        f"RETURN_VAL"
+                    )
+                continue
+            if depths[index] is not None:
+                if depths[index] != depth:
+                    raise VerificationError(
+                        f"Inconsistent stack depth at instruction "
+                        f"{index} ({depths[index]} vs {depth})"
+                    )
+                continue
+            
+            depths[index] = depth
+            opcode, operands = instructions[index]
+            pops, pushes = INSTRUCTION_SET[opcode].stack_effect(operands)
+
+            if depth < pops:
+                raise VerificationError(
+                    f"Stack underflow at instruction {index}"
+                )
+            
+            depth += pushes - pops
+
+            if depth > MAX_STACK_SIZE:
+                raise VerificationError(
+                    f"Stack overflow at instruction {index}"
+                )
+            highest = max(highest, depth)
+            
+            if opcode in JUMP_OPCODES:
+                pending.append((operands[0], depth))
+            if opcode not in _NO_FALLTHROUGH:
+                pending.append((index + 1, depth))
+        
+        return highest
@@ -48,6 +48,8 @@ class CallStack:
     Manages execution frames.
     """
 
+    __slots__ = ("_frames",)
+
     def __init__(self):
         self._frames = []
     
@@ -79,3 +81,6 @@ class CallStack:
     
     def is_empty(self) -> bool:
         return not self._frames
+    
+    def __len__(self):
+        return len(self._frames)
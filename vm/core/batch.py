@@ -0,0 +1,397 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# batch MODULE
+# --------------------------------------------------
+"""
+Batch execution of many bytecode programs.
+
+Programs are spread over worker processes. Every worker
+keeps one warm VirtualMachine whose host globals are set up
+once and frozen; each program runs against a fresh overlay
+of them, so programs never see each other's writes. Paths
+go out in chunks to amortize inter-process traffic, results
+come back as plain tuples, and a failing program only
+fails its own result - also when it kills or hangs its
+worker. The pool is then replaced, the chunk at fault is
+rerun a program at a time and every other unfinished chunk
+goes to the new pool.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import multiprocessing
+import os
+import signal
+import time
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from config.config import (
+    BATCH_CHUNK_SIZE, BATCH_TIMEOUT, MEMORY_BUDGET, OPTIMIZE_BYTECODE
+)
+from vm.core.vm import VirtualMachine
+
+
+# Global values returned as they are; others come back as repr()
+COMPACT_TYPES = frozenset({int, float, str, bool, type(None)})
+
+# Seconds between checks of running chunks against the timeout
+POLL_INTERVAL = 0.05
+
+WORKER_DIED = "BrokenProcessPool: Worker process died"
+
+
+# --------------------------------------------------
+# batch result
+# --------------------------------------------------
+class BatchResult:
+    """
+    Outcome of one program: the globals it wrote, or the
+    error that stopped it.
+    """
+
+    __slots__ = ("path", "ok", "globals", "error")
+
+    def __init__(self, path: str, ok: bool,
+                 globals_: Optional[dict] = None,
+                 error: Optional[str] = None):
+        self.path = path
+        self.ok = ok
+        self.globals = globals_
+        self.error = error
+    
+    def __repr__(self) -> str:
+        outcome = self.globals if self.ok else self.error
+        return f"BatchResult({self.path}, {outcome!r})"
+
+
+def compact(values: dict) -> dict:
+    """
+    Picklable form of a program's globals.
+    """
+    return {
+        name: value if type(value) in COMPACT_TYPES else repr(value)
+        for name, value in values.items()
+    }
+
+
+# --------------------------------------------------
+# worker
+# --------------------------------------------------
+class _Worker:
+    """
+    Warm machine of one worker process.
+    """
+
+    def __init__(self, setup, backend, optimize, memory_budget):
+        self.vm = VirtualMachine(optimize=optimize,
+                                 memory_budget=memory_budget)
+        
+        if setup is not None:
+            setup(self.vm)
+        self.vm.freeze_globals()
+        self.backend = backend
+        self.overlay = None
+    
+    def run_chunk(self, paths: List[str]) -> list:
+        return [self.run(path) for path in paths]
+    
+    def run(self, path: str) -> tuple:
+        try:
+            with open(path, "r", encoding="utf-8") as src:
+                source = src.read()
+            
+            self.overlay = self.vm.run_overlay(
+                source, self.overlay, backend=self.backend
+            )
+            return (path, True, compact(self.overlay.changes()), None)
+        except Exception as exc:
+            return (path, False, None, f"{type(exc).__name__}: {exc}")
+
+
+# Set in each worker process by _init_worker
+_worker = None
+_started = None
+
+
+def _init_worker(started, *args):
+    global _worker, _started
+    _worker = _Worker(*args)
+    _started = started
+
+
+def _run_chunk(index: int, paths: List[str]) -> list:
+    # Reported before running, so a chunk's timeout starts
+    # when it does and a dead worker names its chunk
+    _started.put((index, os.getpid()))
+    return _worker.run_chunk(paths)
+
+
+class _TrackingContext:
+    """
+    Multiprocessing context that keeps the worker processes
+    it starts, so that hung ones can be terminated.
+    """
+
+    def __init__(self):
+        self._context = multiprocessing.get_context()
+        self.processes = []
+    
+    def Process(self, *args, **kwargs):
+        process = self._context.Process(*args, **kwargs)
+        self.processes.append(process)
+        return process
+    
+    def __getattr__(self, name):
+        return getattr(self._context, name)
+
+
+def _stop(pool: ProcessPoolExecutor, context: _TrackingContext) -> None:
+    """
+    Shut down a pool, killing workers stuck in a program.
+
+    A running task cannot be cancelled, so a hung worker
+    has to be terminated for the pool to go away.
+    """
+    pool.shutdown(wait=False, cancel_futures=True)
+
+    for process in context.processes:
+        if process.is_alive():
+            process.terminate()
+        process.join()
+
+
+def _drain(started) -> List[Tuple[int, int]]:
+    """
+    (chunk index, worker pid) of the chunks reported started.
+    """
+    reports = []
+
+    while not started.empty():
+        reports.append(started.get())
+    return reports
+
+
+# --------------------------------------------------
+# batch runner
+# --------------------------------------------------
+class BatchRunner:
+    """
+    Runs bytecode programs across a process pool.
+
+    ``setup`` is called with each worker's VirtualMachine
+    before its globals are frozen, to preload host functions
+    and values; it must be picklable (a module-level
+    function). ``timeout`` bounds the seconds a program may
+    run, counted from when its chunk starts. If a worker dies
+    or a chunk overruns, the pool is replaced: that chunk is
+    rerun a program at a time, so that only the culprit
+    fails, and the other unfinished chunks go to the new
+    pool. With one worker and no timeout, programs run in
+    this process.
+    """
+
+    def __init__(self, workers: Optional[int] = None,
+                 chunk_size: int = BATCH_CHUNK_SIZE,
+                 setup: Optional[Callable] = None,
+                 backend: str = None,
+                 optimize: bool = OPTIMIZE_BYTECODE,
+                 memory_budget: int = MEMORY_BUDGET,
+                 timeout: Optional[float] = BATCH_TIMEOUT):
+        # None: one worker per CPU
+        self.workers = workers
+        self.chunk_size = chunk_size
+        self.setup = setup
+        self.backend = backend
+        self.optimize = optimize
+        self.memory_budget = memory_budget
+        self.timeout = timeout
+    
+    def run(self, paths: Iterable[str]) -> List[BatchResult]:
+        """
+        Run every program; results keep the input order.
+        """
+        paths = list(paths)
+        chunks = [
+            paths[start:start + self.chunk_size]
+            for start in range(0, len(paths), self.chunk_size)
+        ]
+
+        if self.workers == 1 and self.timeout is None:
+            outcomes = list(map(_Worker(*self._args()).run_chunk,
+                                chunks))
+        else:
+            finished = {}
+            pending = list(range(len(chunks)))
+
+            while pending:
+                done, failed = self._run_pooled(chunks, pending,
+                                                self.workers)
+                if not done and not failed:
+                    # The pool broke before any chunk ran
+                    failed = dict.fromkeys(pending)
+                
+                finished.update(done)
+
+                for index in failed:
+                    finished[index] = self._run_isolated(chunks[index])
+                pending = [index for index in pending
+                           if index not in finished]
+            outcomes = [finished[index] for index in range(len(chunks))]
+        
+        return [BatchResult(*r) for chunk in outcomes for r in chunk]
+    
+    def _args(self) -> tuple:
+        return (self.setup, self.backend, self.optimize,
+                self.memory_budget)
+    
+    def _limit(self, chunk: List[str]) -> Optional[float]:
+        if self.timeout is None:
+            return None
+        return self.timeout * len(chunk)
+    
+    def _run_pooled(self, chunks: List[List[str]], indices: List[int],
+                    workers: Optional[int]
+                    ) -> Tuple[Dict[int, list], Dict[int, str]]:
+        """
+        Run the chunks at ``indices`` on one pool until they
+        finish, the pool breaks or a chunk overruns. Returns
+        the outcomes of finished chunks and the error of each
+        chunk found at fault; other chunks did not finish.
+        """
+        context = _TrackingContext()
+        started = context.SimpleQueue()
+        pool = ProcessPoolExecutor(max_workers=workers,
+                                   mp_context=context,
+                                   initializer=_init_worker,
+                                   initargs=(started,) + self._args())
+        futures = {
+            pool.submit(_run_chunk, index, chunks[index]): index
+            for index in indices
+        }
+        pending = set(futures)
+        poll = None if self.timeout is None else POLL_INTERVAL
+        running, deadlines = {}, {}
+        done, failed = {}, {}
+        broken = False
+
+        try:
+            while pending and not failed and not broken:
+                now = time.monotonic()
+
+                for index, pid in _drain(started):
+                    running[index] = pid
+
+                    # A short chunk may be reported after it finished
+                    if poll is not None and index not in done:
+                        deadlines[index] = now + self._limit(chunks[index])
+                
+                finished, pending = wait(pending, timeout=poll,
+                                         return_when=FIRST_COMPLETED)
+                
+                for future in finished:
+                    index = futures[future]
+                    deadlines.pop(index, None)
+
+                    try:
+                        done[index] = future.result()
+                    except BrokenProcessPool:
+                        broken = True
+                
+                now = time.monotonic()
+                failed = {
+                    index: f"TimeoutError: Program ran longer than "
+                           f"{self.timeout}s"
+                    for index, deadline in deadlines.items()
+                    if deadline < now
+                }
+            
+            if broken:
+                for index, pid in _drain(started):
+                    running[index] = pid
+                failed.update(self._dead_chunks(context, running, done))
+        finally:
+            if failed or broken:
+                _stop(pool, context)
+            else:
+                pool.shutdown()
+            started.close()
+        
+        return done, failed
+    
+    def _dead_chunks(self, context: _TrackingContext,
+                     running: Dict[int, int],
+                     done: Dict[int, list]) -> Dict[int, str]:
+        """
+        Chunks whose worker died on its own, rather than being
+        terminated with the broken pool. If that cannot be told,
+        every chunk that was running is suspect.
+        """
+        processes = {process.pid: process
+                     for process in context.processes}
+        suspects = [index for index in running if index not in done]
+        dead = []
+
+        for index in suspects:
+            process = processes.get(running[index])
+
+            if process is not None and \
+                    process.exitcode not in (None, -signal.SIGTERM):
+                dead.append(index)
+        
+        return dict.fromkeys(dead or suspects, WORKER_DIED)
+    
+    def _run_isolated(self, chunk: List[str]) -> list:
+        """
+        Rerun a chunk one program at a time on a single
+        worker, failing only the programs that kill or hang
+        it.
+        """
+        singles = [[path] for path in chunk]
+        finished = {}
+        pending = list(range(len(chunk)))
+
+        while pending:
+            done, failed = self._run_pooled(singles, pending, 1)
+
+            if not done and not failed:
+                failed = dict.fromkeys(pending, WORKER_DIED)
+            
+            finished.update(done)
+
+            for index, error in failed.items():
+                finished[index] = [(chunk[index], False, None, error)]
+            pending = [index for index in pending
+                       if index not in finished]
+        
+        return [r for index in range(len(chunk))
+                for r in finished[index]]
@@ -0,0 +1,531 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# compiler MODULE
+# --------------------------------------------------
+"""
+Closure-compiling execution backend.
+
+A code object is compiled once into one Python function per
+basic block. Within a block the operand stack is tracked at
+compile time, so constants are bound in advance and
+intermediate values live in Python locals; only values that
+survive the block are pushed onto the frame's operand stack.
+
+Each block function has the signature
+``block(stack_list, frame, callstack) -> next_ip`` and the
+engine simply chains them until the IP leaves the program.
+Its ``line_ips`` attribute maps each source line (relative
+to the ``def``) to the instruction it was generated for, so
+errors are reported at the failing instruction.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+from config.config import MAX_STACK_SIZE
+from vm.bytecode.instructions import JUMP_OPCODES
+from vm.core.engine import raise_execution_error, raise_unbound
+from vm.errors import (
+    RuntimeExecutionError,
+    StackOverflowError,
+)
+from vm.stack import UNBOUND
+
+
+# Opcodes that end a basic block
+_BRANCHES = JUMP_OPCODES
+_TERMINATORS = {"JUMP", "HALT", "RETURN_VAL", "TAIL_CALL"}
+
+_BINARY_OPS = {
+    "ADD": "+",
+    "SUB": "-",
+    "MUL": "*",
+    "DIV": "/",
+}
+
+
+class _Unsupported(Exception):
+    """
+    Raised when a code object uses an opcode the compiler
+    has no generator for.
+    """
+
+
+# --------------------------------------------------
+# block builder
+# --------------------------------------------------
+class _Block:
+    """
+    Source generator for a single basic block.
+    """
+
+    def __init__(self, start: int, checked: bool = True):
+        self.start = start
+        self.checked = checked
+        self.lines = []
+        # Instruction index each line was generated for
+        self.ips = []
+        self.values = []
+        self.temps = 0
+        self.uses = set()
+    
+    def temp(self, expr: str) -> str:
+        name = f"t{self.temps}"
+        self.temps += 1
+        self.lines.append(f"{name} = {expr}")
+        return name
+    
+    def push(self, expr: str):
+        self.values.append(expr)
+    
+    def pop(self) -> str:
+        if self.values:
+            return self.values.pop()
+        
+        self.uses.add("pop")
+        return self.temp("pop()")
+    
+    def flush(self):
+        """
+        Move compile-time stack values onto the real stack.
+        """
+        if not self.values:
+            return
+        
+        if len(self.values) == 1:
+            self.lines.append(f"s.append({self.values[0]})")
+        else:
+            self.lines.append(f"s.extend(({', '.join(self.values)},))")
+        
+        if self.checked:
+            self.lines.append(
+                f"if len(s) > {MAX_STACK_SIZE}: "
+                f"raise StackOverflowError('Operand stack overflow')"
+            )
+        self.values.clear()
+    
+    def source(self) -> str:
+        prologue = []
+
+        if "pop" in self.uses:
+            prologue.append("pop = s.pop")
+        if "get" in self.uses:
+            prologue.append("get = frame.locals.get")
+        if "set" in self.uses:
+            prologue.append("set_ = frame.locals.set")
+        if "fast" in self.uses:
+            prologue.append("fast = frame.fast")
+        if "global" in self.uses:
+            prologue.append("get_global = frame.globals.get")
+        
+        body = prologue + self.lines
+        # The def line and the prologue belong to no instruction
+        self.line_ips = [None] * (1 + len(prologue)) + self.ips
+        return (f"def b{self.start}(s, frame, callstack):\n"
+                + "".join(f"    {line}\n" for line in body))
+
+
+# --------------------------------------------------
+# closure compiler
+# --------------------------------------------------
+class ClosureCompiler:
+    """
+    Compiles a CodeObject into a table of block functions.
+    """
+
+    def compile(self, code):
+        """
+        Compile ``code``; returns a list indexed by IP holding
+        the block function for every block leader, or None if
+        the code uses an opcode the compiler cannot handle.
+        """
+        instructions = code.instructions
+        count = len(instructions)
+        leaders = self._leaders(instructions)
+        namespace = {
+            "RuntimeExecutionError": RuntimeExecutionError,
+            "StackOverflowError": StackOverflowError,
+            "_return": _return,
+            "raise_unbound": raise_unbound,
+            "UNBOUND": UNBOUND,
+        }
+        sources = []
+        built = []
+
+        for index, start in enumerate(leaders):
+            end = leaders[index + 1] if index + 1 < len(leaders) \
+                else count
+            # Verified code has a proven stack bound
+            block = _Block(start, checked=not code.verified)
+
+            try:
+                self._emit_block(block, instructions, start, end,
+                                 count, code, namespace)
+            except _Unsupported:
+                return None
+            
+            sources.append(block.source())
+            built.append(block)
+        
+        exec(compile("\n".join(sources), f"<pvm:{code.name}>",
+                     "exec"), namespace)
+        
+        blocks = [None] * count
+        for block in built:
+            func = blocks[block.start] = namespace[f"b{block.start}"]
+            func.line_ips = block.line_ips
+        
+        return blocks
+    
+    def _leaders(self, instructions):
+        leaders = {0} if instructions else set()
+
+        for index, (opcode, operands) in enumerate(instructions):
+            if opcode in _BRANCHES:
+                target = int(operands[0])
+                if 0 <= target < len(instructions):
+                    leaders.add(target)
+            if opcode in _BRANCHES or opcode in _TERMINATORS:
+                if index + 1 < len(instructions):
+                    leaders.add(index + 1)
+        
+        return sorted(leaders)
+    
+    def _emit_block(self, block, instructions, start, end, count,
+                    code, namespace):
+        for index in range(start, end):
+            opcode, operands = instructions[index]
+            emit = getattr(self, f"_emit_{opcode.lower()}", None)
+
+            if emit is None:
+                raise _Unsupported(opcode)
+            
+            emitted = len(block.lines)
+            done = emit(block, operands, index, count, code, namespace)
+            block.ips.extend([index] * (len(block.lines) - emitted))
+
+            if done:
+                return
+        
+        block.flush()
+        block.lines.append(f"return {end}")
+        block.ips.extend([end - 1] * (len(block.lines) - len(block.ips)))
+    
+    # -----------------------------------
+    # opcode generators
+    # -----------------------------------
+    # Each generator appends source to the block and returns
+    # True when it has emitted the block's final return.
+
+    def _emit_load_const(self, block, operands, index, count, code,
+                         namespace):
+        name = f"k{operands[0]}"
+        namespace[name] = code.constants.get(operands[0])
+        block.push(name)
+    
+    def _emit_load_var(self, block, operands, index, count, code,
+                       namespace):
+        if code.verified:
+            block.push(self._cached(block, "frame.locals", operands[0],
+                                    index, code, namespace))
+            return
+        
+        block.uses.add("get")
+        block.push(block.temp(f"get({operands[0]!r})"))
+    
+    def _emit_store_var(self, block, operands, *_):
+        value = block.pop()
+        block.uses.add("set")
+        block.lines.append(f"set_({operands[0]!r}, {value})")
+    
+    def _emit_load_fast(self, block, operands, *_):
+        block.push(self._fast(block, operands[0]))
+    
+    def _emit_store_fast(self, block, operands, *_):
+        value = block.pop()
+        block.uses.add("fast")
+        block.lines.append(f"fast[{operands[0]}] = {value}")
+    
+    def _emit_load_global(self, block, operands, index, count, code,
+                          namespace):
+        if code.verified:
+            block.push(self._cached(block, "frame.globals", operands[0],
+                                    index, code, namespace))
+            return
+        
+        block.uses.add("global")
+        block.push(block.temp(f"get_global({operands[0]!r})"))
+    
+    def _cached(self, block, source, name, index, code, namespace):
+        """
+        Load ``name`` through the instruction's inline cache.
+        """
+        namespace[f"c{index}"] = code.caches[index]
+        return block.temp(f"c{index}.lookup({source}, {name!r})")
+    
+    def _emit_incr_fast(self, block, operands, index, count, code,
+                        namespace):
+        self._emit_update_fast(block, operands, "+", code, namespace)
+    
+    def _emit_decr_fast(self, block, operands, index, count, code,
+                        namespace):
+        self._emit_update_fast(block, operands, "-", code, namespace)
+    
+    def _emit_update_fast(self, block, operands, symbol, code,
+                          namespace):
+        slot, const = operands
+        namespace[f"k{const}"] = code.constants.get(const)
+        value = self._fast(block, slot)
+        block.lines.append(f"fast[{slot}] = {value} {symbol} k{const}")
+    
+    def _emit_load_fast_const_add(self, block, operands, index, count,
+                                  code, namespace):
+        slot, const = operands
+        namespace[f"k{const}"] = code.constants.get(const)
+        value = self._fast(block, slot)
+        block.push(block.temp(f"{value} + k{const}"))
+    
+    def _fast(self, block, slot) -> str:
+        """
+        Read a variable slot into a temp, checking it is bound.
+        """
+        block.uses.add("fast")
+        value = block.temp(f"fast[{slot}]")
+        block.lines.append(
+            f"if {value} is UNBOUND: raise_unbound(frame, {slot})"
+        )
+        return value
+    
+    def _emit_binary(self, block, symbol):
+        b = block.pop()
+        a = block.pop()
+        block.push(block.temp(f"{a} {symbol} {b}"))
+    
+    def _emit_add(self, block, *_):
+        self._emit_binary(block, _BINARY_OPS["ADD"])
+    
+    def _emit_sub(self, block, *_):
+        self._emit_binary(block, _BINARY_OPS["SUB"])
+    
+    def _emit_mul(self, block, *_):
+        self._emit_binary(block, _BINARY_OPS["MUL"])
+    
+    def _emit_div(self, block, *_):
+        self._emit_binary(block, _BINARY_OPS["DIV"])
+    
+    def _emit_pop_top(self, block, *_):
+        block.pop()
+    
+    def _emit_dup_top(self, block, *_):
+        if block.values:
+            block.push(block.values[-1])
+        else:
+            block.push(block.temp("s[-1]"))
+    
+    def _emit_incr_var(self, block, operands, index, count, code,
+                       namespace):
+        self._emit_update(block, operands, "+", code, namespace)
+    
+    def _emit_decr_var(self, block, operands, index, count, code,
+                       namespace):
+        self._emit_update(block, operands, "-", code, namespace)
+    
+    def _emit_update(self, block, operands, symbol, code, namespace):
+        name, const = operands
+        namespace[f"k{const}"] = code.constants.get(const)
+        block.uses.update(("get", "set"))
+        block.lines.append(
+            f"set_({name!r}, get({name!r}) {symbol} k{const})"
+        )
+    
+    def _emit_load_var_const_add(self, block, operands, index, count,
+                                 code, namespace):
+        name, const = operands
+        namespace[f"k{const}"] = code.constants.get(const)
+        block.uses.add("get")
+        block.push(block.temp(f"get({name!r}) + k{const}"))
+    
+    def _emit_peek_jump_if_false(self, block, operands, index, count,
+                                 *_):
+        self._emit_peek_branch(block, "not ", int(operands[0]), index,
+                               count)
+        return True
+    
+    def _emit_peek_jump_if_true(self, block, operands, index, count,
+                                *_):
+        self._emit_peek_branch(block, "", int(operands[0]), index,
+                               count)
+        return True
+    
+    def _emit_peek_branch(self, block, negate, target, index, count):
+        if block.values:
+            condition = block.values[-1]
+        else:
+            condition = block.temp("s[-1]")
+        block.flush()
+        block.lines.append(f"if {negate}{condition}: "
+                           f"{self._jump(target, count)}")
+        block.lines.append(f"return {index + 1}")
+
+    def _emit_call_func(self, block, operands, *_):
+        arg_count = int(operands[0])
+        args = [block.pop() for _ in range(arg_count)]
+        args.reverse()
+        func = block.pop()
+        block.lines.append(
+            f"if not callable({func}): "
+            f"raise RuntimeExecutionError('Object is not callable')"
+        )
+        block.push(block.temp(f"{func}({', '.join(args)})"))
+    
+    def _emit_jump(self, block, operands, index, count, *_):
+        block.flush()
+        block.lines.append(self._jump(int(operands[0]), count))
+        return True
+    
+    def _emit_jump_if_true(self, block, operands, index, count, *_):
+        self._emit_branch(block, "", int(operands[0]), index, count)
+        return True
+    
+    def _emit_jump_if_false(self, block, operands, index, count, *_):
+        self._emit_branch(block, "not ", int(operands[0]), index,
+                          count)
+        return True
+    
+    def _emit_branch(self, block, negate, target, index, count):
+        condition = block.pop()
+        block.flush()
+        block.lines.append(f"if {negate}{condition}: "
+                           f"{self._jump(target, count)}")
+        block.lines.append(f"return {index + 1}")
+    
+    def _emit_return_val(self, block, operands, index, count, *_):
+        value = block.pop()
+        block.flush()
+        block.lines.append(f"_return(frame, callstack, {value})")
+        block.lines.append(f"return {count}")
+        return True
+    
+    def _emit_halt(self, block, operands, index, count, *_):
+        block.flush()
+        block.lines.append("callstack.pop()")
+        block.lines.append(f"return {count}")
+        return True
+    
+    def _jump(self, target: int, count: int) -> str:
+        if 0 <= target < count:
+            return f"return {target}"
+        return (f"raise RuntimeExecutionError("
+                f"'Invalid jump target: {target}')")
+
+
+def _return(frame, callstack, value):
+    """
+    RETURN_VAL semantics shared with the reference engine.
+    """
+    callstack.pop()
+    caller = callstack.current()
+
+    if caller:
+        caller.stack.push(value)
+
+
+# --------------------------------------------------
+# compiled engine
+# --------------------------------------------------
+class CompiledEngine:
+    """
+    Executes frames through compiled block functions.
+
+    Code objects are compiled on first use and cached on the
+    code object. Programs using opcodes the compiler does not
+    handle, and runs with instrumentation hooks or a memory
+    budget, go to the reference engine.
+    """
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.compiler = ClosureCompiler()
+    
+    def load(self, instructions):
+        self.fallback.load(instructions)
+    
+    def execute(self, frame, callstack):
+        code = frame.code
+
+        if code.compiled is None:
+            code.compiled = self.compiler.compile(code) or False
+        
+        blocks = code.compiled
+
+        if (not blocks or self.fallback.hooks.active
+                or self.fallback.meter is not None):
+            self.fallback.execute(frame, callstack)
+            return
+        
+        stack = frame.stack._stack
+        count = len(blocks)
+        ip = frame.ip
+
+        try:
+            while ip < count:
+                ip = blocks[ip](stack, frame, callstack)
+        except Exception as exc:
+            frame.ip = ip
+            raise_execution_error(exc, frame,
+                                  failing_ip(blocks[ip], exc),
+                                  callstack)
+        
+        frame.ip = ip
+
+
+def failing_ip(block, exc):
+    """
+    Index of the instruction of ``block`` that raised
+    ``exc``, found from the line its traceback passed
+    through; None if it cannot be told.
+    """
+    code = block.__code__
+    line = None
+    tb = exc.__traceback__
+
+    while tb is not None:
+        if tb.tb_frame.f_code is code:
+            line = tb.tb_lineno
+        tb = tb.tb_next
+    
+    if line is None:
+        return None
+    
+    offset = line - code.co_firstlineno
+
+    if 0 <= offset < len(block.line_ips):
+        return block.line_ips[offset]
+    return None
@@ -32,17 +32,40 @@
 # --------------------------------------------------
 """
 Instruction execution engine.
+
+Handlers return None, or the frame to continue in when they
+switch frames (CALL into a bytecode function and its
+RETURN_VAL), so function calls run inside the same dispatch
+loop without recursing on the host stack.
 """
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
-from vm.bytecode.instructions import get_instruction
+import operator
+from inspect import isawaitable
+
+from config.config import TRACE_EXECUTION
+from vm.bytecode.instructions import INSTRUCTION_SET, JUMP_OPCODES
 from vm.control import ControlFlow
+from vm.core.function import Function
 from vm.errors import (
     InvalidOpcodeError,
     RuntimeExecutionError,
+    VariableNotFoundError,
 )
-from vm.utils import debug_log, trace_instruction
+from vm.memory.accounting import (
+    FIXED_INT_LIMIT,
+    FIXED_SIZE_TYPES,
+    SMALL_TYPES,
+)
+from vm.stack import UNBOUND, FramePool
+from vm.utils import HookRegistry
+from vm.utils.hooks import stdout_trace
+
+
+# Opcodes reported to "call" / "return" hooks
+CALL_OPCODES = {"CALL_FUNC", "CALL", "TAIL_CALL"}
+RETURN_OPCODES = {"RETURN_VAL"}
 
 
 # --------------------------------------------------
@@ -53,45 +76,229 @@ class ExecutionEngine:
     Executes parsed instructions within a frame.
     """
 
+    def __init__(self, frame_pool: FramePool = None):
+        # Frames for bytecode function calls
+        self.frames = frame_pool if frame_pool is not None \
+            else FramePool()
+        self._handlers = self._build_dispatch_table()
+        # Handlers for verified code: unchecked jumps
+        self._verified_handlers = dict(self._handlers)
+        self._verified_handlers.update({
+            "JUMP": self._fast_jump,
+            "JUMP_IF_TRUE": self._fast_jump_if_true,
+            "JUMP_IF_FALSE": self._fast_jump_if_false,
+            "PEEK_JUMP_IF_TRUE": self._fast_peek_jump_if_true,
+            "PEEK_JUMP_IF_FALSE": self._fast_peek_jump_if_false,
+            "LOAD_VAR": self._cached_load_var,
+            "LOAD_GLOBAL": self._cached_load_global,
+            "CALL_FUNC": self._fast_call_func,
+            "CALL": self._fast_call,
+            "RETURN_VAL": self._fast_return_val,
+        })
+        # Handlers used while a memory budget is active
+        self._metered_handlers = self._with_meter(self._handlers)
+        self._metered_verified_handlers = self._with_meter(
+            self._verified_handlers
+        )
+        # Variants pausing on awaitable host results, by the
+        # id() of the table they are derived from
+        self._awaiting_handlers = {
+            id(table): self._with_await(table)
+            for table in (
+                self._handlers,
+                self._verified_handlers,
+                self._metered_handlers,
+                self._metered_verified_handlers,
+            )
+        }
+        self.hooks = HookRegistry()
+        # MemoryMeter of the current run, set by the runtime
+        self.meter = None
+        # Last host function CALL_FUNC found callable
+        self._callable = None
+
+        if TRACE_EXECUTION:
+            self.hooks.attach(stdout_trace())
+
+    def load(self, instructions):
+        """
+        Validate a program against the dispatch table.
+
+        Unknown opcodes are reported once, when the program
+        is loaded, instead of on every executed step.
+        """
+        handlers = self._handlers
+
+        for opcode, _ in instructions:
+            if opcode not in handlers:
+                raise InvalidOpcodeError(opcode)
+
     def execute(self, frame, callstack):
         """
         Execute instructions until frame completes.
         """
-        while True:
-            instr = frame.next_instruction()
+        handlers = self._select_handlers(frame.code)
 
-            if instr is None:
-                return
-            
-            opcode, operands = instr
-            trace_instruction(frame.ip - 1, opcode, operands,
-                              frame.stack)
-            
-            try:
-                self.dispatch(opcode, operands, frame,
-                              callstack)
-            except Exception as exc:
-                raise RuntimeExecutionError(str(exc)) from exc
+        if self.hooks.active:
+            self._execute_instrumented(frame, callstack, handlers)
+            return
+
+        entry = frame
+
+        # A single handler around the loop: the failing IP and
+        # opcode are recovered from the frame afterwards. The
+        # instruction fetch is Frame.next_instruction inlined.
+        try:
+            while True:
+                ip = frame.ip
+
+                if ip >= len(frame.instructions):
+                    if frame is entry:
+                        return
+                    raise_missing_return(frame)
+                
+                frame.ip = ip + 1
+                opcode, operands = frame.instructions[ip]
+                switched = handlers[opcode](operands, frame, callstack)
+
+                if switched is not None:
+                    frame = switched
+        except Exception as exc:
+            raise_execution_error(exc, frame, frame.ip - 1, callstack)
+    
+    def step(self, frame, callstack, count: int, entry=None,
+             awaiting: bool = False):
+        """
+        Execute at most ``count`` instructions, starting in
+        ``frame``, of the program whose first frame is
+        ``entry`` (default: ``frame``).
+
+        Returns the frame to resume in, or None once the
+        program has finished. Every instruction boundary is a
+        safe point: all state is in the frames and call stack.
+        With ``awaiting``, a host call returning an awaitable
+        raises Suspend instead of pushing it.
+        """
+        if entry is None:
+            entry = frame
+        
+        handlers = self._select_handlers(entry.code)
+
+        if awaiting:
+            handlers = self._awaiting_handlers[id(handlers)]
+
+        if self.hooks.active:
+            return self._execute_instrumented(frame, callstack,
+                                              handlers, entry, count)
+        
+        try:
+            for _ in range(count):
+                instr = frame.next_instruction()
+
+                if instr is None:
+                    if frame is entry:
+                        return None
+                    raise_missing_return(frame)
+                
+                opcode, operands = instr
+                switched = handlers[opcode](operands, frame, callstack)
+
+                if switched is not None:
+                    frame = switched
+        except Suspend:
+            raise
+        except Exception as exc:
+            raise_execution_error(exc, frame, frame.ip - 1, callstack)
+        
+        if frame is entry and frame.ip >= len(frame.instructions):
+            return None
+        return frame
+    
+    def _select_handlers(self, code):
+        """
+        Dispatch table for ``code`` under the current meter.
+        """
+        verified = code.verified
+
+        if self.meter is not None:
+            return self._metered_verified_handlers if verified \
+                else self._metered_handlers
+        if verified:
+            return self._verified_handlers
+        return self._handlers
+    
+    def _execute_instrumented(self, frame, callstack, handlers,
+                              entry=None, limit=-1):
+        """
+        Execution loop reporting events to registered hooks.
+
+        Stops after ``limit`` instructions when it is not
+        negative, returning the frame to resume in.
+        """
+        on_instruction = self.hooks.get("instruction")
+        on_call = self.hooks.get("call")
+        on_return = self.hooks.get("return")
+        on_jump = self.hooks.get("jump")
+
+        if entry is None:
+            entry = frame
+
+        try:
+            while limit:
+                limit -= 1
+                instr = frame.next_instruction()
+
+                if instr is None:
+                    if frame is entry:
+                        return None
+                    raise_missing_return(frame)
+                
+                opcode, operands = instr
+                ip = frame.ip - 1
+
+                for hook in on_instruction:
+                    hook(frame, ip, opcode, operands)
+                
+                if opcode in CALL_OPCODES:
+                    for hook in on_call:
+                        hook(frame, ip, opcode, operands)
+                elif opcode in RETURN_OPCODES:
+                    for hook in on_return:
+                        hook(frame, ip, opcode, operands)
+                
+                switched = handlers[opcode](operands, frame, callstack)
+                
+                if switched is not None:
+                    frame = switched
+                elif opcode in JUMP_OPCODES and frame.ip != ip + 1:
+                    for hook in on_jump:
+                        hook(frame, ip, frame.ip)
+        except Suspend:
+            raise
+        except Exception as exc:
+            raise_execution_error(exc, frame, frame.ip - 1, callstack)
+        
+        if frame is entry and frame.ip >= len(frame.instructions):
+            return None
+        return frame
     
     def dispatch(self, opcode, operands, frame, callstack):
         """
         Dispatch opcode to handler.
         """
-        handler_name = f"op_{opcode.lower()}"
+        handler = self._handlers.get(opcode)
 
-        if not hasattr(self, handler_name):
+        if handler is None:
             raise InvalidOpcodeError(opcode)
         
-        handler = getattr(self, handler_name)
-        handler(operands, frame, callstack)
+        return handler(operands, frame, callstack)
     
     # -----------------------------------
     # opcode handlers
     # -----------------------------------
 
     def op_load_const(self, operands, frame, _):
-        value = operands[0]
-        frame.stack.push(self._parse_literal(value))
+        frame.stack.push(frame.constants[operands[0]])
     
     def op_load_var(self, operands, frame, _):
         name = operands[0]
@@ -143,16 +350,151 @@ class ExecutionEngine:
         frame.stack.push(value)
     
     def op_return_val(self, _, frame, callstack):
-        value = frame.stack.pop()
+        return self._return(frame, callstack, frame.stack.pop())
+    
+    def _fast_return_val(self, _, frame, callstack):
+        """
+        RETURN_VAL for verified code: straight back into a
+        calling bytecode frame.
+        """
+        caller = frame.caller
+
+        if caller is None:
+            return self._return(frame, callstack, frame.stack.pop())
+        
         callstack.pop()
+        caller.stack.push(frame.stack.pop())
+        self.frames.release(frame)
+        return caller
+    
+    def _return(self, frame, callstack, value):
+        """
+        Leave ``frame`` with ``value``; returns the frame to
+        continue in, if any.
+        """
+        callstack.pop()
+        caller = frame.caller
+
+        if caller is not None:
+            # Back from a bytecode function call
+            caller.stack.push(value)
+            self.frames.release(frame)
+            return caller
+        
         caller = callstack.current()
 
         if caller:
             caller.stack.push(value)
         
+        frame.finish()
+        
     def op_halt(self, _, frame, callstack):
         callstack.pop()
+        frame.finish()
+    
+    # -----------------------------------
+    # slot-indexed variables
+    # -----------------------------------
+
+    def op_load_fast(self, operands, frame, _):
+        value = frame.fast[operands[0]]
+
+        if value is UNBOUND:
+            raise_unbound(frame, operands[0])
+        frame.stack.push(value)
+    
+    def op_store_fast(self, operands, frame, _):
+        frame.fast[operands[0]] = frame.stack.pop()
+    
+    def op_load_global(self, operands, frame, _):
+        frame.stack.push(frame.globals.get(operands[0]))
+    
+    def op_incr_fast(self, operands, frame, _):
+        slot, index = operands
+        value = frame.fast[slot]
+
+        if value is UNBOUND:
+            raise_unbound(frame, slot)
+        frame.fast[slot] = value + frame.constants[index]
+    
+    def op_decr_fast(self, operands, frame, _):
+        slot, index = operands
+        value = frame.fast[slot]
+
+        if value is UNBOUND:
+            raise_unbound(frame, slot)
+        frame.fast[slot] = value - frame.constants[index]
     
+    def op_load_fast_const_add(self, operands, frame, _):
+        slot, index = operands
+        value = frame.fast[slot]
+
+        if value is UNBOUND:
+            raise_unbound(frame, slot)
+        frame.stack.push(value + frame.constants[index])
+
+    # -----------------------------------
+    # superinstructions
+    # -----------------------------------
+
+    def op_incr_var(self, operands, frame, _):
+        name, index = operands
+        value = frame.locals.get(name) + frame.constants[index]
+        frame.locals.set(name, value)
+    
+    def op_decr_var(self, operands, frame, _):
+        name, index = operands
+        value = frame.locals.get(name) - frame.constants[index]
+        frame.locals.set(name, value)
+    
+    def op_load_var_const_add(self, operands, frame, _):
+        name, index = operands
+        frame.stack.push(frame.locals.get(name)
+                         + frame.constants[index])
+    
+    def op_peek_jump_if_false(self, operands, frame, __):
+        ControlFlow.jump_if_false(frame, frame.stack.peek(),
+                                  int(operands[0]))
+    
+    def op_peek_jump_if_true(self, operands, frame, __):
+        ControlFlow.jump_if_true(frame, frame.stack.peek(),
+                                 int(operands[0]))
+
+    # -----------------------------------
+    # verified fast paths
+    # -----------------------------------
+    # Jump operands of verified code are in-range integers.
+
+    def _fast_jump(self, operands, frame, __):
+        frame.ip = operands[0]
+    
+    def _fast_jump_if_true(self, operands, frame, __):
+        if frame.stack.pop():
+            frame.ip = operands[0]
+    
+    def _fast_jump_if_false(self, operands, frame, __):
+        if not frame.stack.pop():
+            frame.ip = operands[0]
+    
+    def _fast_peek_jump_if_true(self, operands, frame, __):
+        if frame.stack.peek():
+            frame.ip = operands[0]
+    
+    def _fast_peek_jump_if_false(self, operands, frame, __):
+        if not frame.stack.peek():
+            frame.ip = operands[0]
+    
+    # Name loads of verified code go through the inline cache
+    # the verifier allocated for the instruction.
+
+    def _cached_load_var(self, operands, frame, __):
+        cache = frame.code.caches[frame.ip - 1]
+        frame.stack.push(cache.lookup(frame.locals, operands[0]))
+    
+    def _cached_load_global(self, operands, frame, __):
+        cache = frame.code.caches[frame.ip - 1]
+        frame.stack.push(cache.lookup(frame.globals, operands[0]))
+
     def op_call_func(self, operands, frame, _):
         """
         Call a Python callable stored on the stack.
@@ -160,34 +502,371 @@ class ExecutionEngine:
         Stack before:   [..., func, arg1, arg2, ..., argN]
         Stack after:    [..., result]
         """
-        arg_count = int(operands[0])
+        args = frame.stack.pop_slice(int(operands[0]))
+        func = frame.stack.pop()
+
+        if not callable(func):
+            raise RuntimeExecutionError("Object is not callable")
+        
+        result = func(*args)
+        self._check_host_result(result, frame)
+        frame.stack.push(result)
+    
+    def _fast_call_func(self, operands, frame, __):
+        """
+        CALL_FUNC for verified code.
+
+        Arguments are read straight off the stack list, which
+        is then truncated in place, and the result takes the
+        function's slot. Up to three arguments are passed
+        without building an argument list.
+        """
+        stack = frame.stack._stack
+        argc = operands[0]
+        func = stack[-1 - argc]
+
+        # Loops call one host function over and over
+        if func is not self._callable:
+            if not callable(func):
+                raise RuntimeExecutionError("Object is not callable")
+            self._callable = func
+        
+        if argc == 2:
+            result = func(stack[-2], stack[-1])
+            del stack[-2:]
+        elif argc == 1:
+            result = func(stack.pop())
+        elif argc == 0:
+            result = func()
+        elif argc == 3:
+            result = func(stack[-3], stack[-2], stack[-1])
+            del stack[-3:]
+        else:
+            result = func(*stack[-argc:])
+            del stack[-argc:]
+        
+        # Checked inline, as host calls are the hottest metered
+        # instruction
+        meter = self.meter
+
+        if meter is not None:
+            if type(result) is int:
+                if not -FIXED_INT_LIMIT < result < FIXED_INT_LIMIT:
+                    meter.check(result, frame)
+            elif type(result) not in FIXED_SIZE_TYPES:
+                meter.check(result, frame)
+        
+        stack[-1] = result
+    
+    # -----------------------------------
+    # bytecode functions
+    # -----------------------------------
 
-        # Pop arguments (reverse order)
-        args = []
-        for _ in range(arg_count):
-            args.append(frame.stack.pop())
-        args.reverse()
+    def op_make_function(self, operands, frame, _):
+        name = operands[0]
+        frame.stack.push(
+            Function(name, frame.code.functions[name], frame.globals)
+        )
+    
+    def op_call(self, operands, frame, callstack):
+        """
+        Call a bytecode function or a Python callable.
+        CALL <arg_count>
+        Stack before:   [..., func, arg1, arg2, ..., argN]
+        Stack after:    [..., result]
 
-        # Pop function
+        A bytecode function runs in a pooled frame whose first
+        slots are the argument slice moved off the stack; the
+        dispatch loop continues in that frame.
+        """
+        args = frame.stack.pop_slice(int(operands[0]))
         func = frame.stack.pop()
 
+        if type(func) is Function:
+            code = func.code
+
+            if len(args) != len(code.params):
+                raise_arity(func, len(args))
+            
+            missing = len(code.varnames) - len(args)
+
+            if missing:
+                args += [UNBOUND] * missing
+            callee = self.frames.acquire_call(code, func.globals,
+                                              args, frame)
+            callstack.push(callee)
+            return callee
+        
         if not callable(func):
             raise RuntimeExecutionError("Object is not callable")
         
         result = func(*args)
+        self._check_host_result(result, frame)
         frame.stack.push(result)
+    
+    def _fast_call(self, operands, frame, callstack):
+        """
+        CALL for verified code.
+
+        A bytecode function's slot list is sliced straight off
+        the stack list, and a pooled frame that last ran the
+        same code is re-entered as it is. Host callables take
+        the generic path.
+        """
+        stack = frame.stack._stack
+        argc = operands[0]
+        func = stack[-1 - argc]
+
+        if type(func) is not Function:
+            return self.op_call(operands, frame, callstack)
+        
+        code = func.code
+
+        if argc != len(code.params):
+            raise_arity(func, argc)
+        
+        fast = stack[-argc:] if argc else []
+        del stack[-1 - argc:]
+        missing = len(code.varnames) - argc
+
+        if missing:
+            fast += [UNBOUND] * missing
+        callee = self.frames.acquire_call(code, func.globals, fast,
+                                          frame)
+        callstack.push(callee)
+        return callee
+    
+    def op_tail_call(self, operands, frame, callstack):
+        """
+        CALL followed by RETURN_VAL, emitted by the optimizer.
+
+        A bytecode callee reuses the current frame, so tail
+        recursion runs at constant call stack depth. A host
+        callable's result is returned directly.
+        """
+        args = frame.stack.pop_slice(int(operands[0]))
+        func = frame.stack.pop()
+
+        if type(func) is Function:
+            code = func.code
+
+            if len(args) != len(code.params):
+                raise_arity(func, len(args))
+            frame.reset_call(code, func.globals, args, frame.caller)
+            return frame
+        
+        if not callable(func):
+            raise RuntimeExecutionError("Object is not callable")
+        
+        result = func(*args)
+        self._check_host_result(result, frame)
+        return self._return(frame, callstack, result)
 
     # -----------------------------------
     # helpers
     # -----------------------------------
 
-    def _parse_literal(self, value: str):
+    def _build_dispatch_table(self):
         """
-        Convert literal string to Python value.
+        Map every known opcode to its bound handler.
         """
-        if value.isdigit():
-            return int(value)
-        try:
-            return float(value)
-        except ValueError:
-            return value.strip('"')
+        table = {}
+
+        for opcode in INSTRUCTION_SET:
+            handler = getattr(self, f"op_{opcode.lower()}", None)
+
+            if handler is not None:
+                table[opcode] = handler
+        
+        return table
+    
+    def _with_meter(self, table):
+        """
+        Copy of ``table`` whose allocating handlers check their
+        results against the current MemoryMeter before building
+        them, and whose name stores report to it.
+        """
+        metered = dict(table)
+        metered["ADD"] = self._metered_add
+        metered["MUL"] = self._metered_mul
+        metered["LOAD_FAST_CONST_ADD"] = self._metered_load_fast_const_add
+        metered["LOAD_VAR_CONST_ADD"] = self._metered_load_var_const_add
+        metered["INCR_FAST"] = self._metered_incr_fast
+        metered["INCR_VAR"] = self._metered_incr_var
+        metered["STORE_VAR"] = self._metered_store_var
+        return metered
+    
+    def _metered_add(self, _, frame, __):
+        stack = frame.stack
+        b = stack.pop()
+        a = stack.pop()
+        self.meter.check_result(operator.add, a, b, frame)
+        stack.push(a + b)
+    
+    def _metered_mul(self, _, frame, __):
+        stack = frame.stack
+        b = stack.pop()
+        a = stack.pop()
+        self.meter.check_result(operator.mul, a, b, frame)
+        stack.push(a * b)
+    
+    def _metered_load_fast_const_add(self, operands, frame, _):
+        slot, index = operands
+        value = frame.fast[slot]
+
+        if value is UNBOUND:
+            raise_unbound(frame, slot)
+        
+        constant = frame.constants[index]
+        self.meter.check_result(operator.add, value, constant, frame)
+        frame.stack.push(value + constant)
+    
+    def _metered_load_var_const_add(self, operands, frame, _):
+        name, index = operands
+        value = frame.locals.get(name)
+        constant = frame.constants[index]
+        self.meter.check_result(operator.add, value, constant, frame)
+        frame.stack.push(value + constant)
+    
+    def _metered_incr_fast(self, operands, frame, _):
+        slot, index = operands
+        old = frame.fast[slot]
+
+        if old is UNBOUND:
+            raise_unbound(frame, slot)
+        
+        constant = frame.constants[index]
+
+        if type(old) not in SMALL_TYPES or \
+                type(constant) not in SMALL_TYPES:
+            self.meter.check_result(operator.add, old, constant, frame)
+        frame.fast[slot] = old + constant
+    
+    def _metered_store_var(self, operands, frame, _):
+        value = frame.stack.pop()
+        # Only a value this namespace held is released; one it
+        # shadows stays alive in the parent
+        old = frame.locals.swap(operands[0], value)
+
+        if type(value) in SMALL_TYPES and type(old) in SMALL_TYPES:
+            return
+        self.meter.replace(old, value)
+    
+    def _metered_incr_var(self, operands, frame, _):
+        name, index = operands
+        namespace = frame.locals
+        old = namespace.get(name)
+        constant = frame.constants[index]
+
+        if type(old) in SMALL_TYPES and type(constant) in SMALL_TYPES:
+            namespace.set(name, old + constant)
+            return
+        
+        self.meter.check_result(operator.add, old, constant, frame)
+        value = old + constant
+        namespace.set(name, value)
+        self.meter.replace(old, value)
+    
+    def _check_host_result(self, value, frame):
+        """
+        Check a host call's result, held by ``frame``, against
+        the current MemoryMeter.
+        """
+        if self.meter is not None:
+            self.meter.check(value, frame)
+    
+    def _with_await(self, table):
+        """
+        Copy of ``table`` whose host calls raise Suspend when
+        the result is awaitable.
+        """
+        awaiting = dict(table)
+
+        for opcode in ("CALL_FUNC", "CALL", "TAIL_CALL"):
+            awaiting[opcode] = self._awaiting_call(table[opcode])
+        return awaiting
+    
+    def _awaiting_call(self, handler):
+        def run(operands, frame, callstack):
+            target = handler(operands, frame, callstack)
+
+            if target is None:
+                # Host result pushed onto this frame
+                resumed = frame
+            elif target is not frame and target.caller is not frame:
+                # Host tail call, returned to the caller
+                resumed = target
+            else:
+                # Entered a bytecode function
+                return target
+            
+            if isawaitable(resumed.stack.peek()):
+                raise Suspend(resumed, resumed.stack.pop())
+            return target
+        return run
+
+
+class Suspend(Exception):
+    """
+    Raised by async-mode call handlers when a host function
+    returned an awaitable. ``frame`` resumes once its result
+    has been pushed onto that frame's stack.
+    """
+
+    def __init__(self, frame, awaitable):
+        super().__init__("Program suspended on an awaitable")
+        self.frame = frame
+        self.awaitable = awaitable
+
+
+def raise_unbound(frame, slot):
+    """
+    Report a read of an unassigned variable slot.
+    """
+    raise VariableNotFoundError(frame.code.varnames[slot])
+
+
+def raise_arity(func, argc):
+    """
+    Report a bytecode function called with the wrong number
+    of arguments.
+    """
+    raise RuntimeExecutionError(
+        f"{func.name}() takes {len(func.code.params)} argument(s), "
+        f"got {argc}"
+    )
+
+
+def raise_missing_return(frame):
+    """
+    Report a function frame running past its last instruction.
+    """
+    raise RuntimeExecutionError(
+        f"Function '{frame.code.name}' ended without RETURN_VAL"
+    )
+
+
+def raise_execution_error(exc, frame, ip, callstack):
+    """
+    Re-raise ``exc`` as a RuntimeExecutionError carrying the
+    failing IP, opcode and call stack depth.
+
+    Errors that already are RuntimeExecutionErrors propagate
+    unchanged apart from the added context.
+    """
+    if isinstance(exc, RuntimeExecutionError):
+        error = exc
+    else:
+        error = RuntimeExecutionError(str(exc))
+    
+    if error.ip is None:
+        # ``ip`` is None when the failing instruction is unknown
+        error.ip = ip
+        error.depth = len(callstack)
+
+        if ip is not None and 0 <= ip < len(frame.instructions):
+            error.opcode = frame.instructions[ip][0]
+    
+    if error is exc:
+        raise error
+    raise error from exc
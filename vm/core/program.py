@@ -0,0 +1,126 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# program MODULE
+# --------------------------------------------------
+"""
+Shareable programs.
+
+A Program is a prepared (optimized, resolved and verified)
+code object that is never modified again. Every run creates
+its own execution state: a copy-on-write overlay of the
+given globals, frames and a call stack from a per-thread
+Runtime. One Program can therefore run from many threads at
+once, including on free-threaded builds.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import threading
+
+from config.config import MEMORY_BUDGET
+from vm.core.runtime import Runtime
+from vm.memory import FrozenNamespace, Namespace, OverlayNamespace
+
+
+# Runtime (engine, call stack, frame pool) of each thread
+_local = threading.local()
+
+# Base of runs given no globals
+_EMPTY = FrozenNamespace(Namespace())
+
+
+def thread_runtime() -> Runtime:
+    """
+    The calling thread's Runtime, created on first use.
+    """
+    runtime = getattr(_local, "runtime", None)
+
+    if runtime is None:
+        runtime = _local.runtime = Runtime()
+    return runtime
+
+
+# --------------------------------------------------
+# program
+# --------------------------------------------------
+class Program:
+    """
+    Immutable prepared program, safe to run concurrently.
+
+    Created by VirtualMachine.load() / load_file().
+    """
+
+    __slots__ = ("_code",)
+
+    def __init__(self, code):
+        if not code.verified:
+            raise ValueError("Program code must be verified")
+        object.__setattr__(self, "_code", code)
+    
+    def __setattr__(self, name, value):
+        raise AttributeError("Program is immutable")
+    
+    @property
+    def name(self) -> str:
+        return self._code.name
+    
+    @property
+    def code(self):
+        """
+        The verified code object (treat as read-only).
+        """
+        return self._code
+    
+    def run(self, globals_ns: FrozenNamespace = None,
+            backend: str = None,
+            memory_budget: int = MEMORY_BUDGET) -> OverlayNamespace:
+        """
+        Execute the program once against an overlay of
+        ``globals_ns`` and return that overlay.
+
+        The base is read by every concurrent run and must not
+        change while they run; a FrozenNamespace from
+        VirtualMachine.freeze_globals() fits.
+        """
+        overlay = OverlayNamespace(globals_ns or _EMPTY)
+        runtime = thread_runtime()
+        runtime.memory_budget = memory_budget
+        frame = runtime.new_frame(self._code, overlay, locals_ns=overlay)
+
+        try:
+            runtime.run(frame, backend)
+        finally:
+            runtime.release_frame(frame)
+        
+        return overlay
+    
+    def __repr__(self) -> str:
+        return f"<program {self.name}>"
@@ -36,8 +36,13 @@ Runtime coordination.
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
+from config.config import EXECUTION_BACKEND, MEMORY_BUDGET
 from vm.control import CallStack
-from vm.core.engine import ExecutionEngine
+from vm.core.compiler import CompiledEngine
+from vm.core.engine import ExecutionEngine, Suspend
+from vm.core.task import Task
+from vm.memory import MemoryMeter
+from vm.stack import FramePool
 
 
 # --------------------------------------------------
@@ -48,13 +53,122 @@ class Runtime:
     Coordinates execution engine and call stack
     """
 
-    def __init__(self):
+    def __init__(self, backend: str = EXECUTION_BACKEND,
+                 memory_budget: int = MEMORY_BUDGET):
         self.callstack = CallStack()
-        self.engine = ExecutionEngine()
+        # Finished frames kept for reuse, shared with the
+        # engine's call path
+        self.frames = FramePool()
+        self.engine = ExecutionEngine(frame_pool=self.frames)
+        self.compiled_engine = CompiledEngine(self.engine)
+        self.backend = backend
+        # Approximate byte budget per run (None: unlimited)
+        self.memory_budget = memory_budget
     
-    def run(self, frame):
+    def new_frame(self, code, globals_ns, locals_ns=None):
+        """
+        Return a frame ready to run ``code``, reusing a pooled
+        frame when one is free.
+        """
+        return self.frames.acquire(code, globals_ns, locals_ns)
+    
+    def release_frame(self, frame):
+        """
+        Return a finished frame to the pool.
+        """
+        self.frames.release(frame)
+    
+    def run(self, frame, backend: str = None):
         """
         Start execution with an initial frame.
+
+        ``backend`` selects the engine for this program
+        ("reference" or "compiled"); defaults to the
+        runtime's backend. With a memory budget set, the run
+        is metered and raises MemoryBudgetExceededError when
+        its estimate goes over.
         """
+        engine = self.get_engine(backend or self.backend)
+        engine.load(frame.instructions)
+        meter = None
+
+        if self.memory_budget is not None:
+            meter = MemoryMeter(self.memory_budget)
+            meter.charge_code(frame.code)
+        
+        previous_meter = self.engine.meter
+        self.engine.meter = meter
+        depth = len(self.callstack)
         self.callstack.push(frame)
-        self.engine.execute(frame, self.callstack)
+
+        try:
+            engine.execute(frame, self.callstack)
+        finally:
+            self.engine.meter = previous_meter
+            # Drop frames left behind by programs that end
+            # without HALT or fail part-way
+            while len(self.callstack) > depth:
+                self.callstack.pop()
+    
+    def start(self, frame, priority: int = 0, name: str = None) -> Task:
+        """
+        Create a task that runs ``frame`` in slices with
+        step(). Tasks always use the reference engine, whose
+        instruction boundaries are safe points.
+        """
+        self.engine.load(frame.instructions)
+        meter = None
+
+        if self.memory_budget is not None:
+            meter = MemoryMeter(self.memory_budget)
+            meter.charge_code(frame.code)
+        
+        return Task(frame, meter, priority, name)
+    
+    def step(self, task: Task, n: int, awaiting: bool = False) -> bool:
+        """
+        Run up to ``n`` instructions of ``task``; returns True
+        once it has finished.
+
+        Its call stack and current frame are kept between
+        calls. An error ends the task, is stored on it and is
+        raised. With ``awaiting``, a host call returning an
+        awaitable pauses the task early and stores the
+        awaitable in ``task.awaiting``; its result must be
+        pushed onto ``task.frame.stack`` before resuming.
+        """
+        if task.done:
+            return True
+        
+        previous_meter = self.engine.meter
+        self.engine.meter = task.meter
+        task.slices += 1
+
+        try:
+            task.frame = self.engine.step(task.frame, task.callstack, n,
+                                          task.entry, awaiting)
+        except Suspend as pause:
+            task.frame = pause.frame
+            task.awaiting = pause.awaitable
+        except Exception as exc:
+            task.error = exc
+            task.frame = None
+            raise
+        finally:
+            self.engine.meter = previous_meter
+
+            if task.frame is None:
+                task.done = True
+        
+        return task.done
+    
+    def get_engine(self, backend: str):
+        """
+        Resolve a backend name to its engine.
+        """
+        if backend == "reference":
+            return self.engine
+        if backend == "compiled":
+            return self.compiled_engine
+        
+        raise ValueError(f"Unknown execution backend: {backend}")
@@ -0,0 +1,157 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# scheduler MODULE
+# --------------------------------------------------
+"""
+Cooperative scheduler.
+
+Interleaves many programs on one VirtualMachine in a single
+OS thread. Each task runs for a quantum of instructions and
+is then preempted at an instruction boundary, keeping its
+call stack and frames, so a long program cannot hold up
+short ones.
+
+Policies:
+    round_robin  tasks take turns in spawn order
+    priority     the highest priority runnable task goes
+                 next; equal priorities take turns
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import heapq
+import itertools
+import time
+from collections import deque
+
+from config.config import SCHEDULER_QUANTUM
+from vm.core.task import Task
+
+
+ROUND_ROBIN = "round_robin"
+PRIORITY = "priority"
+POLICIES = (ROUND_ROBIN, PRIORITY)
+
+
+# --------------------------------------------------
+# scheduler
+# --------------------------------------------------
+class Scheduler:
+    """
+    Runs spawned programs a quantum at a time.
+    """
+
+    def __init__(self, vm, quantum: int = SCHEDULER_QUANTUM,
+                 policy: str = ROUND_ROBIN):
+        if policy not in POLICIES:
+            raise ValueError(f"Unknown scheduling policy: {policy}")
+        
+        self.vm = vm
+        self.quantum = quantum
+        self.policy = policy
+        # Finished tasks in completion order
+        self.finished = []
+        self._ready = deque() if policy == ROUND_ROBIN else []
+        self._order = itertools.count()
+    
+    def spawn(self, source: str, priority: int = 0,
+              globals_ns=None, name: str = None) -> Task:
+        """
+        Prepare a program from source and queue it.
+
+        The program runs against the VM globals, or against
+        ``globals_ns`` when given.
+        """
+        vm = self.vm
+        raw = vm.loader.load_from_string(source)
+        code = vm._prepare(vm._decode(raw))
+
+        if globals_ns is None:
+            globals_ns = vm.globals
+        
+        frame = vm.runtime.new_frame(code, globals_ns,
+                                     locals_ns=globals_ns)
+        task = vm.runtime.start(frame, priority, name)
+        task.started_at = time.perf_counter()
+        self._push(task)
+        return task
+    
+    def run_once(self) -> bool:
+        """
+        Give one quantum to the next task; returns False when
+        no task is left.
+        """
+        if not self._ready:
+            return False
+        
+        task = self._pop()
+
+        try:
+            done = self.vm.runtime.step(task, self.quantum)
+        except Exception:
+            # Stored on the task; other tasks keep running
+            done = True
+        
+        if done:
+            self._finish(task)
+        else:
+            self._push(task)
+        return True
+    
+    def run(self) -> list:
+        """
+        Run until every task has finished; returns them in
+        completion order.
+        """
+        while self.run_once():
+            pass
+        return self.finished
+    
+    def __len__(self):
+        return len(self._ready)
+    
+    def _push(self, task: Task):
+        if self.policy == ROUND_ROBIN:
+            self._ready.append(task)
+        else:
+            heapq.heappush(self._ready,
+                           (-task.priority, next(self._order), task))
+    
+    def _pop(self) -> Task:
+        if self.policy == ROUND_ROBIN:
+            return self._ready.popleft()
+        return heapq.heappop(self._ready)[2]
+    
+    def _finish(self, task: Task):
+        task.finished_at = time.perf_counter()
+        self.finished.append(task)
+        self.vm._collect_cache_stats(task.entry.code)
+        self.vm.runtime.release_frame(task.entry)
@@ -0,0 +1,93 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# task MODULE
+# --------------------------------------------------
+"""
+Resumable program runs.
+
+A Task is one program started on a Runtime but run in
+slices: it owns the call stack and the frame to resume in,
+so other tasks can run between its slices.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+from vm.control import CallStack
+
+
+# --------------------------------------------------
+# task
+# --------------------------------------------------
+class Task:
+    """
+    A program being run a quantum at a time.
+    """
+
+    __slots__ = (
+        "name",
+        "entry",
+        "frame",
+        "callstack",
+        "meter",
+        "priority",
+        "slices",
+        "done",
+        "error",
+        "awaiting",
+        "started_at",
+        "finished_at",
+    )
+
+    def __init__(self, entry, meter=None, priority: int = 0,
+                 name: str = None):
+        self.name = name or entry.code.name
+        # First frame of the program and the frame to resume in
+        self.entry = entry
+        self.frame = entry
+        self.callstack = CallStack()
+        self.callstack.push(entry)
+        self.meter = meter
+        self.priority = priority
+        # Number of step() calls so far
+        self.slices = 0
+        self.done = False
+        # Exception that ended the task, if any
+        self.error = None
+        # Awaitable the task is suspended on (async runs)
+        self.awaiting = None
+        # perf_counter() timestamps set by the scheduler
+        self.started_at = None
+        self.finished_at = None
+    
+    def __repr__(self) -> str:
+        state = "failed" if self.error else \
+            "done" if self.done else "runnable"
+        return f"<task {self.name} {state}>"
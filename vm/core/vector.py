@@ -0,0 +1,603 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# vector MODULE
+# --------------------------------------------------
+"""
+Vectorized execution over columns of inputs.
+
+A program is run once for a whole batch of rows. Every input
+column is a NumPy array, so each stack value and variable
+holds one value per row (a lane) and ADD, SUB, MUL and
+DIV act on all lanes at once. A conditional jump on a value
+that differs between lanes splits the lanes into two groups.
+The group furthest behind always runs first, and groups that
+reach the same instruction merge again, so lanes reconverge
+where the two sides of a branch join and where a loop exits.
+Programs using other
+instructions (host calls, functions) run on the scalar
+engine once per row instead.
+
+NumPy is optional: pip install python-virtual-machine[vector]
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import operator
+from functools import reduce
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+from vm.errors import RuntimeExecutionError
+from vm.memory import OverlayNamespace
+
+
+# Opcodes the lane executor runs on whole columns
+VECTOR_OPCODES = frozenset({
+    "LOAD_CONST", "LOAD_VAR", "LOAD_GLOBAL", "STORE_VAR",
+    "ADD", "SUB", "MUL", "DIV", "POP_TOP", "DUP_TOP", "JUMP",
+    "JUMP_IF_TRUE", "JUMP_IF_FALSE", "PEEK_JUMP_IF_TRUE",
+    "PEEK_JUMP_IF_FALSE", "HALT", "INCR_VAR", "DECR_VAR",
+    "LOAD_VAR_CONST_ADD",
+})
+
+# Name-based opcodes that assign a module variable
+_NAME_STORES = {"STORE_VAR", "INCR_VAR", "DECR_VAR"}
+
+_IP = operator.attrgetter("ip")
+
+
+def require_numpy():
+    """
+    Return the numpy module, or raise ImportError when it is
+    not installed.
+    """
+    if np is None:
+        raise ImportError(
+            "Vectorized execution needs NumPy: "
+            "pip install python-virtual-machine[vector]"
+        )
+    return np
+
+
+def as_columns(columns: dict) -> tuple:
+    """
+    Check the input columns: 1-D arrays of a single length.
+
+    Returns (name -> ndarray, number of rows).
+    """
+    require_numpy()
+    arrays = {name: np.asarray(values) for name, values in columns.items()}
+
+    if not arrays:
+        raise ValueError("At least one input column is required")
+    
+    shapes = {array.shape for array in arrays.values()}
+
+    if len(shapes) != 1 or len(next(iter(shapes))) != 1:
+        raise ValueError("Input columns must be 1-D and of equal length")
+    
+    return arrays, next(iter(shapes))[0]
+
+
+def written_names(code) -> list:
+    """
+    Names module ``code`` assigns, in order of appearance.
+    """
+    return list(dict.fromkeys(
+        operands[0] for opcode, operands in code.instructions
+        if opcode in _NAME_STORES
+    ))
+
+
+def vectorizable(code) -> bool:
+    """
+    True if the lane executor can run verified ``code``.
+    """
+    return not code.functions and all(
+        opcode in VECTOR_OPCODES for opcode, _ in code.instructions
+    )
+
+
+def assemble(parts: list, rows: int):
+    """
+    Build one output column from (row index, value) parts;
+    an index of None covers every row.
+
+    Rows no part covers hold None in an object column.
+    """
+    covered = sum(rows if index is None else len(index)
+                  for index, _ in parts)
+    dtype = object
+
+    if covered == rows:
+        try:
+            dtype = reduce(np.promote_types,
+                           (np.asarray(value).dtype for _, value in parts))
+        except TypeError:
+            pass
+    
+    column = np.empty(rows, dtype=dtype)
+
+    for index, value in parts:
+        column[slice(None) if index is None else index] = value
+    
+    return column
+
+
+def checked(op, a, b):
+    """
+    ``op`` (add, sub or mul) on lanes, without silent integer
+    wraparound.
+
+    Where fixed-width integer lanes would overflow, the
+    operation is redone on object lanes of Python ints, which
+    then carry exact results as the scalar engine would.
+    """
+    try:
+        result = op(a, b)
+    except OverflowError:
+        # A Python int constant out of range for the lane dtype
+        return op(_exact(a), _exact(b))
+    
+    if (isinstance(result, np.ndarray) and result.dtype.kind in "iu"
+            and _overflows(op, a, b, result.dtype)):
+        return op(_exact(a), _exact(b))
+    return result
+
+
+def _overflows(op, a, b, dtype) -> bool:
+    """
+    True if ``op(a, b)`` leaves the range of ``dtype``,
+    estimated in float64. That estimate is exact below 2**53;
+    wider types keep a factor-two margin for its rounding,
+    where a false alarm only costs the exact recomputation.
+    """
+    info = np.iinfo(dtype)
+    low, high = info.min, info.max
+
+    if info.bits > 53:
+        low, high = low // 2, high // 2
+    
+    with np.errstate(all="ignore"):
+        estimate = op(np.asarray(a, dtype=np.float64),
+                      np.asarray(b, dtype=np.float64))
+    return bool(np.any((estimate > high) | (estimate < low)))
+
+
+def _exact(value):
+    """
+    Integer lanes as an object array of Python ints.
+    """
+    if isinstance(value, np.ndarray) and value.dtype.kind in "iu":
+        return value.astype(object)
+    return value
+
+
+def _join(a, count_a: int, b, count_b: int):
+    """
+    One value over two groups of ``count_a`` and ``count_b``
+    lanes, or None if their lanes differ in dtype.
+    """
+    if not isinstance(a, np.ndarray) and not isinstance(b, np.ndarray):
+        if type(a) is type(b) and a == b:
+            return a
+    
+    a = np.broadcast_to(np.asarray(a), (count_a,))
+    b = np.broadcast_to(np.asarray(b), (count_b,))
+
+    if a.dtype != b.dtype:
+        return None
+    return np.concatenate((a, b))
+
+
+def _select(value, mask):
+    """
+    The lanes of ``value`` picked by ``mask``; values shared
+    by all lanes (constants, globals) are kept as they are.
+    """
+    return value[mask] if isinstance(value, np.ndarray) else value
+
+
+# --------------------------------------------------
+# lanes
+# --------------------------------------------------
+class _Lanes:
+    """
+    Rows following one path through the program.
+
+    ``index`` holds their row numbers, or None for all rows
+    (before any split, so never merged); ``names`` the
+    variables they assigned.
+    """
+
+    __slots__ = ("index", "ip", "stack", "names")
+
+    def __init__(self, index, ip: int, stack: list, names: dict):
+        self.index = index
+        self.ip = ip
+        self.stack = stack
+        self.names = names
+    
+    def __len__(self):
+        return len(self.index)
+    
+    def take(self, mask, ip: int) -> "_Lanes":
+        """
+        The lanes selected by ``mask``, continuing at ``ip``.
+        """
+        index = np.flatnonzero(mask) if self.index is None \
+            else self.index[mask]
+        return _Lanes(
+            index,
+            ip,
+            [_select(value, mask) for value in self.stack],
+            {name: _select(value, mask)
+             for name, value in self.names.items()},
+        )
+
+
+# --------------------------------------------------
+# lane executor
+# --------------------------------------------------
+class LaneExecutor:
+    """
+    Runs verified module code once over all rows of the
+    input columns.
+
+    Columns and globals are read, never written; run()
+    returns every variable the program assigns as an output
+    column.
+    """
+
+    def __init__(self, code, columns: dict, rows: int, globals_ns):
+        require_numpy()
+        self.code = code
+        self.constants = code.constants.values
+        self.columns = columns
+        self.rows = rows
+        self.globals = globals_ns
+        self._handlers = {
+            "LOAD_CONST": self.op_load_const,
+            "LOAD_VAR": self.op_load_global,
+            "LOAD_GLOBAL": self.op_load_global,
+            "STORE_VAR": self.op_store_var,
+            "ADD": self.op_add,
+            "SUB": self.op_sub,
+            "MUL": self.op_mul,
+            "DIV": self.op_div,
+            "POP_TOP": self.op_pop_top,
+            "DUP_TOP": self.op_dup_top,
+            "JUMP": self.op_jump,
+            "JUMP_IF_TRUE": self.op_jump_if_true,
+            "JUMP_IF_FALSE": self.op_jump_if_false,
+            "PEEK_JUMP_IF_TRUE": self.op_peek_jump_if_true,
+            "PEEK_JUMP_IF_FALSE": self.op_peek_jump_if_false,
+            "HALT": self.op_halt,
+            "INCR_VAR": self.op_incr_var,
+            "DECR_VAR": self.op_decr_var,
+            "LOAD_VAR_CONST_ADD": self.op_load_var_const_add,
+        }
+    
+    def run(self) -> dict:
+        """
+        Execute the program and return name -> output column.
+        """
+        pending = [_Lanes(None, 0, [], {})]
+        finished = []
+
+        # Division by zero raises as it does for scalars
+        with np.errstate(divide="raise", invalid="raise"):
+            while pending:
+                pending = self._reconverge(pending)
+                lanes = min(pending, key=_IP)
+                pending.remove(lanes)
+                # Run until another group is reached or passed
+                limit = min((other.ip for other in pending
+                             if other.ip > lanes.ip),
+                            default=len(self.code.instructions))
+                paused = self._run_lanes(lanes, limit)
+
+                if paused is None:
+                    finished.append(lanes)
+                else:
+                    pending.extend(paused)
+        
+        results = {}
+
+        for name in written_names(self.code):
+            parts = [
+                (lanes.index, self._read(name, lanes))
+                for lanes in finished if self._assigned(name, lanes)
+            ]
+
+            if parts:
+                results[name] = assemble(parts, self.rows)
+        
+        return results
+    
+    def _reconverge(self, pending: list) -> list:
+        """
+        Merge the groups of ``pending`` that stand at the same
+        instruction.
+        """
+        groups = []
+
+        for lanes in sorted(pending, key=_IP):
+            last = groups[-1] if groups else None
+
+            if last is not None and last.ip == lanes.ip:
+                merged = self._merge(last, lanes)
+
+                if merged is not None:
+                    groups[-1] = merged
+                    continue
+            groups.append(lanes)
+        
+        return groups
+    
+    def _merge(self, a: _Lanes, b: _Lanes):
+        """
+        One group of the lanes of ``a`` and ``b``, or None if
+        their values cannot share columns.
+        """
+        names = {}
+
+        for name in a.names.keys() | b.names.keys():
+            if not (self._assigned(name, a) and self._assigned(name, b)):
+                return None
+            
+            value = _join(self._read(name, a), len(a),
+                          self._read(name, b), len(b))
+
+            if value is None:
+                return None
+            names[name] = value
+        
+        stack = []
+
+        for value_a, value_b in zip(a.stack, b.stack):
+            value = _join(value_a, len(a), value_b, len(b))
+
+            if value is None:
+                return None
+            stack.append(value)
+        
+        return _Lanes(np.concatenate((a.index, b.index)), a.ip, stack,
+                      names)
+    
+    def _run_lanes(self, lanes: _Lanes, limit: int):
+        """
+        Run ``lanes`` until they finish (returns None), reach
+        ``limit`` (returns them) or diverge at a conditional
+        jump (returns both groups).
+        """
+        instructions = self.code.instructions
+        handlers = self._handlers
+        end = len(instructions)
+
+        while lanes.ip < end:
+            opcode, operands = instructions[lanes.ip]
+            lanes.ip += 1
+
+            try:
+                split = handlers[opcode](operands, lanes)
+            except Exception as exc:
+                raise_lane_error(exc, lanes.ip - 1, opcode)
+            
+            if split is not None:
+                return split
+            if lanes.ip >= limit:
+                return [lanes]
+        
+        return None
+    
+    def _read(self, name: str, lanes: _Lanes):
+        """
+        Value of ``name`` in ``lanes``: their own assignment,
+        else the input column, else the globals.
+        """
+        if name in lanes.names:
+            return lanes.names[name]
+        
+        column = self.columns.get(name)
+
+        if column is not None:
+            return column if lanes.index is None else column[lanes.index]
+        return self.globals.get(name)
+    
+    def _assigned(self, name: str, lanes: _Lanes) -> bool:
+        """
+        True if ``name`` has a value in ``lanes`` at the end,
+        as the per-row namespace would.
+        """
+        return (name in lanes.names or name in self.columns
+                or self.globals.exists(name))
+    
+    def _branch(self, lanes: _Lanes, condition, target: int,
+                when: bool):
+        """
+        Jump the lanes whose ``condition`` truth is ``when``;
+        returns the two groups if only some of them jump.
+        """
+        if not isinstance(condition, np.ndarray):
+            if bool(condition) is when:
+                lanes.ip = target
+            return None
+        
+        jumps = condition.astype(bool)
+
+        if not when:
+            jumps = ~jumps
+        
+        if jumps.all():
+            lanes.ip = target
+            return None
+        
+        if not jumps.any():
+            return None
+        
+        return [lanes.take(~jumps, lanes.ip), lanes.take(jumps, target)]
+    
+    # -----------------------------------
+    # opcode handlers
+    # -----------------------------------
+
+    def op_load_const(self, operands, lanes):
+        lanes.stack.append(self.constants[operands[0]])
+    
+    def op_load_global(self, operands, lanes):
+        lanes.stack.append(self._read(operands[0], lanes))
+    
+    def op_store_var(self, operands, lanes):
+        lanes.names[operands[0]] = lanes.stack.pop()
+    
+    def op_add(self, _, lanes):
+        b = lanes.stack.pop()
+        lanes.stack[-1] = checked(operator.add, lanes.stack[-1], b)
+    
+    def op_sub(self, _, lanes):
+        b = lanes.stack.pop()
+        lanes.stack[-1] = checked(operator.sub, lanes.stack[-1], b)
+    
+    def op_mul(self, _, lanes):
+        b = lanes.stack.pop()
+        lanes.stack[-1] = checked(operator.mul, lanes.stack[-1], b)
+    
+    def op_div(self, _, lanes):
+        b = lanes.stack.pop()
+        lanes.stack[-1] = lanes.stack[-1] / b
+    
+    def op_pop_top(self, _, lanes):
+        lanes.stack.pop()
+    
+    def op_dup_top(self, _, lanes):
+        lanes.stack.append(lanes.stack[-1])
+    
+    def op_jump(self, operands, lanes):
+        lanes.ip = operands[0]
+    
+    def op_jump_if_true(self, operands, lanes):
+        return self._branch(lanes, lanes.stack.pop(), operands[0], True)
+    
+    def op_jump_if_false(self, operands, lanes):
+        return self._branch(lanes, lanes.stack.pop(), operands[0], False)
+    
+    def op_peek_jump_if_true(self, operands, lanes):
+        return self._branch(lanes, lanes.stack[-1], operands[0], True)
+    
+    def op_peek_jump_if_false(self, operands, lanes):
+        return self._branch(lanes, lanes.stack[-1], operands[0], False)
+    
+    def op_halt(self, _, lanes):
+        lanes.ip = len(self.code.instructions)
+    
+    def op_incr_var(self, operands, lanes):
+        name, index = operands
+        lanes.names[name] = checked(operator.add, self._read(name, lanes),
+                                    self.constants[index])
+    
+    def op_decr_var(self, operands, lanes):
+        name, index = operands
+        lanes.names[name] = checked(operator.sub, self._read(name, lanes),
+                                    self.constants[index])
+    
+    def op_load_var_const_add(self, operands, lanes):
+        name, index = operands
+        lanes.stack.append(checked(operator.add, self._read(name, lanes),
+                                   self.constants[index]))
+
+
+def raise_lane_error(exc, ip: int, opcode: str):
+    """
+    Re-raise ``exc`` as a RuntimeExecutionError carrying the
+    failing IP and opcode.
+    """
+    if isinstance(exc, RuntimeExecutionError):
+        error = exc
+    else:
+        error = RuntimeExecutionError(str(exc))
+    
+    if error.ip is None:
+        error.ip, error.opcode, error.depth = ip, opcode, 1
+    
+    if error is exc:
+        raise error
+    raise error from exc
+
+
+# --------------------------------------------------
+# per-row fallback
+# --------------------------------------------------
+def run_rows(runtime, code, columns: dict, rows: int, base) -> dict:
+    """
+    Run verified ``code`` on the scalar engine once per row,
+    each time against a fresh overlay of the FrozenNamespace
+    ``base`` holding that row's inputs.
+
+    Returns the variables the program assigns as columns.
+    """
+    require_numpy()
+    inputs = {name: column.tolist() for name, column in columns.items()}
+    written = written_names(code)
+    outputs = {name: [] for name in written}
+    # Rows in which each variable was never assigned
+    unset = dict.fromkeys(written, 0)
+    overlay = OverlayNamespace(base)
+
+    for row in range(rows):
+        overlay.reset()
+
+        for name, values in inputs.items():
+            overlay.set(name, values[row])
+        
+        frame = runtime.new_frame(code, overlay, locals_ns=overlay)
+
+        try:
+            runtime.run(frame)
+        finally:
+            runtime.release_frame(frame)
+        
+        for name, values in outputs.items():
+            if overlay.exists(name):
+                values.append(overlay.get(name))
+            else:
+                values.append(None)
+                unset[name] += 1
+    
+    return {
+        name: np.array(values, dtype=object) if unset[name]
+        else np.asarray(values)
+        for name, values in outputs.items()
+        if unset[name] < rows
+    }
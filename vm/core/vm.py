@@ -36,10 +36,29 @@ Top-level Virtual Machine interface.
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
-from vm.bytecode import BytecodeLoader, BytecodeParser
+import asyncio
+import os
+
+from config.config import MEMORY_BUDGET, OPTIMIZE_BYTECODE, SCHEDULER_QUANTUM
+from vm.bytecode import (
+    BytecodeLoader,
+    BytecodeParser,
+    BytecodeDecoder,
+    BytecodeResolver,
+    BytecodeVerifier,
+)
+from vm.core.engine import raise_execution_error
+from vm.core.program import Program
 from vm.core.runtime import Runtime
-from vm.memory import Namespace
-from vm.stack import Frame
+from vm.core.vector import LaneExecutor, as_columns, run_rows, vectorizable
+from vm.memory import (
+    FrozenNamespace,
+    Namespace,
+    OverlayNamespace,
+    PureFunction,
+    ResultCache,
+)
+from vm.optimizer import BytecodeOptimizer
 from vm.utils import debug_log
 
 
@@ -51,29 +70,262 @@ class VirtualMachine:
     Python Virtual Machine.
     """
 
-    def __init__(self):
+    def __init__(self, optimize: bool = OPTIMIZE_BYTECODE,
+                 memory_budget: int = MEMORY_BUDGET,
+                 result_cache: ResultCache = None):
         self.loader = BytecodeLoader()
         self.parser = BytecodeParser()
-        self.runtime = Runtime()
+        self.decoder = BytecodeDecoder()
+        self.optimizer = BytecodeOptimizer()
+        self.resolver = BytecodeResolver()
+        self.verifier = BytecodeVerifier()
+        self.runtime = Runtime(memory_budget=memory_budget)
         self.globals = Namespace()
+        # Shared read-only base for run_overlay()
+        self.frozen_globals = None
+        self.optimize = optimize
+        # Results of pure host functions; pass one cache to
+        # several machines to share it
+        self.result_cache = result_cache if result_cache is not None \
+            else ResultCache()
+        # Report of the most recent optimization pass
+        self.last_optimization = None
+        self._cache_hits = 0
+        self._cache_misses = 0
+    
+    @property
+    def hooks(self):
+        """
+        Instrumentation hooks of the execution engine.
+        """
+        return self.runtime.engine.hooks
     
-    def run_file(self, path: str):
+    @property
+    def cache_stats(self):
+        """
+        Inline cache hits and misses of the programs run so far.
+        """
+        return {"hits": self._cache_hits, "misses": self._cache_misses}
+    
+    @property
+    def memo_stats(self):
+        """
+        Hits, misses, evictions and size of the result cache
+        of pure host functions.
+        """
+        return self.result_cache.stats()
+    
+    def register_pure(self, name: str, func) -> PureFunction:
+        """
+        Bind host function ``func`` to ``name`` in the globals,
+        caching its results by argument.
+
+        ``func`` must be pure: calls with equal hashable
+        arguments may be answered from the result cache.
+        """
+        pure = PureFunction(func, self.result_cache)
+        self.globals.set(name, pure)
+        return pure
+
+    def run_file(self, path: str, backend: str = None,
+                 optimize: bool = None):
         """
         Execute bytecode from file.
         """
         debug_log(f"Loading bytecode from {path}")
-        raw = self.loader.load_from_file(path)
-        instructions = self.parser.parse(raw)
-        frame = Frame(instructions, self.globals,
-                      locals_ns=self.globals)
-        self.runtime.run(frame)
+
+        if self.loader.is_binary(path):
+            code = self.loader.load_binary(path)
+        else:
+            raw = self.loader.load_from_file(path)
+            name = path if os.path.isfile(path) else "<module>"
+            code = self._decode(raw, name)
+        
+        self._run_code(code, backend, optimize)
     
-    def run_string(self, source: str):
+    def run_string(self, source: str, backend: str = None,
+                   optimize: bool = None):
         """
         Execute bytecode from string.
         """
         raw = self.loader.load_from_string(source)
-        instructions = self.parser.parse(raw)
-        frame = Frame(instructions, self.globals,
-                      locals_ns=self.globals)
-        self.runtime.run(frame)
+        self._run_code(self._decode(raw), backend, optimize)
+    
+    async def run_async(self, source: str, optimize: bool = None,
+                        globals_ns=None,
+                        quantum: int = SCHEDULER_QUANTUM):
+        """
+        Execute bytecode from string as a coroutine.
+
+        When a host function returns an awaitable, the program
+        is suspended and the event loop runs other work until
+        the result arrives; it is then pushed as the call's
+        result. The loop also gets control back every
+        ``quantum`` instructions, so many programs can overlap
+        on one loop. Runs on the reference engine, against the
+        globals or ``globals_ns`` when given.
+        """
+        raw = self.loader.load_from_string(source)
+        code = self._prepare(self._decode(raw), optimize)
+
+        if globals_ns is None:
+            globals_ns = self.globals
+        
+        runtime = self.runtime
+        frame = runtime.new_frame(code, globals_ns, locals_ns=globals_ns)
+        task = runtime.start(frame)
+
+        try:
+            while not runtime.step(task, quantum, awaiting=True):
+                if task.awaiting is None:
+                    await asyncio.sleep(0)
+                    continue
+                
+                awaitable, task.awaiting = task.awaiting, None
+                resumed = task.frame
+
+                try:
+                    value = await awaitable
+                except Exception as exc:
+                    # Reported at the suspended call
+                    task.error = exc
+                    raise_execution_error(exc, resumed, resumed.ip - 1,
+                                          task.callstack)
+                resumed.stack.push(value)
+        finally:
+            runtime.release_frame(frame)
+            self._collect_cache_stats(code)
+    
+    def load(self, source: str, optimize: bool = None) -> Program:
+        """
+        Prepare bytecode from string as a shareable Program.
+        """
+        raw = self.loader.load_from_string(source)
+        return Program(self._prepare(self._decode(raw), optimize))
+    
+    def load_file(self, path: str, optimize: bool = None) -> Program:
+        """
+        Prepare bytecode from file as a shareable Program.
+        """
+        if self.loader.is_binary(path):
+            code = self.loader.load_binary(path)
+        else:
+            code = self._decode(self.loader.load_from_file(path), path)
+        
+        return Program(self._prepare(code, optimize))
+    
+    def run_columns(self, source: str, columns: dict,
+                    optimize: bool = None,
+                    vectorize: bool = True) -> dict:
+        """
+        Execute bytecode from string once for every row of
+        ``columns`` (input name -> 1-D NumPy array, all of one
+        length) and return each variable the program assigns
+        as an array with one value per row.
+
+        Programs of loads, stores, arithmetic and jumps run
+        once over whole columns (see vm.core.vector); others,
+        or any program given ``vectorize=False``, run on the
+        scalar engine row by row. Needs NumPy. The globals are
+        read, never written.
+        """
+        arrays, rows = as_columns(columns)
+        raw = self.loader.load_from_string(source)
+        code = self._prepare(self._decode(raw), optimize)
+
+        if vectorize and vectorizable(code):
+            return LaneExecutor(code, arrays, rows, self.globals).run()
+        
+        try:
+            return run_rows(self.runtime, code, arrays, rows,
+                            self.globals.freeze())
+        finally:
+            self._collect_cache_stats(code)
+    
+    def freeze_globals(self) -> FrozenNamespace:
+        """
+        Snapshot the globals as the shared base of overlay
+        runs. Later changes to the globals need a new snapshot.
+        """
+        self.frozen_globals = self.globals.freeze()
+        return self.frozen_globals
+    
+    def run_overlay(self, source: str,
+                    overlay: OverlayNamespace = None,
+                    backend: str = None,
+                    optimize: bool = None) -> OverlayNamespace:
+        """
+        Execute bytecode from string against a copy-on-write
+        overlay of the frozen globals.
+
+        A previous overlay can be passed to be reset and
+        reused. Returns the overlay holding the program's
+        writes; the shared base is never modified.
+        """
+        if overlay is None:
+            if self.frozen_globals is None:
+                self.freeze_globals()
+            overlay = OverlayNamespace(self.frozen_globals)
+        else:
+            overlay.reset()
+        
+        raw = self.loader.load_from_string(source)
+        self._run_code(self._decode(raw), backend, optimize,
+                       globals_ns=overlay)
+        return overlay
+    
+    def _decode(self, raw, name="<module>"):
+        """
+        Parse and decode raw bytecode lines, including any
+        ``.function`` blocks.
+        """
+        main, functions = self.parser.parse_program(raw)
+        return self.decoder.decode_program(main, functions, name=name)
+    
+    def _run_code(self, code, backend=None, optimize=None,
+                  globals_ns=None):
+        """
+        Execute a decoded code object against the globals,
+        or against ``globals_ns`` when given.
+
+        ``optimize`` overrides the VM's optimization switch
+        for this program.
+        """
+        if globals_ns is None:
+            globals_ns = self.globals
+        
+        code = self._prepare(code, optimize)
+        frame = self.runtime.new_frame(code, globals_ns,
+                                       locals_ns=globals_ns)
+
+        try:
+            self.runtime.run(frame, backend)
+        finally:
+            self.runtime.release_frame(frame)
+            self._collect_cache_stats(code)
+    
+    def _prepare(self, code, optimize=None):
+        """
+        Optimize (when enabled), resolve and verify a decoded
+        code object; returns the code to run.
+        """
+        if self.optimize if optimize is None else optimize:
+            code = self.optimizer.optimize(code)
+            self.last_optimization = self.optimizer.last_report
+            debug_log(str(self.last_optimization))
+        
+        self.resolver.resolve(code)
+        self.verifier.verify(code)
+        return code
+    
+    def _collect_cache_stats(self, code):
+        """
+        Move the inline cache counters of ``code`` and its
+        functions into the VM totals.
+        """
+        for each in (code, *code.functions.values()):
+            for cache in each.caches:
+                if cache is not None:
+                    self._cache_hits += cache.hits
+                    self._cache_misses += cache.misses
+                    cache.reset_stats()
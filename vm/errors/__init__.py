@@ -42,22 +42,26 @@ bytecode parsing and execution.
 from .exceptions import (
     VMError,
     BytecodeError,
+    VerificationError,
     InvalidOpcodeError,
     StackUnderflowError,
     StackOverflowError,
     VariableNotFoundError,
     RuntimeExecutionError,
     CallStackOverflowError,
+    MemoryBudgetExceededError,
 )
 
 
 __all__ = [
     "VMError",
     "BytecodeError",
+    "VerificationError",
     "InvalidOpcodeError",
     "StackUnderflowError",
     "StackOverflowError",
     "VariableNotFoundError",
     "RuntimeExecutionError",
     "CallStackOverflowError",
+    "MemoryBudgetExceededError",
 ]
@@ -57,6 +57,13 @@ class BytecodeError(VMError):
     pass
 
 
+class VerificationError(BytecodeError):
+    """
+    Raised when bytecode fails load-time verification.
+    """
+    pass
+
+
 class InvalidOpcodeError(BytecodeError):
     """
     Raised when an unknown or unsupported opcode is encountered.
@@ -89,8 +96,25 @@ class StackOverflowError(VMError):
 class RuntimeExecutionError(VMError):
     """
     Raised when a runtime execution error occurs.
+
+    The engine fills in the failing instruction index, its
+    opcode and the call stack depth.
     """
-    pass
+    def __init__(self, message: str = "", ip=None, opcode=None,
+                 depth=None):
+        super().__init__(message)
+        self.ip = ip
+        self.opcode = opcode
+        self.depth = depth
+    
+    def __str__(self) -> str:
+        message = super().__str__()
+
+        if self.ip is None:
+            return message
+        
+        return (f"{message} (ip={self.ip}, opcode={self.opcode}, "
+                f"depth={self.depth})")
 
 
 class VariableNotFoundError(RuntimeExecutionError):
@@ -107,3 +131,10 @@ class CallStackOverflowError(RuntimeExecutionError):
     Raised when the call stack exceeds its maximum depth.
     """
     pass
+
+
+class MemoryBudgetExceededError(RuntimeExecutionError):
+    """
+    Raised when a run exceeds its memory budget.
+    """
+    pass
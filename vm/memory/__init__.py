@@ -39,11 +39,20 @@ for the Python Virtual Machine.
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
-from .namespace import Namespace
+from .namespace import FrozenNamespace, Namespace, OverlayNamespace
 from .constants import ConstantsPool
+from .cache import InlineCache
+from .accounting import MemoryMeter
+from .memo import PureFunction, ResultCache
 
 
 __all__ = [
     "Namespace",
+    "FrozenNamespace",
+    "OverlayNamespace",
     "ConstantsPool",
+    "InlineCache",
+    "MemoryMeter",
+    "ResultCache",
+    "PureFunction",
 ]
@@ -0,0 +1,234 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+# --------------------------------------------------
+# accounting MODULE
+# --------------------------------------------------
+"""
+Approximate memory accounting.
+
+A MemoryMeter tracks an estimate of the bytes a run holds:
+its constants, operand stack and variable slots, charged
+once when the run starts, plus the values it binds to
+named variables, updated on every store. Values the program
+creates are checked against the remaining budget as they
+are pushed; ADD and MUL results are sized from their
+operands before they are built, so an oversized string is
+refused instead of allocated. Function frames are not
+charged as they run: a large result is checked together
+with the values every active frame holds. Sizes come from
+sys.getsizeof, so containers count only their own storage.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import operator
+import sys
+
+from vm.errors import MemoryBudgetExceededError
+
+
+# Size of one operand stack entry or variable slot (a pointer)
+POINTER_SIZE = 8
+
+# Values that are never large: binding them is not sized.
+# Unassigned slots hold a bare object.
+SMALL_TYPES = frozenset({int, float, bool, type(None), object})
+
+# Values whose size is fixed: creating them is not checked.
+# Integers are left out, as they can grow without bound.
+FIXED_SIZE_TYPES = frozenset({float, bool, type(None)})
+# Integers below this magnitude are as good as fixed size
+FIXED_INT_LIMIT = 1 << 64
+
+# Results from this many bytes on are checked together with
+# the values held by the active frames
+LARGE_RESULT = 4096
+
+_getsizeof = sys.getsizeof
+
+
+def result_size(func, a, b):
+    """
+    Upper bound on the sequence length or int bit length of
+    ``func(a, b)``, from its operands alone; None for
+    fixed-size results.
+    """
+    sequence = (str, bytes, list, tuple)
+
+    if func is operator.truediv:
+        return None
+    
+    if func is operator.mul:
+        if isinstance(a, int) and isinstance(b, sequence):
+            a, b = b, a
+        if isinstance(a, sequence) and isinstance(b, int):
+            return len(a) * max(b, 0)
+    
+    if isinstance(a, sequence) and isinstance(b, sequence):
+        return len(a) + len(b)
+    
+    if isinstance(a, int) and isinstance(b, int):
+        if func is operator.mul:
+            return a.bit_length() + b.bit_length()
+        return max(a.bit_length(), b.bit_length()) + 1
+    
+    return None
+
+
+def result_bytes(func, a, b):
+    """
+    Estimated bytes of ``func(a, b)`` before it is built;
+    None for fixed-size results.
+    """
+    size = result_size(func, a, b)
+
+    if size is None:
+        return None
+    if isinstance(a, (list, tuple)) or isinstance(b, (list, tuple)):
+        return size * POINTER_SIZE
+    if isinstance(a, (str, bytes)) or isinstance(b, (str, bytes)):
+        return size
+    # An int bit length
+    return size // 8
+
+
+def held_bytes(frame) -> int:
+    """
+    Bytes of the values on the operand stacks and in the
+    variable slots of ``frame`` and the frames that called it.
+    """
+    nbytes = 0
+
+    while frame is not None:
+        for values in (frame.stack, frame.fast):
+            for value in values:
+                if type(value) not in SMALL_TYPES:
+                    nbytes += _getsizeof(value)
+        frame = frame.caller
+    return nbytes
+
+
+# --------------------------------------------------
+# memory meter
+# --------------------------------------------------
+class MemoryMeter:
+    """
+    Running byte estimate of one run against its budget.
+    """
+
+    __slots__ = ("budget", "used")
+
+    def __init__(self, budget: int):
+        self.budget = budget
+        self.used = 0
+    
+    def charge(self, nbytes: int):
+        """
+        Add ``nbytes`` to the estimate.
+        """
+        self.used += nbytes
+
+        if self.used > self.budget:
+            self.exceeded(self.used)
+    
+    def charge_code(self, code):
+        """
+        Charge the constants, operand stack and variable slots
+        of ``code``.
+        """
+        depth = code.max_stack if code.max_stack is not None \
+            else len(code.instructions)
+        self.charge(
+            sum(_getsizeof(value) for value in code.constants.values)
+            + (depth + len(code.varnames)) * POINTER_SIZE
+        )
+    
+    def check(self, value, frame=None):
+        """
+        Fail if holding ``value`` as well would exceed the
+        budget. A large value is counted together with the
+        values held by ``frame`` and its callers.
+        """
+        if type(value) in FIXED_SIZE_TYPES:
+            return
+        if type(value) is int and \
+                -FIXED_INT_LIMIT < value < FIXED_INT_LIMIT:
+            return
+        
+        nbytes = _getsizeof(value)
+        needed = self.used + nbytes
+
+        if nbytes >= LARGE_RESULT and frame is not None:
+            needed += held_bytes(frame)
+        if needed > self.budget:
+            self.exceeded(needed)
+    
+    def check_result(self, func, a, b, frame):
+        """
+        Fail before ``func(a, b)`` is evaluated if holding its
+        result would exceed the budget. A large result is
+        counted together with the values held by ``frame`` and
+        its callers.
+        """
+        nbytes = result_bytes(func, a, b)
+
+        if nbytes is None:
+            return
+        
+        needed = self.used + nbytes
+
+        if nbytes >= LARGE_RESULT:
+            needed += held_bytes(frame)
+        if needed > self.budget:
+            self.exceeded(needed)
+    
+    def replace(self, old, new):
+        """
+        Account for a variable rebound from ``old`` to ``new``
+        (``old`` is None for a new variable).
+        """
+        used = self.used
+
+        if type(new) not in SMALL_TYPES:
+            used += _getsizeof(new)
+        if type(old) not in SMALL_TYPES:
+            used -= _getsizeof(old)
+        self.used = used
+
+        if used > self.budget:
+            self.exceeded(used)
+    
+    def exceeded(self, needed: int):
+        """
+        Raise MemoryBudgetExceededError for ``needed`` bytes.
+        """
+        raise MemoryBudgetExceededError(
+            f"Memory budget of {self.budget} bytes exceeded "
+            f"({needed} bytes)"
+        )
@@ -0,0 +1,93 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+# --------------------------------------------------
+# cache MODULE
+# --------------------------------------------------
+"""
+Inline lookup caches.
+
+Each name-loading instruction of verified code owns an
+InlineCache. It remembers which namespace in the chain binds
+the name, and stays valid while the namespace it was asked
+and that chain's keys version are unchanged. A hit reads the
+current value from the binding namespace, so rebinding the
+name, or any other, keeps the cache valid; only a new name
+that could shadow it does not.
+
+The cached entry is a single tuple replaced in one
+assignment, so threads running the same code never see a
+scope paired with the wrong namespace or version. Only the
+hit and miss counters may lose updates under contention.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+
+
+# --------------------------------------------------
+# inline cache
+# --------------------------------------------------
+class InlineCache:
+    """
+    Remembers the last variable lookup of one instruction.
+    """
+
+    __slots__ = ("entry", "hits", "misses")
+
+    def __init__(self):
+        # (namespace, version, binding scope) of the last lookup
+        self.entry = (None, -1, None)
+        self.hits = 0
+        self.misses = 0
+    
+    def lookup(self, namespace, name: str):
+        """
+        Return ``name`` from ``namespace``, walking the parent
+        chain only when the cached entry is stale.
+        """
+        entry = self.entry
+
+        if entry[0] is namespace and entry[1] == namespace._clock[0]:
+            self.hits += 1
+            return entry[2][name]
+        
+        self.misses += 1
+        # Version first: a new name racing with the walk forces
+        # a miss
+        version = namespace._clock[0]
+        scope = namespace.scope_of(name)
+        self.entry = (namespace, version, scope)
+        return scope[name]
+    
+    def reset_stats(self):
+        """
+        Zero the hit and miss counters.
+        """
+        self.hits = 0
+        self.misses = 0
@@ -33,11 +33,15 @@
 """
 Constants pool.
 
-Stores immutable constants used by bytecode.
+Stores immutable constants used by bytecode. Equal
+constants share one entry: the index is keyed by type and
+value, so 1, 1.0 and True stay distinct, and string
+constants are interned.
 """
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
+import sys
 
 
 # --------------------------------------------------
@@ -48,15 +52,37 @@ class ConstantsPool:
     Manages constants referenced by bytecode.
     """
 
-    def __init__(self):
+    __slots__ = ("_constants", "_index")
+
+    def __init__(self, values=None):
         self._constants = []
+        # (type, value) -> index of the first equal constant
+        self._index = {}
+
+        # Loaded values keep their positions, duplicates included
+        for value in values or ():
+            self._constants.append(self._intern(value))
+            key = self._key(value)
+
+            if key is not None:
+                self._index.setdefault(key, len(self._constants) - 1)
     
     def add(self, value):
         """
-        Add a constant and return its index.
+        Add a constant and return its index, reusing the
+        index of an equal constant already in the pool.
         """
-        self._constants.append(value)
-        return len(self._constants) - 1
+        key = self._key(value)
+
+        if key is not None and key in self._index:
+            return self._index[key]
+        
+        self._constants.append(self._intern(value))
+        index = len(self._constants) - 1
+
+        if key is not None:
+            self._index[key] = index
+        return index
     
     def get(self, index: int):
         """
@@ -67,5 +93,31 @@ class ConstantsPool:
         except IndexError:
             raise IndexError(f"Invalid constant index: {index}")
     
+    @property
+    def values(self) -> list:
+        """
+        Backing list, indexed directly by the execution engine.
+        Must not be modified.
+        """
+        return self._constants
+    
+    @staticmethod
+    def _key(value):
+        # repr keeps -0.0 apart from 0.0 and lets NaN match itself
+        if type(value) is float:
+            return (float, repr(value))
+        
+        try:
+            hash(value)
+        except TypeError:
+            return None
+        return (type(value), value)
+    
+    @staticmethod
+    def _intern(value):
+        if type(value) is str:
+            return sys.intern(value)
+        return value
+    
     def __len__(self):
         return len(self._constants)
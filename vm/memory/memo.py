@@ -0,0 +1,253 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# memo MODULE
+# --------------------------------------------------
+"""
+Result caching for pure host functions.
+
+A host function registered as pure is wrapped in a
+PureFunction, which looks its arguments up in a ResultCache
+before calling through. The cache is a bounded LRU with an
+optional time-to-live and a byte cap on the estimated size
+of everything it holds. Calls with unhashable arguments, or
+with frozensets, whose items cannot be typed, bypass it. One cache can back many functions and many
+VirtualMachine instances, including ones running on other
+threads: lookups, stores and evictions hold a lock, the
+wrapped function call does not.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import inspect
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+from config.config import MEMO_MAX_BYTES, MEMO_MAX_ENTRIES, MEMO_TTL
+
+
+# Marker for "arguments are unhashable"
+_BYPASS = object()
+
+
+def _signature(values: tuple):
+    """
+    Types of ``values``, nested through tuples, as 1, 1.0 and
+    True are equal keys otherwise; None if one holds a
+    frozenset.
+    """
+    types = []
+
+    for value in values:
+        if isinstance(value, tuple):
+            inner = _signature(value)
+
+            if inner is None:
+                return None
+            types.append((type(value), inner))
+        elif isinstance(value, frozenset):
+            return None
+        else:
+            types.append(type(value))
+    
+    return tuple(types)
+
+
+# --------------------------------------------------
+# result cache
+# --------------------------------------------------
+class ResultCache:
+    """
+    Bounded LRU cache of function results.
+    """
+
+    def __init__(self, max_entries: int = MEMO_MAX_ENTRIES,
+                 max_bytes: int = MEMO_MAX_BYTES,
+                 ttl: float = MEMO_TTL):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        # Seconds an entry stays valid (None: until evicted)
+        self.ttl = ttl
+        # key -> (value, size, expiry time or None)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.bypasses = 0
+        self.evictions = 0
+        self.expirations = 0
+    
+    def call(self, func, args: tuple):
+        """
+        Return ``func(*args)``, from the cache when possible.
+        """
+        types = _signature(args)
+
+        with self._lock:
+            if types is None:
+                self.bypasses += 1
+                entry = _BYPASS
+            else:
+                key = (func, args, types)
+                entry = self._lookup(key)
+        
+        if entry is _BYPASS:
+            return func(*args)
+        if entry is not None:
+            return entry[0]
+        
+        # Called unlocked: other lookups go on meanwhile
+        value = func(*args)
+        self._store(key, value)
+        return value
+    
+    def _lookup(self, key):
+        """
+        Live entry for ``key``, None on a miss or _BYPASS.
+        Must hold the lock.
+        """
+        try:
+            entry = self._entries.get(key)
+        except TypeError:
+            # Unhashable argument
+            self.bypasses += 1
+            return _BYPASS
+        
+        if entry is not None:
+            if entry[2] is None or entry[2] > time.monotonic():
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry
+            
+            self.expirations += 1
+            self._discard(key)
+        
+        self.misses += 1
+        return None
+    
+    def _store(self, key, value):
+        size = sys.getsizeof(key) + sys.getsizeof(value) + sum(
+            sys.getsizeof(arg) for arg in key[1]
+        )
+
+        if size > self.max_bytes or self.max_entries <= 0:
+            return
+        
+        expires = None if self.ttl is None \
+            else time.monotonic() + self.ttl
+        
+        with self._lock:
+            # Another thread may have stored the same call
+            if key in self._entries:
+                self._discard(key)
+            
+            self._entries[key] = (value, size, expires)
+            self.nbytes += size
+
+            while (len(self._entries) > self.max_entries
+                   or self.nbytes > self.max_bytes):
+                oldest = next(iter(self._entries))
+                self._discard(oldest)
+                self.evictions += 1
+    
+    def _discard(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.nbytes -= size
+    
+    @property
+    def hit_rate(self) -> float:
+        """
+        Share of cacheable calls answered from the cache.
+        """
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+    
+    def stats(self) -> dict:
+        """
+        Counters and current size of the cache.
+        """
+        with self._lock:
+            return self._stats()
+    
+    def _stats(self) -> dict:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "bypasses": self.bypasses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "entries": len(self._entries),
+            "bytes": self.nbytes,
+            "hit_rate": self.hit_rate,
+        }
+    
+    def clear(self):
+        """
+        Drop every entry; the counters are kept.
+        """
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = 0
+    
+    def __len__(self):
+        return len(self._entries)
+
+
+# --------------------------------------------------
+# pure function
+# --------------------------------------------------
+class PureFunction:
+    """
+    Host function whose results may be cached.
+
+    The function must return the same value for the same
+    arguments and have no side effects. Coroutine functions
+    are refused: a cached coroutine can be awaited only once.
+    """
+
+    __slots__ = ("func", "cache")
+
+    def __init__(self, func, cache: ResultCache):
+        if inspect.iscoroutinefunction(func):
+            name = getattr(func, "__name__", repr(func))
+            raise TypeError(f"Coroutine function cannot be pure: {name}")
+        
+        self.func = func
+        self.cache = cache
+    
+    def __call__(self, *args):
+        return self.cache.call(self.func, args)
+    
+    def __repr__(self) -> str:
+        name = getattr(self.func, "__name__", repr(self.func))
+        return f"<pure {name}>"
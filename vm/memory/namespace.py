@@ -32,10 +32,15 @@
 # --------------------------------------------------
 """
 Variable namespace implementation
+
+FrozenNamespace and OverlayNamespace let many programs run
+against one shared, read-only environment: each run writes
+into its own overlay on top of a frozen base.
 """
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
+from vm.errors import VariableNotFoundError
 
 
 # --------------------------------------------------
@@ -46,9 +51,24 @@ class Namespace:
     Represents a variable namespace (locals or globals).
     """
 
+    __slots__ = ("_values", "_parent", "_clock")
+
     def __init__(self, parent=None):
         self._values = {}
         self._parent = parent
+        # Keys version shared along the parent chain. It is
+        # bumped when a name is first bound anywhere in the
+        # chain, which can shadow a cached lookup; rebinding a
+        # name leaves it, and cached lookups, alone
+        self._clock = parent._clock if parent is not None else [0]
+    
+    @property
+    def version(self) -> int:
+        """
+        Counter bumped whenever the names bound in this
+        namespace chain change.
+        """
+        return self._clock[0]
     
     def get(self, name: str):
         """
@@ -60,13 +80,44 @@ class Namespace:
         if self._parent is not None:
             return self._parent.get(name)
         
-        raise KeyError(f"Variable not found: {name}")
+        raise VariableNotFoundError(name)
     
     def set(self, name: str, value):
         """
         Set a variable value.
         """
-        self._values[name] = value
+        values = self._values
+
+        if name not in values:
+            self._clock[0] += 1
+        values[name] = value
+    
+    def swap(self, name: str, value):
+        """
+        Set a variable value; returns the value it replaces in
+        this namespace, or None.
+        """
+        values = self._values
+        old = values.get(name)
+
+        if old is None and name not in values:
+            self._clock[0] += 1
+        values[name] = value
+        return old
+    
+    def scope_of(self, name: str) -> dict:
+        """
+        The variables dict of the namespace in the chain that
+        binds ``name``.
+        """
+        namespace = self
+
+        while namespace is not None:
+            if name in namespace._values:
+                return namespace._values
+            namespace = namespace._parent
+        
+        raise VariableNotFoundError(name)
     
     def exists(self, name: str) -> bool:
         """
@@ -79,3 +130,75 @@ class Namespace:
             return self._parent.exists(name)
         
         return False
+    
+    def freeze(self) -> "FrozenNamespace":
+        """
+        Read-only snapshot of the variables visible from this
+        namespace.
+        """
+        return FrozenNamespace(self)
+
+
+# --------------------------------------------------
+# frozen namespace
+# --------------------------------------------------
+class FrozenNamespace(Namespace):
+    """
+    Read-only flattened snapshot of a namespace chain.
+    """
+
+    __slots__ = ()
+
+    def __init__(self, source: Namespace):
+        super().__init__()
+        chain = []
+
+        while source is not None:
+            chain.append(source._values)
+            source = source._parent
+        
+        # Outermost first, so inner bindings win
+        for values in reversed(chain):
+            self._values.update(values)
+    
+    def set(self, name: str, value):
+        raise TypeError(f"Cannot assign '{name}' in a frozen namespace")
+    
+    swap = set
+
+
+# --------------------------------------------------
+# overlay namespace
+# --------------------------------------------------
+class OverlayNamespace(Namespace):
+    """
+    Copy-on-write layer over a frozen base.
+
+    Reads fall through to the base, writes stay in the
+    overlay. Creation is O(1) and reset is O(changes).
+    """
+
+    __slots__ = ()
+
+    def __init__(self, base: FrozenNamespace):
+        super().__init__(parent=base)
+        # The base never changes: a clock of its own keeps
+        # overlays used by different threads independent
+        self._clock = [0]
+    
+    @property
+    def base(self) -> FrozenNamespace:
+        return self._parent
+    
+    def changes(self) -> dict:
+        """
+        Variables written since the last reset.
+        """
+        return dict(self._values)
+    
+    def reset(self):
+        """
+        Drop every write, exposing the base again.
+        """
+        self._values.clear()
+        self._clock[0] += 1
@@ -0,0 +1,53 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# __init__ MODULE
+# --------------------------------------------------
+"""
+Bytecode optimization package.
+
+Static passes that rewrite decoded code objects before
+execution.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+from .report import OptimizationReport
+from .peephole import PeepholeOptimizer
+from .static import StaticOptimizer
+from .pipeline import BytecodeOptimizer
+
+
+__all__ = [
+    "OptimizationReport",
+    "PeepholeOptimizer",
+    "StaticOptimizer",
+    "BytecodeOptimizer",
+]
@@ -0,0 +1,102 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# jumps MODULE
+# --------------------------------------------------
+"""
+Jump target helpers shared by the optimization passes.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+from typing import Dict, List, Set, Tuple
+
+from vm.bytecode.instructions import JUMP_OPCODES
+from vm.errors import VerificationError
+
+
+def jump_target(index: int, opcode: str, operands: list) -> int:
+    """
+    Target of the jump at ``index``.
+
+    The passes run before verification, so a missing or
+    non-integer target raises VerificationError here, as the
+    verifier would report it.
+    """
+    if len(operands) != 1:
+        raise VerificationError(
+            f"{opcode} expects 1 operand(s) at instruction {index}"
+        )
+    
+    try:
+        return int(operands[0])
+    except (TypeError, ValueError):
+        raise VerificationError(
+            f"Non-integer operand '{operands[0]}' at instruction {index}"
+        ) from None
+
+
+def check_jumps(instructions: List[Tuple[str, list]]):
+    """
+    Raise VerificationError for any malformed jump operand.
+    """
+    jump_targets(instructions)
+
+
+def jump_targets(instructions: List[Tuple[str, list]]) -> Set[int]:
+    """
+    Collect every instruction index used as a jump target.
+    """
+    return {
+        jump_target(index, opcode, operands)
+        for index, (opcode, operands) in enumerate(instructions)
+        if opcode in JUMP_OPCODES
+    }
+
+
+def remap_jumps(instructions: List[Tuple[str, list]],
+                mapping: Dict[int, int]) -> List[Tuple[str, list]]:
+    """
+    Rewrite jump operands through an old -> new index map.
+
+    Targets missing from the map (out of range in the
+    original program) are left unchanged; the rewritten
+    program is never longer, so they stay invalid.
+    """
+    remapped = []
+
+    for opcode, operands in instructions:
+        if opcode in JUMP_OPCODES:
+            target = int(operands[0])
+            operands = [mapping.get(target, target), *operands[1:]]
+        
+        remapped.append((opcode, operands))
+    
+    return remapped
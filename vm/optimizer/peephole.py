@@ -0,0 +1,174 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# peephole MODULE
+# --------------------------------------------------
+"""
+Peephole optimizer.
+
+Rewrites common instruction sequences into fused
+superinstructions:
+
+    LOAD_VAR x; LOAD_CONST k; ADD; STORE_VAR x  -> INCR_VAR x k
+    LOAD_VAR x; LOAD_CONST k; SUB; STORE_VAR x  -> DECR_VAR x k
+    LOAD_VAR x; LOAD_CONST k; ADD               -> LOAD_VAR_CONST_ADD x k
+    DUP_TOP; JUMP_IF_FALSE t                    -> PEEK_JUMP_IF_FALSE t
+    DUP_TOP; JUMP_IF_TRUE t                     -> PEEK_JUMP_IF_TRUE t
+
+and, in function code only:
+
+    CALL n; RETURN_VAL                          -> TAIL_CALL n
+
+A sequence is only fused when none of its instructions but
+the first is a jump target; every jump is then remapped to
+the new instruction indexes.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+from vm.bytecode.code import CodeObject
+from .jumps import jump_targets, remap_jumps
+from .report import OptimizationReport
+
+
+# --------------------------------------------------
+# peephole optimizer
+# --------------------------------------------------
+class PeepholeOptimizer:
+    """
+    Fuses instruction sequences into superinstructions.
+    """
+
+    def __init__(self):
+        self.last_report = None
+        # Tried in order: longer patterns first
+        self._patterns = [
+            (4, self._match_update),
+            (3, self._match_load_var_const_add),
+            (2, self._match_peek_jump),
+        ]
+        # Function code also gets tail calls
+        self._function_patterns = self._patterns + [
+            (2, self._match_tail_call),
+        ]
+    
+    def optimize(self, code: CodeObject) -> CodeObject:
+        """
+        Return an optimized copy of ``code``.
+        """
+        instructions = code.instructions
+        patterns = self._function_patterns if code.is_function \
+            else self._patterns
+        report = OptimizationReport(code.name, len(instructions))
+        targets = jump_targets(instructions)
+        rewritten = []
+        mapping = {}
+        index = 0
+
+        while index < len(instructions):
+            mapping[index] = len(rewritten)
+            fused = None
+
+            for length, match in patterns:
+                window = instructions[index:index + length]
+
+                if len(window) < length or any(
+                        index + offset in targets
+                        for offset in range(1, length)):
+                    continue
+                
+                fused = match(window)
+
+                if fused is not None:
+                    break
+            
+            if fused is None:
+                rewritten.append(instructions[index])
+                index += 1
+                continue
+            
+            rewritten.append(fused)
+            report.rewrites[fused[0]] += 1
+            index += length
+        
+        report.after = len(rewritten)
+        self.last_report = report
+
+        return code.derive(remap_jumps(rewritten, mapping))
+    
+    # -----------------------------------
+    # patterns
+    # -----------------------------------
+    # Each matcher receives a window of instructions and
+    # returns the fused instruction, or None.
+
+    def _match_update(self, window):
+        opcodes = [opcode for opcode, _ in window]
+
+        if opcodes[:2] != ["LOAD_VAR", "LOAD_CONST"]:
+            return None
+        if opcodes[3] != "STORE_VAR":
+            return None
+        
+        name = window[0][1][0]
+        const = window[1][1][0]
+
+        if window[3][1][0] != name:
+            return None
+        if opcodes[2] == "ADD":
+            return ("INCR_VAR", [name, const])
+        if opcodes[2] == "SUB":
+            return ("DECR_VAR", [name, const])
+        return None
+    
+    def _match_load_var_const_add(self, window):
+        opcodes = [opcode for opcode, _ in window]
+
+        if opcodes != ["LOAD_VAR", "LOAD_CONST", "ADD"]:
+            return None
+        return ("LOAD_VAR_CONST_ADD", [window[0][1][0], window[1][1][0]])
+    
+    def _match_peek_jump(self, window):
+        (dup, _), (jump, operands) = window
+
+        if dup != "DUP_TOP":
+            return None
+        if jump == "JUMP_IF_FALSE":
+            return ("PEEK_JUMP_IF_FALSE", list(operands))
+        if jump == "JUMP_IF_TRUE":
+            return ("PEEK_JUMP_IF_TRUE", list(operands))
+        return None
+    
+    def _match_tail_call(self, window):
+        (call, operands), (ret, _) = window
+
+        if call != "CALL" or ret != "RETURN_VAL":
+            return None
+        return ("TAIL_CALL", list(operands))
@@ -0,0 +1,92 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# pipeline MODULE
+# --------------------------------------------------
+"""
+Optimization pipeline.
+
+Runs the static passes (folding, threading, dead code)
+and then the peephole pass, merging their reports.
+Function code objects are optimized with their program.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+from vm.bytecode.code import CodeObject
+from .peephole import PeepholeOptimizer
+from .report import OptimizationReport
+from .static import StaticOptimizer
+
+
+# --------------------------------------------------
+# bytecode optimizer
+# --------------------------------------------------
+class BytecodeOptimizer:
+    """
+    Applies every optimization pass in order.
+    """
+
+    def __init__(self):
+        self.passes = [StaticOptimizer(), PeepholeOptimizer()]
+        self.last_report = None
+    
+    def optimize(self, code: CodeObject) -> CodeObject:
+        """
+        Return an optimized copy of ``code`` and its functions.
+        """
+        functions = code.functions
+        report = OptimizationReport(
+            code.name,
+            len(code) + sum(len(func) for func in functions.values()),
+        )
+        code = self._run_passes(code, report)
+
+        if functions:
+            # The copies share a new functions table
+            code.functions = {}
+
+            for name, func in functions.items():
+                func = self._run_passes(func, report)
+                func.functions = code.functions
+                code.functions[name] = func
+        
+        report.after = len(code) + sum(
+            len(func) for func in code.functions.values()
+        )
+        self.last_report = report
+        return code
+    
+    def _run_passes(self, code: CodeObject, report) -> CodeObject:
+        for optimizer in self.passes:
+            code = optimizer.optimize(code)
+            report.rewrites.update(optimizer.last_report.rewrites)
+        
+        return code
@@ -0,0 +1,73 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# report MODULE
+# --------------------------------------------------
+"""
+Optimization reports.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+from collections import Counter
+
+
+# --------------------------------------------------
+# optimization report
+# --------------------------------------------------
+class OptimizationReport:
+    """
+    Summary of what an optimization pass did to one program.
+    """
+
+    def __init__(self, name: str, before: int):
+        self.name = name
+        self.before = before
+        self.after = before
+        self.rewrites = Counter()
+    
+    @property
+    def removed(self) -> int:
+        return self.before - self.after
+    
+    def __str__(self) -> str:
+        line = (f"{self.name}: {self.before} -> {self.after} "
+                f"instructions ({self.removed} removed)")
+        
+        details = ", ".join(
+            f"{name} x{count}"
+            for name, count in sorted(self.rewrites.items())
+            if count
+        )
+
+        if details:
+            line += f" [{details}]"
+        
+        return line
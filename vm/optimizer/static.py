@@ -0,0 +1,259 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# static MODULE
+# --------------------------------------------------
+"""
+Static optimization passes.
+
+Works on the decoded ``(opcode, operands)`` list of a code
+object and repeats until nothing changes:
+
+- jump threading: a jump whose target is an unconditional
+  JUMP goes straight to the final target, and a JUMP to
+  the next instruction is dropped
+- constant folding: ``LOAD_CONST a; LOAD_CONST b; <op>``
+  becomes one LOAD_CONST for pure arithmetic; operations
+  that would raise (e.g. DIV by zero) are left for runtime
+- constant branches: ``LOAD_CONST c; JUMP_IF_*`` becomes a
+  JUMP or falls through
+- dead code elimination: instructions unreachable from the
+  entry point are removed
+
+Jump operands are rewritten to the new indexes.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import operator
+
+from vm.bytecode.code import CodeObject
+from vm.bytecode.instructions import JUMP_OPCODES
+from vm.memory.accounting import result_size
+from .jumps import check_jumps, jump_targets, remap_jumps
+from .report import OptimizationReport
+
+
+_FOLDABLE = {
+    "ADD": operator.add,
+    "SUB": operator.sub,
+    "MUL": operator.mul,
+    "DIV": operator.truediv,
+}
+
+_CONDITIONAL = {
+    "JUMP_IF_TRUE": True,
+    "JUMP_IF_FALSE": False,
+}
+
+# Instructions after which control never falls through
+_NO_FALLTHROUGH = {"JUMP", "HALT", "RETURN_VAL", "TAIL_CALL"}
+
+# Largest folded str / bytes length or int bit length
+_MAX_FOLDED_SIZE = 4096
+
+# Upper bound on pass repetitions
+_MAX_ROUNDS = 16
+
+
+# --------------------------------------------------
+# static optimizer
+# --------------------------------------------------
+class StaticOptimizer:
+    """
+    Constant folding, jump threading and dead-code removal.
+    """
+
+    def __init__(self):
+        self.last_report = None
+    
+    def optimize(self, code: CodeObject) -> CodeObject:
+        """
+        Return an optimized copy of ``code``.
+        """
+        report = OptimizationReport(code.name, len(code))
+        instructions = list(code.instructions)
+        check_jumps(instructions)
+
+        for _ in range(_MAX_ROUNDS):
+            before = list(instructions)
+            instructions = self._thread_jumps(instructions, report)
+            instructions = self._fold(instructions, code.constants,
+                                      report)
+            instructions = self._remove_unreachable(instructions,
+                                                    report)
+            if instructions == before:
+                break
+        
+        report.after = len(instructions)
+        self.last_report = report
+        return code.derive(instructions)
+    
+    # -----------------------------------
+    # passes
+    # -----------------------------------
+
+    def _thread_jumps(self, instructions, report):
+        count = len(instructions)
+        threaded = []
+
+        for opcode, operands in instructions:
+            if opcode in JUMP_OPCODES:
+                target = int(operands[0])
+                seen = set()
+
+                while (0 <= target < count and target not in seen
+                       and instructions[target][0] == "JUMP"):
+                    seen.add(target)
+                    target = int(instructions[target][1][0])
+                
+                if target != int(operands[0]):
+                    report.rewrites["threaded"] += 1
+                operands = [target, *operands[1:]]
+            
+            threaded.append((opcode, operands))
+        
+        # Drop "JUMP <next>" unless it is the last instruction
+        keep = [
+            not (opcode == "JUMP" and operands[0] == index + 1
+                 and index + 1 < count)
+            for index, (opcode, operands) in enumerate(threaded)
+        ]
+        report.rewrites["nop_jump"] += keep.count(False)
+        return self._compact(threaded, keep)
+    
+    def _fold(self, instructions, constants, report):
+        targets = jump_targets(instructions)
+        count = len(instructions)
+        folded = []
+        # Original index each folded entry starts at
+        starts = []
+        mapping = {}
+
+        for index, (opcode, operands) in enumerate(instructions):
+            mapping[index] = len(folded)
+
+            if (opcode in _FOLDABLE and len(folded) >= 2
+                    and index not in targets
+                    and starts[-1] not in targets
+                    and folded[-1][0] == folded[-2][0] == "LOAD_CONST"):
+                a = constants.get(folded[-2][1][0])
+                b = constants.get(folded[-1][1][0])
+                value = self._evaluate(_FOLDABLE[opcode], a, b)
+
+                if value is not _NO_VALUE:
+                    folded[-2:] = [("LOAD_CONST",
+                                    [constants.add(value)])]
+                    starts.pop()
+                    report.rewrites["folded"] += 1
+                    continue
+            
+            if (opcode in _CONDITIONAL and folded
+                    and index not in targets
+                    and starts[-1] not in targets
+                    and folded[-1][0] == "LOAD_CONST"
+                    and index + 1 < count):
+                condition = constants.get(folded[-1][1][0])
+                folded.pop()
+                starts.pop()
+                mapping[index] = len(folded)
+                report.rewrites["const_branch"] += 1
+
+                if bool(condition) is _CONDITIONAL[opcode]:
+                    folded.append(("JUMP", list(operands)))
+                    starts.append(index)
+                continue
+            
+            folded.append((opcode, operands))
+            starts.append(index)
+        
+        return remap_jumps(folded, mapping)
+    
+    def _remove_unreachable(self, instructions, report):
+        count = len(instructions)
+        reachable = [False] * count
+        pending = [0] if count else []
+
+        while pending:
+            index = pending.pop()
+
+            if not 0 <= index < count or reachable[index]:
+                continue
+            
+            reachable[index] = True
+            opcode, operands = instructions[index]
+
+            if opcode in JUMP_OPCODES:
+                pending.append(int(operands[0]))
+            if opcode not in _NO_FALLTHROUGH:
+                pending.append(index + 1)
+        
+        report.rewrites["unreachable"] += reachable.count(False)
+        return self._compact(instructions, reachable)
+    
+    # -----------------------------------
+    # helpers
+    # -----------------------------------
+
+    def _compact(self, instructions, keep):
+        """
+        Drop instructions whose ``keep`` flag is False and
+        remap jumps; a removed index maps to the next kept one.
+        """
+        if all(keep):
+            return instructions
+        
+        kept = []
+        mapping = {}
+
+        for index, instruction in enumerate(instructions):
+            mapping[index] = len(kept)
+
+            if keep[index]:
+                kept.append(instruction)
+        
+        return remap_jumps(kept, mapping)
+    
+    def _evaluate(self, func, a, b):
+        # Sized from the operands, so an oversized result is
+        # never built just to be thrown away
+        size = result_size(func, a, b)
+
+        if size is not None and size > _MAX_FOLDED_SIZE:
+            return _NO_VALUE
+        
+        try:
+            return func(a, b)
+        except Exception:
+            return _NO_VALUE
+
+
+# Marker for "could not fold"
+_NO_VALUE = object()
@@ -39,11 +39,15 @@ implementaions for the VM.
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
-from .stack import OperandStack
-from .frame import Frame
+from .stack import OperandStack, UncheckedStack
+from .frame import UNBOUND, Frame
+from .pool import FramePool
 
 
 __all__ = [
     "OperandStack",
+    "UncheckedStack",
     "Frame",
+    "FramePool",
+    "UNBOUND",
 ]
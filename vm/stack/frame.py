@@ -36,24 +36,116 @@ Execution frame implementation.
 # --------------------------------------------------
 # imports
 # --------------------------------------------------
-from vm.stack import OperandStack
+from vm.stack import OperandStack, UncheckedStack
 from vm.memory import Namespace
 
 
+# Value of a local variable slot that has not been assigned
+UNBOUND = object()
+
+
 # --------------------------------------------------
 # frame
 # --------------------------------------------------
 class Frame:
     """
     Represents a single execution frame.
+
+    Frames can be reset to run other code, which lets the
+    runtime keep a pool of them.
     """
 
-    def __init__(self, instructions, globals_ns, locals_ns=None):
-        self.instructions = instructions
-        self.ip = 0
-        self.stack = OperandStack()
+    __slots__ = (
+        "code",
+        "instructions",
+        "constants",
+        "ip",
+        "stack",
+        "locals",
+        "globals",
+        "fast",
+        "caller",
+    )
+
+    def __init__(self, code, globals_ns, locals_ns=None):
+        self.code = self.stack = None
+        self.reset(code, globals_ns, locals_ns)
+    
+    @classmethod
+    def for_call(cls, code, globals_ns, args: list, caller):
+        """
+        New frame for a function call (see reset_call).
+        """
+        frame = cls.__new__(cls)
+        frame.code = frame.stack = None
+        frame.reset_call(code, globals_ns, args, caller)
+        return frame
+    
+    def reset(self, code, globals_ns, locals_ns=None):
+        """
+        Prepare the frame to run ``code`` from the start,
+        reusing its operand stack when it has the right kind.
+        """
+        self._enter(code)
         self.locals = locals_ns or Namespace(parent=globals_ns)
         self.globals = globals_ns
+        # Module code keeps its variables in the namespace and
+        # has no slots; only function code is slot-resolved
+        self.fast = [UNBOUND] * len(code.varnames)
+        self.caller = None
+    
+    def reset_call(self, code, globals_ns, args: list, caller):
+        """
+        Prepare the frame to run function ``code`` called
+        from ``caller``.
+
+        ``args`` becomes the slot list as is; the remaining
+        locals start unbound. Function frames have no locals
+        namespace of their own.
+        """
+        self._enter(code)
+        self.locals = self.globals = globals_ns
+        missing = len(code.varnames) - len(args)
+
+        if missing:
+            args.extend([UNBOUND] * missing)
+        
+        self.fast = args
+        self.caller = caller
+    
+    def _enter(self, code):
+        """
+        Point the frame at ``code`` with an empty stack,
+        reusing the operand stack when it has the right kind.
+        """
+        if code is self.code:
+            # Re-entering the same code (a pooled frame or a
+            # tail call): the rest is already in place
+            self.ip = 0
+            self.stack.clear()
+            return
+        
+        self.code = code
+        self.instructions = code.instructions
+        # Raw constants list: LOAD_CONST is a list index
+        self.constants = code.constants.values
+        self.ip = 0
+        # Verified code cannot underflow or overflow its stack
+        stack_type = UncheckedStack if code.verified else OperandStack
+
+        if type(self.stack) is stack_type:
+            self.stack.clear()
+        else:
+            self.stack = stack_type()
+    
+    def release(self):
+        """
+        Drop references held by a finished frame so a pooled
+        frame does not keep values alive.
+        """
+        self.stack.clear()
+        self.locals = self.globals = None
+        self.fast = self.caller = None
     
     def next_instruction(self):
         """
@@ -71,3 +163,9 @@ class Frame:
         Set instruction pointer.
         """
         self.ip = target
+    
+    def finish(self):
+        """
+        Move IP past the last instruction, ending the frame.
+        """
+        self.ip = len(self.instructions)
@@ -0,0 +1,107 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# pool MODULE
+# --------------------------------------------------
+"""
+Frame pool.
+
+Finished frames are kept and reset for the next program or
+function call, so calls do not allocate a frame, operand
+stack and slot list each time.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+from config.config import MAX_CALL_DEPTH
+from .frame import Frame
+
+
+# --------------------------------------------------
+# frame pool
+# --------------------------------------------------
+class FramePool:
+    """
+    Free list of reusable frames.
+    """
+
+    __slots__ = ("_free", "limit")
+
+    def __init__(self, limit: int = MAX_CALL_DEPTH):
+        self._free = []
+        # Most frames kept; deeper recursion allocates
+        self.limit = limit
+    
+    def acquire(self, code, globals_ns, locals_ns=None) -> Frame:
+        """
+        Frame ready to run ``code`` as a program.
+        """
+        if self._free:
+            frame = self._free.pop()
+            frame.reset(code, globals_ns, locals_ns)
+            return frame
+        
+        return Frame(code, globals_ns, locals_ns)
+    
+    def acquire_call(self, code, globals_ns, fast: list,
+                     caller) -> Frame:
+        """
+        Frame ready to run function ``code`` with the slot
+        list ``fast`` (arguments first, then UNBOUND).
+        """
+        free = self._free
+
+        if not free:
+            return Frame.for_call(code, globals_ns, fast, caller)
+        
+        frame = free.pop()
+
+        if frame.code is code:
+            # Released frames keep their code and an empty
+            # stack: only the per-call fields are set
+            frame.ip = 0
+            frame.locals = frame.globals = globals_ns
+            frame.fast = fast
+            frame.caller = caller
+        else:
+            frame.reset_call(code, globals_ns, fast, caller)
+        return frame
+    
+    def release(self, frame: Frame):
+        """
+        Take back a finished frame.
+        """
+        frame.release()
+
+        if len(self._free) < self.limit:
+            self._free.append(frame)
+    
+    def __len__(self):
+        return len(self._free)
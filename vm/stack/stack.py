@@ -48,6 +48,8 @@ class OperandStack:
     Stack used for operand storage during execution.
     """
 
+    __slots__ = ("_stack",)
+
     def __init__(self):
         self._stack = []
     
@@ -78,6 +80,19 @@ class OperandStack:
         
         return self._stack[-1]
     
+    def pop_slice(self, count: int) -> list:
+        """
+        Pop the top ``count`` values as a list, bottom first.
+        """
+        if count > len(self._stack):
+            raise StackUnderflowError("Operand stack underflow")
+        if not count:
+            return []
+        
+        values = self._stack[-count:]
+        del self._stack[-count:]
+        return values
+    
     def clear(self):
         """
         Clear the stack.
@@ -86,3 +101,28 @@ class OperandStack:
     
     def __len__(self):
         return len(self._stack)
+    
+    def __iter__(self):
+        return iter(self._stack)
+
+
+# --------------------------------------------------
+# unchecked stack
+# --------------------------------------------------
+class UncheckedStack(OperandStack):
+    """
+    Operand stack for verified code.
+
+    The verifier has proven every push, pop and peek in
+    bounds, so the list methods are bound directly.
+    """
+
+    __slots__ = ("push", "pop")
+
+    def __init__(self):
+        super().__init__()
+        self.push = self._stack.append
+        self.pop = self._stack.pop
+    
+    def peek(self):
+        return self._stack[-1]
@@ -37,9 +37,13 @@ Utility helpers for the VM.
 # imports
 # --------------------------------------------------
 from .debug import debug_log, trace_instruction
+from .hooks import EVENTS, HookRegistry, TraceBuffer
 
 
 __all__ = [
     "debug_log",
     "trace_instruction",
+    "EVENTS",
+    "HookRegistry",
+    "TraceBuffer",
 ]
\ No newline at end of file
@@ -0,0 +1,178 @@
+# --------------------------------------------------
+# -*- Python -*- Compatibility Header
+#
+# Copyright (C) 2023 Developer Jarvis (Pen Name)
+#
+# This file is part of the Python Virtual Machine Library. This library is free
+# software; you can redistribute it and/or modify it under the
+# terms of the GNU General Public License as published by the
+# Free Software Foundation; either version 3, or (at your option)
+# any later version.
+#
+# This program is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the
+# GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with this program. If not, see <https://www.gnu.org/licenses/>.
+#
+# SPDX-License-Identifier: GPL-3.0-or-later
+#
+# Python Virtual Machine - Parse bytecode and execute instructions (custom VM)
+#                       Skills: parsing, bytecode, stack machines, interpreters
+#
+# Author: Developer Jarvis (Pen Name)
+# Contact: https://github.com/DeveloperJarvis
+#
+# --------------------------------------------------
+
+# --------------------------------------------------
+# hooks MODULE
+# --------------------------------------------------
+"""
+Instrumentation hooks.
+
+Callbacks can be registered for four events:
+
+    instruction(frame, ip, opcode, operands)
+    call(frame, ip, opcode, operands)
+    return(frame, ip, opcode, operands)
+    jump(frame, ip, target)
+
+The engine only runs its instrumented loop while at least
+one hook is registered, so uninstrumented execution pays
+nothing for the feature. TraceBuffer is a buffered sink
+that records events and writes them out in batches.
+"""
+# --------------------------------------------------
+# imports
+# --------------------------------------------------
+import sys
+import weakref
+from functools import partial
+from typing import Callable, Dict, List, Optional, TextIO
+
+
+EVENTS = ("instruction", "call", "return", "jump")
+
+
+# --------------------------------------------------
+# hook registry
+# --------------------------------------------------
+class HookRegistry:
+    """
+    Holds the registered callbacks per event.
+    """
+
+    def __init__(self):
+        self._hooks: Dict[str, List[Callable]] = {
+            event: [] for event in EVENTS
+        }
+        self.active = False
+    
+    def register(self, event: str, callback: Callable):
+        """
+        Register a callback for an event.
+        """
+        self._callbacks(event).append(callback)
+        self.active = True
+    
+    def unregister(self, event: str, callback: Callable):
+        """
+        Remove a previously registered callback.
+        """
+        self._callbacks(event).remove(callback)
+        self.active = any(self._hooks.values())
+    
+    def attach(self, sink, events=EVENTS):
+        """
+        Route events to a sink called as sink(event, *args).
+        """
+        for event in events:
+            self.register(event, partial(sink, event))
+    
+    def clear(self):
+        """
+        Remove every callback.
+        """
+        for callbacks in self._hooks.values():
+            callbacks.clear()
+        self.active = False
+    
+    def get(self, event: str) -> List[Callable]:
+        """
+        Callbacks registered for an event.
+        """
+        return self._callbacks(event)
+    
+    def _callbacks(self, event: str) -> List[Callable]:
+        try:
+            return self._hooks[event]
+        except KeyError:
+            raise ValueError(f"Unknown hook event: {event}") from None
+
+
+# --------------------------------------------------
+# trace buffer
+# --------------------------------------------------
+class TraceBuffer:
+    """
+    Buffered event sink.
+
+    Events are stored as tuples and only formatted when the
+    buffer is flushed, either explicitly or when it reaches
+    ``capacity``. Without a stream, events are kept in
+    memory until flushed and are available via ``events``.
+    """
+
+    def __init__(self, stream: Optional[TextIO] = None,
+                 capacity: int = 4096):
+        self.stream = stream
+        self.capacity = capacity
+        self.events = []
+    
+    def __call__(self, event: str, frame, ip, *args):
+        self.events.append((event, ip, len(frame.stack), args))
+
+        if self.stream is not None and \
+                len(self.events) >= self.capacity:
+            self.flush()
+    
+    def flush(self):
+        """
+        Write buffered events to the stream and clear them.
+        """
+        if self.stream is not None:
+            _write_events(self.stream, self.events)
+        self.events.clear()
+    
+    @staticmethod
+    def format(event) -> str:
+        name, ip, depth, args = event
+
+        if name == "jump":
+            return f"[TRACE] IP={ip} | jump -> {args[0]}"
+        
+        opcode, operands = args
+        return (f"[TRACE] IP={ip} | {name} {opcode} {operands} | "
+                f"DEPTH={depth}")
+
+
+def stdout_trace() -> TraceBuffer:
+    """
+    TraceBuffer writing to standard output. Events still
+    buffered are written once the buffer is collected, or
+    at exit.
+    """
+    trace = TraceBuffer(sys.stdout)
+    weakref.finalize(trace, _write_events, trace.stream, trace.events)
+    return trace
+
+
+def _write_events(stream: TextIO, events: list):
+    if events:
+        stream.write("".join(
+            TraceBuffer.format(event) + "\n" for event in events
+        ))
+        stream.flush()